@@ -0,0 +1,255 @@
+# Command line batch runner, no GUI needed
+# Streams beam cases from CSV or JSON lines, solves them in chunks on a process pool
+# and streams one result row per case back out
+#
+# usage: python BatchRunner.py cases.csv -o results.jsonl --processes 8
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import threading
+
+import numpy as np
+
+from BeamSolver import peaks, reactions, supportCodes, _STABLE, FREE, PIN, FIX, DEFLECTION, MOMENT
+
+BC_NAMES = {'free': FREE, 'pin': PIN, 'pinned': PIN, 'fix': FIX, 'fixed': FIX}
+MATERIALS = {'steel': 29000.0, 'wood': 1900.0}
+
+RESULT_FIELDS = ('id', 'maxDeflection', 'maxMoment', 'leftReaction', 'rightReaction',
+                 'leftMoment', 'rightMoment', 'allowable', 'pass', 'error')
+
+
+def readCases(f, fmt):
+    '''
+    Yield one dict per case from an open csv or jsonl file.
+    Fields: L, W, leftBC, rightBC, E or material, I or section, id (optional).
+    A jsonl line that does not parse is passed on as its text, and reported as
+    a bad case in the results.
+    '''
+    if fmt == 'csv':
+        for row in csv.DictReader(f):
+            yield row
+    else:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield line
+
+
+def writeResults(f, fmt, rows):
+    # rows is an iterable of result dicts, written as they arrive
+    if fmt == 'csv':
+        writer = csv.DictWriter(f, RESULT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+    else:
+        for row in rows:
+            f.write(json.dumps(row) + '\n')
+
+
+def _bc(value):
+    value = str(value).strip().lower()
+    return BC_NAMES[value] if value in BC_NAMES else int(value)
+
+
+def _lookupSections(names):
+    # only open the shape catalog if some case refers to a shape by name;
+    # names match regardless of case (W12x26 is W12X26), NaN if unknown
+    from ShapeCatalog import ShapeCatalog
+    catalog = ShapeCatalog()
+    index = dict((str(n).upper(), k) for k, n in enumerate(catalog['name']))
+    return np.array([catalog['Ix'][index[n]] if n in index else np.nan
+                     for n in (str(n).strip().upper() for n in names)])
+
+
+def _case(r):
+    # one raw case dict to (L, W, E, I, leftBC, rightBC), I is NaN for a named section
+    if not isinstance(r, dict):
+        raise ValueError('not a case object: %.40r' % (r,))
+    try:
+        E = float(r['E']) if r.get('E') not in (None, '') else MATERIALS[str(r['material']).strip().lower()]
+    except KeyError:
+        raise ValueError('need E or a material (%s)' % ', '.join(MATERIALS))
+    I = float(r['I']) if r.get('I') not in (None, '') else np.nan
+    if np.isnan(I) and r.get('section') in (None, ''):
+        raise ValueError('need I or a section')
+    left, right = supportCodes(_bc(r['leftBC']), _bc(r['rightBC']))
+    return float(r['L']), float(r['W']), E, I, int(left), int(right)
+
+
+def parseCases(rows):
+    '''
+    Parse a list of raw case dicts into arrays L, W, E, I, leftBC, rightBC, errors.
+    errors holds a message for every case that cannot be solved (missing or non
+    numeric field, unknown support code, material or section) and '' for the
+    others. Bad cases get NaN values and free ends, so the rest can still be
+    solved together.
+    '''
+    n = len(rows)
+    values = np.full((n, 4), np.nan)
+    codes = np.full((n, 2), FREE)
+    errors = np.full(n, '', dtype=object)
+    named = []
+    for k, r in enumerate(rows):
+        try:
+            case = _case(r)
+        except KeyError as e:
+            errors[k] = 'missing field %s' % e
+            continue
+        except (ValueError, TypeError) as e:
+            errors[k] = str(e)
+            continue
+        values[k] = case[:4]
+        codes[k] = case[4:]
+        if np.isnan(case[3]):
+            named.append(k)
+
+    if named:
+        Ix = _lookupSections([rows[k]['section'] for k in named])
+        values[named, 3] = Ix
+        for k, ix in zip(named, Ix):
+            if np.isnan(ix):
+                errors[k] = 'unknown section %r' % rows[k]['section']
+                codes[k] = FREE
+    L, W, E, I = values.T
+    return L, W, E, I, codes[:, 0], codes[:, 1], errors
+
+
+def caseArrays(rows):
+    '''
+    Parse a list of raw case dicts into arrays L, W, E, I, leftBC, rightBC.
+    Raises ValueError naming the first bad case, see parseCases.
+    '''
+    L, W, E, I, left, right, errors = parseCases(rows)
+    for k, error in enumerate(errors):
+        if error:
+            raise ValueError('case %d: %s' % (k, error))
+    return L, W, E, I, left, right
+
+
+def solveChunk(args):
+    '''
+    Solve one chunk of raw case dicts with a single vectorized call.
+    Bad cases do not stop the run, their row has only the id and the error.
+    '''
+    rows, limit = args
+    L, W, E, I, left, right, errors = parseCases(rows)
+
+    with np.errstate(invalid='ignore'):
+        peak = peaks(L, W, E, I, left, right)
+        react = reactions(L, W, left, right)
+        allowable = L / limit
+        ok = _STABLE[left, right] & (peak[:, DEFLECTION] <= allowable)
+
+    out = []
+    for k, r in enumerate(rows):
+        caseid = r.get('id', '') if isinstance(r, dict) else ''
+        if errors[k]:
+            row = dict.fromkeys(RESULT_FIELDS)
+            row.update({'id': caseid, 'pass': False, 'error': errors[k]})
+            out.append(row)
+            continue
+        out.append({'id': caseid,
+                    'maxDeflection': float(peak[k, DEFLECTION]),
+                    'maxMoment': float(peak[k, MOMENT]),
+                    'leftReaction': float(react[k, 0]),
+                    'rightReaction': float(react[k, 1]),
+                    'leftMoment': float(react[k, 2]),
+                    'rightMoment': float(react[k, 3]),
+                    'allowable': float(allowable[k]),
+                    'pass': bool(ok[k]),
+                    'error': ''})
+    return out
+
+
+def chunked(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imapBounded(fn, tasks, processes=None, initializer=None, initargs=()):
+    '''
+    Map fn over an iterable of tasks on a process pool and yield the results in
+    order. At most two tasks per worker are in flight, so memory stays bounded no
+    matter how long the input is. processes=1 runs everything in this process,
+    None one worker per cpu.
+    '''
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for task in tasks:
+            yield fn(task)
+        return
+
+    pool = multiprocessing.Pool(processes, initializer, initargs)
+    inflight = threading.BoundedSemaphore(2 * processes)
+
+    def feed():
+        for task in tasks:
+            inflight.acquire()
+            yield task
+
+    try:
+        for result in pool.imap(fn, feed()):
+            inflight.release()
+            yield result
+    finally:
+        pool.terminate()
+
+
+def runBatch(cases, limit=360.0, chunksize=10000, processes=None):
+    '''
+    Solve an iterable of case dicts and yield result dicts in input order.
+    '''
+    tasks = ((chunk, limit) for chunk in chunked(cases, chunksize))
+    for rows in imapBounded(solveChunk, tasks, processes):
+        for row in rows:
+            yield row
+
+
+def _format(path, fmt):
+    if fmt:
+        return fmt
+    return 'csv' if path and path.endswith('.csv') else 'jsonl'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Solve beam cases without the GUI.')
+    parser.add_argument('input', nargs='?', default='-', help='csv or jsonl file, - for stdin')
+    parser.add_argument('-o', '--output', default='-', help='output file, - for stdout')
+    parser.add_argument('--input-format', choices=('csv', 'jsonl'))
+    parser.add_argument('--output-format', choices=('csv', 'jsonl'))
+    parser.add_argument('--limit', type=float, default=360.0, help='deflection limit L/limit')
+    parser.add_argument('--chunksize', type=int, default=10000)
+    parser.add_argument('--processes', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    fin = sys.stdin if args.input == '-' else open(args.input, newline='')
+    fout = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        cases = readCases(fin, _format(args.input, args.input_format))
+        results = runBatch(cases, args.limit, args.chunksize, args.processes)
+        writeResults(fout, _format(args.output, args.output_format), results)
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+
+
+if __name__ == '__main__':
+    main()
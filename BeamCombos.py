@@ -0,0 +1,121 @@
+# Load combinations on a single span
+# Every basic load case (dead, live, snow, wind, ...) is solved once, every factored
+# combination and the max/min envelope then come from one factors x basis product
+
+import numpy as np
+
+from BeamLoads import LoadSet, solveLoads
+
+# LRFD strength combinations (ASCE 7), "or" terms are split into separate rows
+# W is taken in the direction that adds to gravity, add a second wind case for uplift
+ASCE7_LRFD = (
+    ('1.4D', {'D': 1.4}),
+    ('1.2D+1.6L+0.5Lr', {'D': 1.2, 'L': 1.6, 'Lr': 0.5}),
+    ('1.2D+1.6L+0.5S', {'D': 1.2, 'L': 1.6, 'S': 0.5}),
+    ('1.2D+1.6Lr+L', {'D': 1.2, 'Lr': 1.6, 'L': 1.0}),
+    ('1.2D+1.6Lr+0.5W', {'D': 1.2, 'Lr': 1.6, 'W': 0.5}),
+    ('1.2D+1.6S+L', {'D': 1.2, 'S': 1.6, 'L': 1.0}),
+    ('1.2D+1.6S+0.5W', {'D': 1.2, 'S': 1.6, 'W': 0.5}),
+    ('1.2D+W+L+0.5Lr', {'D': 1.2, 'W': 1.0, 'L': 1.0, 'Lr': 0.5}),
+    ('1.2D+W+L+0.5S', {'D': 1.2, 'W': 1.0, 'L': 1.0, 'S': 0.5}),
+    ('0.9D+W', {'D': 0.9, 'W': 1.0}),
+)
+
+
+class LoadCombinations(object):
+    '''
+    variables:
+    self.cases          basic load case names, in order
+    self.loads          LoadSet (or uniform load value) of every case
+    self.names          combination names, in order
+    self.table          {case: factor} of every combination
+    methods:
+    def __init__ (self, table)                  table: sequence of (name, {case: factor})
+    def addCase (self, name, loads)             LoadSet, or a number for a full length uniform load
+    def addCombination (self, name, factors)    factors: {case: factor}
+    def factors (self)                          (combinations, cases) factor matrix
+    def solve (self, L, E, I, leftBC, rightBC, n)   returns a CombinationResult
+    Cases that a combination refers to but that were never added count as zero.
+    solve raises ValueError while there are no cases or no combinations.
+    '''
+
+    def __init__(self, table=ASCE7_LRFD):
+        self.cases = []
+        self.loads = {}
+        self.names = []
+        self.table = {}
+        for name, factors in table:
+            self.addCombination(name, factors)
+
+    def addCase(self, name, loads):
+        if name not in self.loads:
+            self.cases.append(name)
+        self.loads[name] = loads
+
+    def addCombination(self, name, factors):
+        if name not in self.table:
+            self.names.append(name)
+        self.table[name] = dict(factors)
+
+    def factors(self):
+        F = np.zeros((len(self.names), len(self.cases)))
+        for i, name in enumerate(self.names):
+            for j, case in enumerate(self.cases):
+                F[i, j] = self.table[name].get(case, 0.0)
+        return F
+
+    def solve(self, L, E, I, leftBC, rightBC, n=50):
+        if not self.cases:
+            raise ValueError('no load cases to combine, add one with addCase first')
+        if not self.names:
+            raise ValueError('no load combinations, add one with addCombination first')
+        sets = []
+        for case in self.cases:
+            loads = self.loads[case]
+            if not isinstance(loads, LoadSet):
+                W = loads
+                loads = LoadSet()
+                loads.addUniformLoad(W, L)
+            sets.append(loads)
+
+        # common stations: an even grid plus the load positions of every case
+        a = np.concatenate([np.zeros(0)] + [s.a for s in sets])
+        x = np.unique(np.concatenate((np.linspace(0.0, L, n), a[(a > 0.0) & (a < L)])))
+
+        # basis: (cases, 4, stations), one solve per basic load case
+        basis = np.array([[r.deflection, r.rotation, r.shear, r.moment]
+                          for r in (solveLoads(L, E, I, leftBC, rightBC, s, x=x) for s in sets)])
+        basis = basis.reshape(len(sets), 4, len(x))
+        return CombinationResult(x, basis, self.factors(), list(self.names))
+
+
+class CombinationResult(object):
+    '''
+    variables:
+    self.x              stations
+    self.basis          response of every basic case, (cases, 4, len(x))
+    self.combos         response of every combination, (combinations, 4, len(x))
+    self.lo, self.hi    envelope of (deflection, rotation, shear, moment), each (4, len(x))
+    self.governlo       index of the combination that gives lo at each station, (4, len(x))
+    self.governhi       index of the combination that gives hi at each station, (4, len(x))
+    self.names          combination names
+    methods:
+    def governing (self, output)        names of the combinations giving the largest
+                                        absolute value of output at each station
+    '''
+
+    def __init__(self, x, basis, factors, names):
+        self.x = x
+        self.basis = basis
+        self.names = names
+        ncase = basis.shape[0]
+        # every combination at every station and output in one matrix product
+        self.combos = (factors @ basis.reshape(ncase, -1)).reshape((len(factors),) + basis.shape[1:])
+        self.governlo = self.combos.argmin(axis=0)
+        self.governhi = self.combos.argmax(axis=0)
+        self.lo = np.take_along_axis(self.combos, self.governlo[None], axis=0)[0]
+        self.hi = np.take_along_axis(self.combos, self.governhi[None], axis=0)[0]
+
+    def governing(self, output):
+        k = np.where(-self.lo[output] > self.hi[output], self.governlo[output], self.governhi[output])
+        return [self.names[i] for i in k]
@@ -0,0 +1,264 @@
+# Finite element solver for continuous beams with any number of spans
+# Euler-Bernoulli beam elements, banded global stiffness matrix
+
+import functools
+
+import numpy as np
+
+from BeamSolver import BeamResponses, FREE, FIX
+
+# half bandwidth of the global stiffness matrix (2 dofs per node, 4 per element)
+BAND = 3
+
+# in/s^2, turns a load in kip/in into a mass per unit length in kip s^2/in^2
+GRAVITY = 386.09
+
+# below this many free dofs the eigenproblem is solved dense
+DENSE_MODES = 200
+
+# relative accuracy of the eigenvalues from the Lanczos solve; far below the
+# discretization error, while the default (machine precision) costs about half
+# again as many iterations when many spans give closely spaced frequencies
+EIGEN_TOL = 1e-10
+
+# most elements per span: the condition number of the stiffness matrix grows as
+# nel^4, so finer meshes lose accuracy (about 1e-6 at 1000, 1e-3 at 5000) while
+# the cubic elements are already exact at the nodes for a uniform load
+MAX_NEL = 500
+
+
+class ContinuousBeam(object):
+    '''
+    variables:
+    self.spans          span lengths, left to right
+    self.supports       support code at each span end (len(spans) + 1 codes, 0 free / 1 pin / 2 fix)
+    self.W              uniform load, scalar or one value per span
+    self.E              modulus of elasticity, scalar or one value per span
+    self.I              moment of inertia, scalar or one value per span
+    self.nel            number of elements per span
+    self.reactions      (force, moment) at each support after solve()
+    methods:
+    def __init__ (self, spans, supports, W, E, I, nel)
+    def solve (self)                    returns BeamResponses at both ends of every element
+    def modes (self, nmodes, mass)      natural frequencies and mode shapes
+    def supportPositions (self)         list of (x, code) for plotting
+    nel is limited to 1..MAX_NEL, anything finer only adds roundoff.
+    '''
+
+    def __init__(self, spans, supports, W=1.0, E=29000.0, I=100.0, nel=20):
+        self.spans = np.atleast_1d(np.asarray(spans, dtype=float))
+        self.supports = np.asarray(supports, dtype=int)
+        if len(self.supports) != len(self.spans) + 1:
+            raise ValueError('need one support code per span end')
+        self.W = W
+        self.E = E
+        self.I = I
+        self.nel = int(nel)
+        if not 1 <= self.nel <= MAX_NEL:
+            raise ValueError('nel must be between 1 and %d, got %r' % (MAX_NEL, nel))
+        self.reactions = None
+
+    def supportPositions(self):
+        xs = np.concatenate(([0.0], np.cumsum(self.spans)))
+        return [(x, bc) for x, bc in zip(xs, self.supports) if bc != FREE]
+
+    def _elements(self, value):
+        # per span value (scalar or one per span) repeated for every element
+        return np.repeat(np.broadcast_to(np.asarray(value, dtype=float), self.spans.shape), self.nel)
+
+    def _checkStable(self):
+        # the beam is a mechanism (zero stiffness rigid body mode) unless one end
+        # is fixed or at least two points are supported; roundoff can keep the
+        # singular matrix factorizable, so this is not left to the solver
+        if not ((self.supports == FIX).any() or (self.supports != FREE).sum() >= 2):
+            raise ValueError('unstable support configuration')
+
+    def _fixedDofs(self):
+        # support nodes sit at the span ends
+        nodes = np.arange(len(self.spans) + 1) * self.nel
+        return np.concatenate((2 * nodes[self.supports != FREE],
+                               2 * nodes[self.supports == FIX] + 1))
+
+    def solve(self):
+        self._checkStable()
+        ns = len(self.spans)
+        nel = self.nel
+
+        # element properties, every span is split into nel equal elements
+        le = np.repeat(self.spans / nel, nel)
+        EI = self._elements(self.E) * self._elements(self.I)
+        w = self._elements(self.W)
+        ne = len(le)
+        ndof = 2 * (ne + 1)
+
+        k = _elementStiffness(EI, le)
+        fe = _elementLoads(w, le)
+
+        # assemble upper banded storage: a[i, j] lives in ab[BAND + i - j, j]
+        first = 2 * np.arange(ne)
+        ab = np.zeros((BAND + 1, ndof))
+        for i in range(4):
+            for j in range(i, 4):
+                ab[BAND + i - j, first + j] += k[:, i, j]
+        F = np.zeros(ndof)
+        for i in range(4):
+            F += np.bincount(first + i, weights=fe[:, i], minlength=ndof)
+
+        nodes = np.arange(ns + 1) * nel
+        fixed = self._fixedDofs()
+
+        # enforce the supports by replacing their rows/columns with identity
+        K = ab.copy()
+        R = F.copy()
+        K[:, fixed] = 0.0
+        for m in range(1, BAND + 1):
+            cols = fixed + m
+            cols = cols[cols < ndof]
+            K[BAND - m, cols] = 0.0
+        K[BAND, fixed] = 1.0
+        R[fixed] = 0.0
+
+        # scipy is only needed once something is actually solved
+        from scipy.linalg import solveh_banded, LinAlgError
+        try:
+            d = solveh_banded(K, R)
+        except LinAlgError:
+            raise ValueError('unstable support configuration')
+
+        # reactions from the unconstrained stiffness
+        r = _bandedMatvec(ab, d) - F
+        self.reactions = np.zeros((ns + 1, 2))
+        self.reactions[:, 0] = np.where(self.supports != FREE, r[2 * nodes], 0.0)
+        self.reactions[:, 1] = np.where(self.supports == FIX, r[2 * nodes + 1], 0.0)
+
+        # element end forces give shear and moment at both ends of every element
+        de = d[first[:, None] + np.arange(4)]
+        f = np.einsum('eij,ej->ei', k, de) - fe
+        xn = np.concatenate(([0.0], np.cumsum(le)))
+
+        x = np.column_stack((xn[:-1], xn[1:])).ravel()
+        defl = np.column_stack((de[:, 0], de[:, 2])).ravel()
+        rot = np.column_stack((de[:, 1], de[:, 3])).ravel()
+        shear = np.column_stack((f[:, 0], -f[:, 2])).ravel()
+        moment = np.column_stack((-f[:, 1], f[:, 3])).ravel()
+        return BeamResponses(x, defl, rot, shear, moment)
+
+    def modes(self, nmodes=5, mass=None):
+        '''
+        First nmodes natural frequencies (Hz) and mode shapes of the free vibration
+        K phi = omega^2 M phi, with consistent element mass matrices. mass is the
+        mass per unit length, scalar or one per span, by default the load W / GRAVITY.
+        Returns (frequencies, x, shapes): shapes (nmodes, nodes) are the nodal
+        deflections, scaled so the largest one is +1.
+        Large models use a shift-invert Lanczos solve, inverting K with one banded
+        Cholesky factorization, so the cost grows linearly with the number of elements.
+        '''
+        le = np.repeat(self.spans / self.nel, self.nel)
+        EI = self._elements(self.E) * self._elements(self.I)
+        m = self._elements(np.abs(self.W) / GRAVITY if mass is None else mass)
+        if not (m > 0.0).all():
+            raise ValueError('modal analysis needs a positive mass')
+        self._checkStable()
+        ne = len(le)
+        ndof = 2 * (ne + 1)
+
+        from scipy import sparse
+        from scipy.linalg import eigh, cholesky_banded, get_lapack_funcs
+        from scipy.sparse.linalg import eigsh, LinearOperator
+
+        # assemble both matrices in sparse form, then drop the supported dofs
+        dofs = 2 * np.arange(ne)[:, None] + np.arange(4)
+        rows = np.broadcast_to(dofs[:, :, None], (ne, 4, 4)).ravel()
+        cols = np.broadcast_to(dofs[:, None, :], (ne, 4, 4)).ravel()
+        free = np.setdiff1d(np.arange(ndof), self._fixedDofs())
+        K = sparse.csc_matrix((_elementStiffness(EI, le).ravel(), (rows, cols)), (ndof, ndof))
+        M = sparse.csc_matrix((_elementMass(m, le).ravel(), (rows, cols)), (ndof, ndof))
+        K = K[free][:, free]
+        M = M[free][:, free]
+
+        nmodes = min(nmodes, len(free))
+        if len(free) <= max(DENSE_MODES, 2 * nmodes + 1):
+            # solved inverted, M phi = K phi / omega^2 for the largest 1 / omega^2,
+            # like the shift-invert below: the lowest eigenvalues of (K, M) would
+            # carry an error of roundoff times the condition number of K
+            n = len(free)
+            mu, phi = eigh(M.toarray(), K.toarray(), subset_by_index=(n - nmodes, n - 1))
+            omega2 = 1.0 / mu[::-1]
+            phi = phi[:, ::-1]
+        else:
+            # removing dofs keeps K banded: factor it once in upper banded storage
+            # and let every shift-invert step be two banded triangular solves
+            # (SuperLU's fill reducing ordering makes them several times slower)
+            ab = np.zeros((BAND + 1, len(free)))
+            for j in range(BAND + 1):
+                ab[BAND - j, j:] = K.diagonal(j)
+            U = cholesky_banded(ab)
+            pbtrs, = get_lapack_funcs(('pbtrs',), (U,))
+            Kinv = LinearOperator(K.shape, matvec=lambda b: pbtrs(U, b)[0], dtype=float)
+            omega2, phi = eigsh(K, nmodes, M.tocsr(), sigma=0.0, which='LM', OPinv=Kinv, tol=EIGEN_TOL)
+            order = np.argsort(omega2)
+            omega2 = omega2[order]
+            phi = phi[:, order]
+
+        d = np.zeros((ndof, nmodes))
+        d[free] = phi
+        shapes = d[0::2].T
+        peak = shapes[np.arange(nmodes), np.abs(shapes).argmax(axis=1)]
+        shapes = shapes / peak[:, None]
+        x = np.concatenate(([0.0], np.cumsum(le)))
+        return np.sqrt(omega2) / (2 * np.pi), x, shapes
+
+
+@functools.lru_cache(maxsize=32)
+def spanModes(L, W, E, I, leftBC, rightBC, nmodes=3, nel=40):
+    '''
+    ContinuousBeam.modes of a single span, memoized like BeamSolver.cachedSolve
+    so the canvas can switch back and forth without solving again.
+    The arrays are shared between callers and read-only.
+    '''
+    result = ContinuousBeam([L], [leftBC, rightBC], W, E, I, nel).modes(nmodes)
+    for a in result:
+        a.setflags(write=False)
+    return result
+
+
+def _elementStiffness(EI, le):
+    # standard 4x4 beam element stiffness for dofs (v1, t1, v2, t2)
+    c = EI / le**3
+    l = le
+    l2 = le * le
+    k = np.empty((len(le), 4, 4))
+    k[:, 0] = np.column_stack((12 * c, 6 * l * c, -12 * c, 6 * l * c))
+    k[:, 1] = np.column_stack((6 * l * c, 4 * l2 * c, -6 * l * c, 2 * l2 * c))
+    k[:, 2] = np.column_stack((-12 * c, -6 * l * c, 12 * c, -6 * l * c))
+    k[:, 3] = np.column_stack((6 * l * c, 2 * l2 * c, -6 * l * c, 4 * l2 * c))
+    return k
+
+
+def _elementMass(m, le):
+    # consistent 4x4 mass matrix for dofs (v1, t1, v2, t2), m = mass per unit length
+    c = m * le / 420.0
+    l = le
+    l2 = le * le
+    M = np.empty((len(le), 4, 4))
+    M[:, 0] = np.column_stack((156 * c, 22 * l * c, 54 * c, -13 * l * c))
+    M[:, 1] = np.column_stack((22 * l * c, 4 * l2 * c, 13 * l * c, -3 * l2 * c))
+    M[:, 2] = np.column_stack((54 * c, 13 * l * c, 156 * c, -22 * l * c))
+    M[:, 3] = np.column_stack((-13 * l * c, -3 * l2 * c, -22 * l * c, 4 * l2 * c))
+    return M
+
+
+def _elementLoads(w, le):
+    # consistent nodal loads for a downward uniform load w
+    wl = w * le
+    return np.column_stack((-wl / 2, -wl * le / 12, -wl / 2, wl * le / 12))
+
+
+def _bandedMatvec(ab, d):
+    # K @ d for a symmetric matrix in upper banded storage
+    y = ab[BAND] * d
+    for m in range(1, BAND + 1):
+        a = ab[BAND - m, m:]
+        y[:-m] += a * d[m:]
+        y[m:] += a * d[:-m]
+    return y
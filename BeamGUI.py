@@ -0,0 +1,1280 @@
+# embedding_in_qt5.py --- Simple Qt5 application embedding matplotlib canvases
+#
+# Copyright (C) 2005 Florent Rougon
+#               2006 Darren Dale
+#               2015 Jens H Nielsen
+# Modified by Peter Mackenzie-Helnwein on Dec 6, 2018
+#
+# This file is an example program for matplotlib. It may be used and
+# modified with no restriction; raw copies as well as modified versions
+# may be distributed without limitation.
+
+# MODIFIED BY YASHAR ZAFARI FOR CESG 505 FINAL
+
+import os
+import sys
+import concurrent.futures
+import numpy as np
+
+from PyQt5.QtWidgets import QMainWindow, QWidget, QMenu, \
+                            QVBoxLayout, QHBoxLayout, QLabel, \
+                            QSizePolicy, QPushButton, QMessageBox, QComboBox,\
+                            QButtonGroup, QCheckBox, QDialog, QDoubleSpinBox, \
+                            QFileDialog, QInputDialog
+
+from PyQt5 import QtCore
+from PyQt5.QtCore import Qt
+import matplotlib
+# Make sure that we are using QT5
+matplotlib.use('Qt5Agg')
+
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from BeamSolver import cachedSolve, STABLE_CASES, OUTPUTS, MODES
+from BeamFEM import spanModes
+from ResultStore import ResultStore
+from BeamReliability import ReliabilityModel, runReliability, Normal, Lognormal
+from FigureExport import supportGlyphs, FORMATS
+from BeamSweep import sweepPeaks, sweepEnvelope
+from BeamNonPrismatic import solveNonPrismatic, taper
+from SectionProperties import namedSection
+from SectionGeometry import sectionProperties, parseSection
+from ShapeCatalog import ShapeCatalog
+from Profiling import PhaseTimer
+
+
+## define a systemplot class
+
+class MyBeamMplCanvas(FigureCanvas):
+    """Simple canvas with a sine plot."""
+
+    # parameters accepted by configure
+    PARAMS = ('L', 'W', 'E', 'I', 'leftBC', 'rightBC', 'output')
+
+    # emitted from the worker thread: (generation, BeamResponses, supports)
+    solveFinished = QtCore.pyqtSignal(int, object, object)
+    # emitted from the worker thread: (sweep key, sweep data or the ValueError it raised)
+    sweepFinished = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, parent=None, **kwargs):
+        self.L = 1.0
+        self.leftBC = 1
+        self.rightBC = 1
+        self.W = 1.0
+        self.E = 29000.0
+        self.I = 100.0
+        self.output = 0
+        # plotting tolerance of the adaptive stations, relative to the peak value
+        self.tol = 1e-3
+
+        # externally solved results (e.g. a ContinuousBeam) shown instead of the closed form
+        self.responses = None
+        self.supports = None
+        # parametric sweep shown on axes2 instead of the response, see setSweep
+        self.sweep = None
+        self._sweepData = None
+        # bumped by setSweep, part of the key of the sweep data
+        self._sweepSerial = 0
+        # key of the sweep being solved on the worker thread
+        self._sweepPending = None
+
+        self.fig = Figure()
+        self.axes = self.fig.add_subplot(211)
+        self.axes2 = self.fig.add_subplot(212, sharex = self.axes)
+
+        FigureCanvas.__init__(self, self.fig)
+        self.setParent(parent)
+
+        FigureCanvas.setSizePolicy(self,
+                                   QSizePolicy.Expanding,
+                                   QSizePolicy.Expanding)
+        FigureCanvas.updateGeometry(self)
+
+        # persistent artists, refresh only updates their data
+        self.beamline, = self.axes.plot([], [], '-k')
+        self.supportline, = self.axes.plot([], [], '-b')
+        # the response line is animated so it can be blitted over a cached background
+        self.responseline, = self.axes2.plot([], [], '-r', animated=True)
+        # lower and upper envelope of a one parameter sweep, nan separated
+        self.envelopeline, = self.axes2.plot([], [], '-r', visible=False)
+        # the heat map of a two parameter sweep gets its own axes in the slot
+        # of axes2 (which shares x with the beam), built on first use
+        self.sweepaxes = None
+        # mode shapes, one line per mode
+        self.nmodes = 3
+        self.modelines = [self.axes2.plot([], [], visible=False)[0] for k in range(self.nmodes)]
+        # ContinuousBeam behind external responses, for their mode shapes
+        self.modalBeam = None
+        self._view = 'response'
+        self.axes.axis('equal')
+
+        self._geometry = None
+        self._background = None
+        # per-phase timings (solve, artists, blit, draw), off unless switched on
+        self.timer = PhaseTimer()
+        self.mpl_connect('draw_event', self._onDraw)
+
+        self._refreshTimer = QtCore.QTimer(self)
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.setInterval(0)
+        self._refreshTimer.timeout.connect(self.refresh)
+
+        # heavy solves run on one worker thread so the GUI thread only renders
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._generation = 0
+        self._job = None
+        self.solveFinished.connect(self._onSolveFinished)
+        self.sweepFinished.connect(self._onSweepFinished)
+
+        self.scheduleRefresh()
+
+    def setLength(self, L):
+        self.L = L
+        self._beamChanged()
+        self.scheduleRefresh()
+
+    def setE(self, E):
+        self.E = E
+        self._beamChanged()
+        self.scheduleRefresh()
+
+    def setW(self, W):
+        self.W = W
+        self._beamChanged()
+        self.scheduleRefresh()
+
+    def setI(self, I):
+        self.I = I
+        self._beamChanged()
+        self.scheduleRefresh()
+
+    def setLBC(self, l):
+        self.leftBC = l
+        self._beamChanged()
+        self.scheduleRefresh()
+
+    def setRBC(self, l):
+        self.rightBC = l
+        self._beamChanged()
+        self.scheduleRefresh()
+
+    def setOutput(self, o):
+        self.output = o
+        self.scheduleRefresh()
+
+    def configure(self, **params):
+        # bulk setter, e.g. configure(L=10., W=1.0, leftBC=2), redraws only once
+        for name in params:
+            if name not in self.PARAMS:
+                raise TypeError('unknown beam parameter: %s' % name)
+        for name, value in params.items():
+            setattr(self, name, value)
+        if set(params) - set(['output']):
+            self._beamChanged()
+        self.scheduleRefresh()
+
+    def setResponses(self, res, supports=None, beam=None):
+        # plot already solved BeamResponses, supports is a list of (x, code)
+        # beam is the ContinuousBeam they came from, if its modes should be shown
+        # changing any beam parameter goes back to the closed-form solution
+        self.responses = res
+        self.supports = supports
+        self.modalBeam = beam
+        if self.sweep is not None:
+            self.setSweep(None)
+        self.scheduleRefresh()
+
+    def setSweep(self, sweeps, section=None):
+        # sweeps is a list of one or two (name, values), see BeamSweep.sweepParameters
+        # one parameter plots the response envelope, two a heat map of the peak
+        # response; the other parameters follow the beam, None leaves sweep mode
+        self.sweep = (list(sweeps), section) if sweeps else None
+        self._sweepData = None
+        self._sweepSerial += 1
+        self._background = None
+        self.scheduleRefresh()
+
+    def submitSolve(self, fn, *args, **kwargs):
+        # run fn(*args) on the worker thread, fn must return BeamResponses
+        # the result is posted back through solveFinished and plotted with
+        # setResponses, unless a newer job or a parameter change superseded it
+        supports = kwargs.pop('supports', None)
+        self._generation += 1
+        generation = self._generation
+        if self._job is not None:
+            self._job.cancel()
+
+        def run():
+            if generation != self._generation:
+                return
+            res = fn(*args, **kwargs)
+            self.solveFinished.emit(generation, res, supports)
+
+        self._job = self._executor.submit(run)
+        return self._job
+
+    def _onSolveFinished(self, generation, res, supports):
+        # runs on the GUI thread, stale results are dropped
+        if generation == self._generation:
+            self._job = None
+            self.setResponses(res, supports)
+
+    def _submitSweep(self, key, base, sweeps, section):
+        # solve the sweep grid on the worker thread, like submitSolve; the result
+        # comes back through sweepFinished and is kept if nothing superseded it
+        if key == self._sweepPending:
+            return
+        self._sweepPending = key
+        fn = sweepEnvelope if len(sweeps) == 1 else sweepPeaks
+
+        def run():
+            if key != self._sweepPending:
+                return
+            try:
+                data = fn(base, sweeps, section)
+            except ValueError as e:
+                data = e
+            self.sweepFinished.emit(key, data)
+
+        self._executor.submit(run)
+
+    def _onSweepFinished(self, key, data):
+        # runs on the GUI thread, results for an older beam or sweep are dropped
+        if key != self._sweepPending:
+            return
+        self._sweepPending = None
+        if isinstance(data, ValueError):
+            self.axes2.set_title(str(data), fontsize='small')
+            self.draw_idle()
+            return
+        self._sweepData = (key, data)
+        self.scheduleRefresh()
+
+    def _beamChanged(self):
+        # a new beam makes external results and any queued background solve stale
+        self.responses = None
+        self._generation += 1
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+
+    def scheduleRefresh(self):
+        # coalesce bursts of setter calls (e.g. a held spin box arrow) into a
+        # single refresh on the next pass through the event loop
+        if not self._refreshTimer.isActive():
+            self._refreshTimer.start()
+
+    def flushRefresh(self):
+        # run a pending refresh right away
+        if self._refreshTimer.isActive():
+            self._refreshTimer.stop()
+            self.refresh()
+
+    def refresh(self):
+        if self.output == MODES:
+            with self.timer.phase('modes'):
+                self._updateGeometry()
+                self._refreshModes()
+            self.draw_idle()
+            return
+        if self.sweep is not None:
+            with self.timer.phase('sweep'):
+                self._updateGeometry()
+                self._refreshSweep()
+            self.draw_idle()
+            return
+        if self._view != 'response':
+            # just left sweep or modes
+            self._setView('response')
+
+        # plot the selected response from the headless solver
+        with self.timer.phase('solve'):
+            res = self.responses
+            if res is None:
+                # all four outputs are solved together and cached, adaptive stations
+                # always include the exact extrema so peaks are not clipped
+                res = cachedSolve(self.L, self.W, self.E, self.I, self.leftBC, self.rightBC, self.tol)
+
+        with self.timer.phase('artists'):
+            # only rebuild the beam and support glyphs when the geometry changed
+            full = self._updateGeometry()
+            x = res.x
+            y = res[self.output]
+            self.responseline.set_data(x, y)
+            full = self._updateLimits(y) or full
+
+        if full or self._background is None:
+            # limits or static artists changed, the cached background is stale
+            self.draw_idle()
+        else:
+            with self.timer.phase('blit'):
+                self.restore_region(self._background)
+                self.axes2.draw_artist(self.responseline)
+                self.blit(self.fig.bbox)
+
+    def _setView(self, view):
+        # switch axes2 between 'response', 'envelope', 'heatmap' and 'modes'
+        self._view = view
+        self.responseline.set_visible(view == 'response')
+        self.envelopeline.set_visible(view == 'envelope')
+        for line in self.modelines:
+            line.set_visible(view == 'modes')
+        self.axes2.set_visible(view != 'heatmap')
+        if self.sweepaxes is not None:
+            self.sweepaxes.set_visible(view == 'heatmap')
+            self.sweepbar.ax.set_visible(view == 'heatmap')
+        self.axes2.set_title('')
+        self._background = None
+        if view != 'envelope':
+            # the envelope may have widened the shared x range, rebuild the geometry
+            self._geometry = None
+            self.axes.set_autoscalex_on(True)
+
+    def _refreshModes(self):
+        if self._view != 'modes':
+            self._setView('modes')
+        try:
+            if self.responses is None:
+                freqs, x, shapes = spanModes(float(self.L), float(self.W), float(self.E),
+                                             float(self.I), int(self.leftBC), int(self.rightBC),
+                                             self.nmodes)
+            elif self.modalBeam is not None:
+                freqs, x, shapes = self.modalBeam.modes(self.nmodes)
+            else:
+                raise ValueError('no beam model for these results')
+        except ValueError as e:
+            # unstable supports or no mass: nothing to plot
+            freqs, x, shapes = [], [], []
+            self.axes2.set_title(str(e), fontsize='small')
+        for k, line in enumerate(self.modelines):
+            line.set_visible(k < len(freqs))
+            if k < len(freqs):
+                line.set_data(x, shapes[k])
+        if len(freqs):
+            self.axes2.set_title('mode shapes, f = ' + ', '.join('%.3g' % fk for fk in freqs) + ' Hz',
+                                 fontsize='small')
+        self.axes2.set_ylim(-1.1, 1.1)
+
+    def _refreshSweep(self):
+        sweeps, section = self.sweep
+        one = len(sweeps) == 1
+        if one and self._view != 'envelope':
+            self._setView('envelope')
+        elif not one and self.sweepaxes is not None and self._view != 'heatmap':
+            self._setView('heatmap')
+
+        # the grid is only recomputed when the beam or the sweep changed, on the
+        # worker thread; until it arrives the previous grid of this sweep stays up
+        base = dict((k, getattr(self, k)) for k in ('L', 'W', 'E', 'I', 'leftBC', 'rightBC'))
+        key = (self._sweepSerial, tuple(sorted(base.items())))
+        if self._sweepData is None or self._sweepData[0] != key:
+            self._submitSweep(key, base, sweeps, section)
+            if self._sweepData is None:
+                self.axes2.set_title('solving sweep...', fontsize='small')
+                return
+        data = self._sweepData[1]
+        name = OUTPUTS[self.output]
+
+        if one:
+            x, lo, hi = data
+            lo = lo[self.output]
+            hi = hi[self.output]
+            self.envelopeline.set_data(np.concatenate((x, [np.nan], x)),
+                                       np.concatenate((lo, [np.nan], hi)))
+            values = sweeps[0][1]
+            self.axes2.set_title('%s envelope, %s = %g to %g' % (name, sweeps[0][0], np.min(values),
+                                                                 np.max(values)), fontsize='small')
+            self._updateLimits(np.concatenate((lo, hi)))
+            # show the longest swept span, the beam above shares this x range
+            self.axes2.set_xlim(-0.05 * x[-1], 1.05 * x[-1])
+            return
+
+        if self.sweepaxes is None:
+            self.sweepaxes = self.fig.add_axes(self.axes2.get_position())
+            self.sweepimage = self.sweepaxes.imshow(np.zeros((2, 2)), origin='lower', aspect='auto')
+            self.sweepbar = self.fig.colorbar(self.sweepimage, ax=self.sweepaxes)
+            self._setView('heatmap')
+        v0, v1 = data.values
+        z = data.peaks[..., self.output].T
+        self.sweepimage.set_data(z)
+        self.sweepimage.set_extent((v0[0], v0[-1], v1[0], v1[-1]))
+        self.sweepimage.set_clim(z.min(), z.max())
+        self.sweepaxes.set_xlabel(data.names[0])
+        self.sweepaxes.set_ylabel(data.names[1])
+        self.sweepbar.set_label('max |%s|' % name)
+
+    def draw(self):
+        # full redraws happen later on the event loop, time them here
+        with self.timer.phase('draw'):
+            FigureCanvas.draw(self)
+
+    def cacheInfo(self):
+        # hits, misses, maxsize and currsize of the shared result cache
+        return cachedSolve.cache_info()
+
+    def saveFigure(self, fname):
+        self.flushRefresh()
+        # animated artists are skipped by savefig, so switch it off while saving
+        self.responseline.set_animated(False)
+        try:
+            self.fig.savefig(fname)
+        finally:
+            self.responseline.set_animated(True)
+
+    def _onDraw(self, event):
+        # cache everything but the response line, then put the line back on top
+        # savefig to svg/pdf draws through a different canvas, nothing to cache then
+        if event.canvas is not self:
+            return
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        self.axes2.draw_artist(self.responseline)
+
+    def _updateGeometry(self):
+        if self.responses is None:
+            x0, x1 = 0.0, self.L
+            supports = []
+            if (self.leftBC, self.rightBC) in STABLE_CASES:
+                supports = [(0.0, self.leftBC), (self.L, self.rightBC)]
+        else:
+            x0, x1 = self.responses.x.min(), self.responses.x.max()
+            supports = list(self.supports or [])
+
+        geometry = (x0, x1, tuple(supports))
+        if geometry == self._geometry:
+            return False
+        self._geometry = geometry
+
+        d = (x1 - x0) / 20. / max(len(supports) - 1, 1)
+
+        # plot the beam (undeformed)
+        self.beamline.set_data([x0, x1], [0.0, 0.0])
+
+        # plot the support conditions as one line, glyphs separated by nan
+        self.supportline.set_data(*supportGlyphs(supports, d))
+
+        self.axes.relim()
+        self.axes.autoscale_view()
+        return True
+
+    def _updateLimits(self, y):
+        # keep the response axis limits while the new curve still fills them
+        # reasonably well, so small changes can be blitted without a full redraw
+        lo, hi = y.min(), y.max()
+        span = hi - lo
+        if span == 0.0:
+            pad = 0.05 * abs(hi) or 0.055
+        else:
+            pad = 0.05 * span
+        curlo, curhi = self.axes2.get_ylim()
+        if self._background is not None and curlo <= lo and hi <= curhi \
+                and span >= 0.5 * (curhi - curlo):
+            return False
+        self.axes2.set_ylim(lo - pad, hi + pad)
+        return True
+
+## define the application class
+
+class ApplicationWindow(QMainWindow):
+
+    # emitted from the Monte Carlo thread: a ReliabilityEstimate after every chunk,
+    # then the error message (None if the run went through)
+    reliabilityEstimate = QtCore.pyqtSignal(object)
+    reliabilityFinished = QtCore.pyqtSignal(object)
+
+    def __init__(self):
+        # Menu options for main window
+        QMainWindow.__init__(self)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.setWindowTitle("Beam Calculator")
+
+        self.file_menu = QMenu('&File', self)
+        self.file_menu.addAction('&Quit', self.fileQuit,
+                                 QtCore.Qt.CTRL + QtCore.Qt.Key_Q)
+        self.file_menu.addAction('&Save', self.saveBtnClicked,
+                                 QtCore.Qt.CTRL + QtCore.Qt.Key_S)
+        self.exportAction = self.file_menu.addAction('&Export Report...', self.exportReport)
+        self.exportProcess = None
+        self.file_menu.addAction('&Open Result Store...', self.openResultStore)
+        self.menuBar().addMenu(self.file_menu)
+
+        self.sweep_menu = QMenu('S&weep', self)
+        self.sweep_menu.addAction('&Parametric Sweep...', self.parametricSweep)
+        self.sweep_menu.addAction('&Clear Sweep', self.clearSweep)
+        self.menuBar().addMenu(self.sweep_menu)
+
+        self.reliability_menu = QMenu('&Reliability', self)
+        self.monteCarloAction = self.reliability_menu.addAction('&Monte Carlo...', self.monteCarlo)
+        self.menuBar().addMenu(self.reliability_menu)
+
+        self.profile_menu = QMenu('&Profile', self)
+        # Monte Carlo runs get their own thread, so canvas solves are not queued behind them
+        self._reliabilityExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._reliabilityStop = False
+        self.reliabilityEstimate.connect(self.showReliability)
+        self.reliabilityFinished.connect(self.reliabilityDone)
+
+        self.timingsAction = self.profile_menu.addAction('Show &Timings', self.toggleTimings)
+        self.timingsAction.setCheckable(True)
+        self.profile_menu.addAction('&Export Timings...', self.exportTimings)
+        self.menuBar().addMenu(self.profile_menu)
+
+        self.help_menu = QMenu('&Help', self)
+        self.menuBar().addSeparator()
+        self.menuBar().addMenu(self.help_menu)
+
+        self.help_menu.addAction('&About', self.about)
+
+        self.main_widget = QWidget(self)
+
+        l = QVBoxLayout(self.main_widget)
+        self.systemplot = MyBeamMplCanvas(self.main_widget)
+        self.systemplot.configure(L=10., leftBC=1, rightBC=1, W=1.0,
+                                  E=29000.0, I=21.33, output=0)
+        # dimensions of the last section picked, so they can be swept
+        self.sectionDims = None
+        # vertex text of the last polygon section, offered again when re-picked
+        self.polygonText = '0 0\n4 0\n4 6\n0 6'
+
+        # buttons for different boundary conditions
+        btn_clamp_L = QPushButton('Fix',self.main_widget)
+        btn_clamp_L.clicked.connect(self.onLBtnClampedClicked)
+
+        btn_pinned_L = QPushButton('Pin',self.main_widget)
+        btn_pinned_L.clicked.connect(self.onLBtnPinnedClicked)
+
+        btn_free_L = QPushButton('Free',self.main_widget)
+        btn_free_L.clicked.connect(self.onLBtnFreeClicked)
+
+        btn_clamp_R = QPushButton('Fix', self.main_widget)
+        btn_clamp_R.clicked.connect(self.onRBtnClampedClicked)
+
+        btn_pinned_R = QPushButton('Pin', self.main_widget)
+        btn_pinned_R.clicked.connect(self.onRBtnPinnedClicked)
+
+        btn_free_R = QPushButton('Free', self.main_widget)
+        btn_free_R.clicked.connect(self.onRBtnFreeClicked)
+
+        # put boundary condition buttons together
+        lytl = QVBoxLayout()
+        lytl.addWidget(btn_free_L)
+        lytl.addWidget(btn_pinned_L)
+        lytl.addWidget(btn_clamp_L)
+        lytr = QVBoxLayout()
+        lytr.addWidget(btn_free_R)
+        lytr.addWidget(btn_pinned_R)
+        lytr.addWidget(btn_clamp_R)
+
+
+        plotlyt = QHBoxLayout()
+        plotlyt.addLayout(lytl)
+        plotlyt.addWidget(self.systemplot)
+        plotlyt.addLayout(lytr)
+
+
+        # make label and combo box for material selection
+        matlbl = QLabel('Select Material:', self)
+        self.material = QComboBox(self)
+        self.material.addItem('Select Material Type')
+        self.material.addItem('Steel (29000 ksi)')
+        self.material.addItem('Wood (1900 ksi)')
+        self.material.activated[str].connect(self.chooseE)
+
+        lengthlbl = QLabel('Beam Length (in)')
+        self.length = QDoubleSpinBox(self)
+        self.length.setRange(1., 10000000000000.)
+        self.length.setValue(10.)
+        self.length.setDecimals(4)
+        self.length.valueChanged.connect(self.changeLength)
+
+        # make label and input line for distributed load
+        loadlbl = QLabel('Distributed Load (kip/in):', self)
+        self.load = QDoubleSpinBox(self)
+        self.load.setRange(0., 100000000000000.)
+        self.load.setValue(1.)
+        self.load.setDecimals(4)
+        self.load.valueChanged.connect(self.applyLoad)
+
+        # make label and combo box for section type
+        sectlbl = QLabel('Select Section Type', self)
+        self.section = QComboBox(self)
+        self.section.addItem('Select Section Type')
+        self.section.addItem('Rectangle')
+        self.section.addItem('I-Beam')
+        self.section.addItem('Polygon')
+        self.section.addItem('Tapered')
+        self.section.activated[str].connect(self.sectionPicked)
+
+        # make a layout that puts together material, load, and section inputs
+        lyt2 = QHBoxLayout()
+        lyt2.addWidget(matlbl)
+        lyt2.addWidget(self.material)
+        lyt2.addWidget(lengthlbl)
+        lyt2.addWidget(self.length)
+        lyt2.addWidget(loadlbl)
+        lyt2.addWidget(self.load)
+        lyt2.addWidget(sectlbl)
+        lyt2.addWidget(self.section)
+
+        # make button group for output results
+        outlbl = QLabel('Output Plot:', self)
+        # create QButtonGroup
+        self.optionbox = QButtonGroup()
+        # make check box options
+        self.checkd = QCheckBox('Deflection', self.main_widget)
+        self.checkt = QCheckBox('Rotation', self.main_widget)
+        self.checkv = QCheckBox('Shear', self.main_widget)
+        self.checkm = QCheckBox('Moment', self.main_widget)
+        self.checkf = QCheckBox('Modes', self.main_widget)
+        # add check boxes to button group
+        self.optionbox.addButton(self.checkd)
+        self.optionbox.addButton(self.checkt)
+        self.optionbox.addButton(self.checkv)
+        self.optionbox.addButton(self.checkm)
+        self.optionbox.addButton(self.checkf)
+        # connect to methods to plot desired results
+        self.checkd.stateChanged.connect(self.deflectionChecked)
+        self.checkt.stateChanged.connect(self.rotationChecked)
+        self.checkv.stateChanged.connect(self.shearChecked)
+        self.checkm.stateChanged.connect(self.momentChecked)
+        self.checkf.stateChanged.connect(self.modesChecked)
+
+        # check button layout
+        chklyt = QHBoxLayout()
+        chklyt.addWidget(outlbl)
+        chklyt.addWidget(self.checkd)
+        chklyt.addWidget(self.checkt)
+        chklyt.addWidget(self.checkv)
+        chklyt.addWidget(self.checkm)
+        chklyt.addWidget(self.checkf)
+
+        # save figure button
+        savebtn = QPushButton('Save Figure', self)
+        savebtn.clicked.connect(self.saveBtnClicked)
+
+        # save button layout
+        savelyt = QHBoxLayout()
+        savelyt.addWidget(savebtn)
+
+        # add all layouts to main layout
+        l.addLayout(plotlyt)
+        l.addLayout(chklyt)
+        l.addLayout(lyt2)
+        l.addLayout(savelyt)
+
+        self.main_widget.setFocus()
+        self.setCentralWidget(self.main_widget)
+
+    def onLBtnClampedClicked(self):
+        self.systemplot.setLBC(2)
+
+    def onLBtnPinnedClicked(self):
+        self.systemplot.setLBC(1)
+        if self.systemplot.rightBC == 0:
+            warningdlg = errorMessage(self)
+            warningdlg.exec()
+
+    def onLBtnFreeClicked(self):
+        self.systemplot.setLBC(0)
+        if self.systemplot.rightBC == 0 or self.systemplot.rightBC == 1:
+            warningdlg = errorMessage(self)
+            warningdlg.exec()
+
+    def onRBtnClampedClicked(self):
+        self.systemplot.setRBC(2)
+
+    def onRBtnPinnedClicked(self):
+        self.systemplot.setRBC(1)
+        if self.systemplot.leftBC == 0:
+            warningdlg = errorMessage(self)
+            warningdlg.exec()
+
+    def onRBtnFreeClicked(self):
+        self.systemplot.setRBC(0)
+        if self.systemplot.leftBC == 0 or self.systemplot.leftBC == 1:
+            warningdlg = errorMessage(self)
+            warningdlg.exec()
+
+    def deflectionChecked(self, state):
+        if state == Qt.Checked:
+            self.systemplot.setOutput(0)
+
+    def rotationChecked(self, state):
+        if state == Qt.Checked:
+            self.systemplot.setOutput(1)
+
+    def shearChecked(self, state):
+        if state == Qt.Checked:
+            self.systemplot.setOutput(2)
+
+    def momentChecked(self, state):
+        if state == Qt.Checked:
+            self.systemplot.setOutput(3)
+
+    def modesChecked(self, state):
+        if state == Qt.Checked:
+            self.systemplot.setOutput(MODES)
+
+    def chooseE(self, material):
+        if material == 'Wood (1900 ksi)':
+            self.systemplot.setE(1900.0)
+        elif material == 'Steel (29000 ksi)':
+            self.systemplot.setE(29000.0)
+
+    def applyLoad(self, load):
+        self.systemplot.setW(load)
+
+    def changeLength(self, length):
+        self.systemplot.setLength(length)
+
+    def sectionPicked(self, cursec):
+        # rectangles and I-beams use the closed forms that sweeps and Monte Carlo
+        # use for the same dimensions, polygons the memoized polygon engine
+        try:
+            if cursec == 'Rectangle':
+                rectdlg = rectMoI(self)
+                rectdlg.exec()
+                self.sectionDims = ('rectangle', {'w': rectdlg.w, 'h': rectdlg.h})
+                self.systemplot.setI(rectdlg.getRectI())
+                self.showSection(namedSection(*self.sectionDims))
+            elif cursec == 'I-Beam':
+                ibeamdlg = ibeamMoI(self)
+                ibeamdlg.exec()
+                self.sectionDims = ('wideflange', {'flanget': ibeamdlg.ft, 'webt': ibeamdlg.wt,
+                                                   'w': ibeamdlg.w, 'h': ibeamdlg.h})
+                self.systemplot.setI(ibeamdlg.getIbeamI())
+                if ibeamdlg.shapeI is None:
+                    self.showSection(namedSection(*self.sectionDims))
+            elif cursec == 'Polygon':
+                text, ok = QInputDialog.getMultiLineText(
+                    self, 'Polygon Section',
+                    'One "x y" vertex per line, a blank line between rings,\n'
+                    '"hole" as the first line of a ring to cut it out:', self.polygonText)
+                if not ok:
+                    return
+                props = sectionProperties(parseSection(text)).strongAxis()
+                self.polygonText = text
+                self.systemplot.setI(float(props.I))
+                # a free polygon has no dimensions to sweep
+                self.sectionDims = None
+                self.showSection(props)
+            elif cursec == 'Tapered':
+                # depth varies linearly between the end values of I, solved on the
+                # worker thread; any change to the beam goes back to a prismatic one
+                c = self.systemplot
+                I0, ok = QInputDialog.getDouble(self, 'Tapered Section', 'I at the left end:', c.I, 0.001, 1e9, 3)
+                if not ok:
+                    return
+                I1, ok = QInputDialog.getDouble(self, 'Tapered Section', 'I at the right end:', c.I, 0.001, 1e9, 3)
+                if not ok:
+                    return
+                supports = [(0.0, c.leftBC), (c.L, c.rightBC)] if (c.leftBC, c.rightBC) in STABLE_CASES else []
+                self.sectionDims = None
+                c.submitSolve(solveNonPrismatic, c.L, c.W, c.E, taper(I0, I1, c.L), c.leftBC, c.rightBC,
+                              supports=supports)
+        except ValueError as e:
+            QMessageBox.warning(self, 'Section', str(e))
+
+    def showSection(self, props):
+        # props is a SectionProperties, strong axis
+        self.statusBar().showMessage('A = %.4g   I = %.4g   S = %.4g   Z = %.4g   r = %.4g' %
+                                     (props.A, props.I, props.S, props.Z, props.r))
+
+    def parametricSweep(self):
+        sweepdlg = sweepSetup(self, self.systemplot, self.sectionDims)
+        if sweepdlg.exec():
+            self.systemplot.setSweep(sweepdlg.getSweeps(), self.sectionDims)
+
+    def clearSweep(self):
+        self.systemplot.setSweep(None)
+
+    def monteCarlo(self):
+        # probability that the current beam exceeds L/360 (or a moment limit)
+        # with random E, load and section, sampled on a worker thread while the
+        # estimates stream into the status bar; one run at a time
+        mcdlg = reliabilitySetup(self)
+        if not mcdlg.exec():
+            return
+        c = self.systemplot
+        E = Lognormal(c.E, mcdlg.cov['E'])
+        W = Normal(c.W, mcdlg.cov['W'])
+        section = None
+        if self.sectionDims is not None:
+            section = (self.sectionDims[0], dict((k, Lognormal(v, mcdlg.cov['section']))
+                                                 for k, v in self.sectionDims[1].items()))
+        model = ReliabilityModel(c.L, c.leftBC, c.rightBC, E, W, Lognormal(c.I, mcdlg.cov['section']),
+                                 section, c.L / 360.0, mcdlg.momentLimit or None)
+        samples, seed = mcdlg.samples, mcdlg.seed
+
+        def run():
+            error = None
+            try:
+                for est in runReliability(model, samples, seed=seed):
+                    if self._reliabilityStop:
+                        return
+                    self.reliabilityEstimate.emit(est)
+            except ValueError as e:
+                error = str(e)
+            self.reliabilityFinished.emit(error)
+
+        self.monteCarloAction.setEnabled(False)
+        self._reliabilityExecutor.submit(run)
+
+    def showReliability(self, est):
+        self.statusBar().showMessage(
+            'n = %d   P(deflection > L/360) = %.3g [%.3g, %.3g]   P(failure) = %.3g [%.3g, %.3g]' %
+            (est.n, est.p[0], est.lo[0], est.hi[0], est.p[2], est.lo[2], est.hi[2]))
+
+    def reliabilityDone(self, error):
+        self.monteCarloAction.setEnabled(True)
+        if error:
+            QMessageBox.warning(self, 'Monte Carlo', error)
+
+    def toggleTimings(self):
+        # record refresh phases and show a running readout in the status bar
+        timer = self.systemplot.timer
+        timer.enabled = self.timingsAction.isChecked()
+        if timer.enabled:
+            timer.clear()
+            self.timingsTimer = QtCore.QTimer(self)
+            self.timingsTimer.timeout.connect(self.showTimings)
+            self.timingsTimer.start(500)
+        else:
+            self.timingsTimer.stop()
+            self.statusBar().clearMessage()
+
+    def showTimings(self):
+        parts = ['%s %.2f ms (max %.2f)' % (name, 1000 * s['mean'], 1000 * s['max'])
+                 for name, s in self.systemplot.timer.summary().items()]
+        self.statusBar().showMessage('  |  '.join(parts) or 'no refreshes yet')
+
+    def exportTimings(self):
+        fname, selected = QFileDialog.getSaveFileName(self, 'Export Timings', 'timings.json',
+                                                      'JSON (*.json)')
+        if fname:
+            self.systemplot.timer.exportJSON(fname)
+
+    def saveBtnClicked(self):
+        fname, selected = QFileDialog.getSaveFileName(self, 'Save Figure', 'Result Plot.png',
+                                                      'PNG (*.png);;SVG (*.svg);;PDF (*.pdf)')
+        if fname:
+            self.systemplot.saveFigure(fname)
+
+    def exportReport(self):
+        # plots for every case in a csv/jsonl file, rendered by FigureExport.py in
+        # a child process: its worker pool is never forked from the Qt process, and
+        # the GUI thread only counts the file names it prints
+        cases, selected = QFileDialog.getOpenFileName(self, 'Export Report: Cases', '',
+                                                      'Cases (*.csv *.jsonl)')
+        if not cases:
+            return
+        outdir = QFileDialog.getExistingDirectory(self, 'Export Report: Output Folder')
+        if not outdir:
+            return
+        fmt, ok = QInputDialog.getItem(self, 'Export Report', 'File format:', FORMATS, 2, False)
+        if not ok:
+            return
+        # the report shows the response currently selected on the canvas
+        # (the deflection while mode shapes are shown)
+        output = self.systemplot.output
+        if output == MODES:
+            output = 0
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'FigureExport.py')
+        self.exportCount = 0
+        self.exportDir = outdir
+        self.exportProcess = QtCore.QProcess(self)
+        self.exportProcess.readyReadStandardOutput.connect(self.exportProgress)
+        self.exportProcess.finished.connect(self.exportFinished)
+        self.exportProcess.errorOccurred.connect(self.exportFailed)
+        self.exportAction.setEnabled(False)
+        self.exportProcess.start(sys.executable, [script, cases, '-d', outdir, '--format', fmt,
+                                                  '--plots', OUTPUTS[output]])
+
+    def exportProgress(self):
+        self.exportCount += bytes(self.exportProcess.readAllStandardOutput()).count(b'\n')
+        self.statusBar().showMessage('%d figures written' % self.exportCount)
+
+    def exportFinished(self, code, status):
+        self.exportProgress()
+        error = bytes(self.exportProcess.readAllStandardError()).decode(errors='replace').strip()
+        if code == 0 and status == QtCore.QProcess.NormalExit:
+            # the summary line also counts the cases that were skipped
+            self.statusBar().showMessage(error.splitlines()[-1] if error else
+                                         '%d figures written to %s' % (self.exportCount, self.exportDir))
+        else:
+            # the last line of the traceback says what went wrong
+            QMessageBox.warning(self, 'Export Report', error.splitlines()[-1] if error else 'export failed')
+        self.exportProcess = None
+        self.exportAction.setEnabled(True)
+
+    def exportFailed(self, error):
+        # the process did not start, so finished will not follow
+        if error == QtCore.QProcess.FailedToStart:
+            QMessageBox.warning(self, 'Export Report', self.exportProcess.errorString())
+            self.exportProcess = None
+            self.exportAction.setEnabled(True)
+
+    def openResultStore(self):
+        # plot one stored case straight from the memory-mapped columns
+        path = QFileDialog.getExistingDirectory(self, 'Open Result Store')
+        if not path or not os.path.exists(os.path.join(path, 'meta.json')):
+            return
+        store = ResultStore(path)
+        if len(store) == 0:
+            return
+        i, ok = QInputDialog.getInt(self, 'Open Result Store', 'Case (0 - %d):' % (len(store) - 1),
+                                    0, 0, len(store) - 1)
+        if ok:
+            self.systemplot.setResponses(store.responses(i), store.supports(i))
+
+    def fileQuit(self):
+        self.close()
+
+    def closeEvent(self, ce):
+        # a running Monte Carlo stops after its current chunk
+        self._reliabilityStop = True
+        self.fileQuit()
+
+    def about(self):
+        QMessageBox.about(self, "About",
+                                    """ 
+                                    Application that analyzes simple beam
+                                    by: Yashar Zafari
+                                    """
+                                )
+
+# Popup window for rectangular moment of inertia
+class rectMoI(QDialog):
+
+    def __init__(self, parent = None):
+        QDialog.__init__(self, parent)
+
+        # initialize values for width and height
+        self.w = 1.0
+        self.h = 1.0
+
+        # make window title
+        self.setWindowTitle("Moment of Inertia for Rectangular Section")
+
+        # make label and line edit box for width and height
+        rwidthlbl = QLabel('Select Section Width:', self)
+        rheightlbl = QLabel('Select Section Height:', self)
+
+        # make spin box for selecting values
+        rselectw = QDoubleSpinBox(self)
+        rselectw.setValue(4.)
+        rselectw.valueChanged.connect(self.rgetW)
+        rselecth = QDoubleSpinBox(self)
+        rselecth.setValue(4.)
+        rselecth.valueChanged.connect(self.rgetH)
+
+        # make a push button for when user is done
+        rdonebtn = QPushButton('Done', self)
+        rdonebtn.clicked.connect(self.close)
+
+        # make layout for width label and entry box
+        rwlyt = QHBoxLayout()
+        rwlyt.addWidget(rwidthlbl)
+        rwlyt.addWidget(rselectw)
+
+        # make layout for height label and entry box
+        rhlyt = QHBoxLayout()
+        rhlyt.addWidget(rheightlbl)
+        rhlyt.addWidget(rselecth)
+
+        # make layout for push button
+        rdonelyt = QHBoxLayout()
+        rdonelyt.addStretch(1)
+        rdonelyt.addWidget(rdonebtn)
+
+        # add all layouts together
+        rtotallyt = QVBoxLayout(self)
+        rtotallyt.addLayout(rwlyt)
+        rtotallyt.addLayout(rhlyt)
+        rtotallyt.addLayout(rdonelyt)
+
+        self.setLayout(rtotallyt)
+
+        self.setGeometry(400, 400, 400, 200)
+
+    def rgetW(self, w_value):
+        self.w = w_value
+
+    def rgetH(self, h_value):
+        self.h = h_value
+
+    def getRectI(self):
+        return float(namedSection('rectangle', {'w': self.w, 'h': self.h}).I)
+
+# Popup window for I-beam moment of inertia
+class ibeamMoI(QDialog):
+
+    def __init__(self, parent=None):
+        QDialog.__init__(self, parent)
+
+        # initialize values for width, height, and web/flange thickness
+        self.w = 1.0
+        self.h = 1.0
+        self.ft = 0.1
+        self.wt = 0.1
+        self.shapeI = None
+
+        # make window title
+        self.setWindowTitle("Moment of Inertia for I-Beam Section")
+
+        # make label and line edit box for width, height, and web/flange thickness
+        iwidthlbl = QLabel('Select Section Width:', self)
+        iheightlbl = QLabel('Select Section Heigh:', self)
+        iflangetlbl = QLabel('Select Flange Thickness:', self)
+        iwebtlbl = QLabel('Select Web Thickness:', self)
+
+        # make combo box for picking a standard shape from the catalog
+        ishapelbl = QLabel('Standard Shape:', self)
+        self.catalog = ShapeCatalog()
+        self.shapes = np.flatnonzero(np.asarray(self.catalog['material']) == 'steel')
+        ishape = QComboBox(self)
+        ishape.addItem('Custom')
+        for k in self.shapes:
+            ishape.addItem(str(self.catalog['name'][k]))
+        ishape.activated[int].connect(self.igetShape)
+
+        # make spin box for selecting values
+        iselectw = QDoubleSpinBox(self)
+        iselectw.setDecimals(3)
+        iselectw.valueChanged.connect(self.igetW)
+        iselecth = QDoubleSpinBox(self)
+        iselecth.setDecimals(3)
+        iselecth.valueChanged.connect(self.igetH)
+        iselectft = QDoubleSpinBox(self)
+        iselectft.setDecimals(3)
+        iselectft.valueChanged.connect(self.igetFt)
+        iselectwt = QDoubleSpinBox(self)
+        iselectwt.setDecimals(3)
+        iselectwt.valueChanged.connect(self.igetWt)
+        self.spins = (iselectw, iselecth, iselectft, iselectwt)
+
+        # make a push button for when user is done
+        idonebtn = QPushButton('Done', self)
+        idonebtn.clicked.connect(self.close)
+
+        # make layout for standard shape label and combo box
+        ishapelyt = QHBoxLayout()
+        ishapelyt.addWidget(ishapelbl)
+        ishapelyt.addWidget(ishape)
+
+        # make layout for width label and entry box
+        iwlyt = QHBoxLayout()
+        iwlyt.addWidget(iwidthlbl)
+        iwlyt.addWidget(iselectw)
+
+        # make layout for height label and entry box
+        ihlyt = QHBoxLayout()
+        ihlyt.addWidget(iheightlbl)
+        ihlyt.addWidget(iselecth)
+
+        # make layout for flange thickness label and entry box
+        iftlyt = QHBoxLayout()
+        iftlyt.addWidget(iflangetlbl)
+        iftlyt.addWidget(iselectft)
+
+        # make layout for web thickness label and entry box
+        iwtlyt = QHBoxLayout()
+        iwtlyt.addWidget(iwebtlbl)
+        iwtlyt.addWidget(iselectwt)
+
+        # make layout for push button
+        idonelyt = QHBoxLayout()
+        idonelyt.addStretch(1)
+        idonelyt.addWidget(idonebtn)
+
+        # add all layouts together
+        itotallyt = QVBoxLayout(self)
+        itotallyt.addLayout(ishapelyt)
+        itotallyt.addLayout(iwlyt)
+        itotallyt.addLayout(ihlyt)
+        itotallyt.addLayout(iftlyt)
+        itotallyt.addLayout(iwtlyt)
+        itotallyt.addLayout(idonelyt)
+
+        self.setLayout(itotallyt)
+
+        self.setGeometry(400, 400, 400, 200)
+
+    def igetW(self, w_value):
+        self.w = w_value
+        self.shapeI = None
+
+    def igetH(self, h_value):
+        self.h = h_value
+        self.shapeI = None
+
+    def igetFt(self, ft_value):
+        self.ft = ft_value
+        self.shapeI = None
+
+    def igetWt(self, wt_value):
+        self.wt = wt_value
+        self.shapeI = None
+
+    def igetShape(self, index):
+        # fill in the dimensions of a catalog shape and use its tabulated Ix
+        if index == 0:
+            return
+        row = self.catalog.row(self.shapes[index - 1])
+        for spin, key in zip(self.spins, ('bf', 'd', 'tf', 'tw')):
+            spin.setValue(float(row[key]))
+        self.shapeI = float(row['Ix'])
+
+    def getIbeamI(self):
+        if self.shapeI is not None:
+            return self.shapeI
+        return float(namedSection('wideflange', {'flanget': self.ft, 'webt': self.wt,
+                                                 'w': self.w, 'h': self.h}).I)
+
+# Popup window for setting up a parametric sweep
+class sweepSetup(QDialog):
+
+    def __init__(self, parent=None, canvas=None, section=None):
+        QDialog.__init__(self, parent)
+
+        self.setWindowTitle("Parametric Sweep")
+
+        # beam parameters, plus the dimensions of the current section
+        self.names = ['L', 'W', 'E', 'I']
+        self.start = [canvas.L, canvas.W, canvas.E, canvas.I]
+        if section is not None:
+            self.names += list(section[1])
+            self.start += list(section[1].values())
+
+        sweeplyt = QVBoxLayout(self)
+        self.rows = []
+        for k, title in enumerate(('Sweep:', 'and:')):
+            # parameter, from, to, number of steps
+            param = QComboBox(self)
+            if k == 1:
+                param.addItem('None')
+            param.addItems(self.names)
+            lo = QDoubleSpinBox(self)
+            hi = QDoubleSpinBox(self)
+            for spin in (lo, hi):
+                spin.setRange(0.001, 10000000000.)
+                spin.setDecimals(3)
+            steps = QDoubleSpinBox(self)
+            steps.setDecimals(0)
+            steps.setRange(2, 1000)
+            steps.setValue(100)
+            param.currentIndexChanged.connect(lambda index, k=k: self.paramPicked(k))
+
+            rowlyt = QHBoxLayout()
+            rowlyt.addWidget(QLabel(title, self))
+            rowlyt.addWidget(param)
+            rowlyt.addWidget(QLabel('from', self))
+            rowlyt.addWidget(lo)
+            rowlyt.addWidget(QLabel('to', self))
+            rowlyt.addWidget(hi)
+            rowlyt.addWidget(QLabel('steps', self))
+            rowlyt.addWidget(steps)
+            sweeplyt.addLayout(rowlyt)
+            self.rows.append((param, lo, hi, steps))
+            self.paramPicked(k)
+
+        # make a push button for when user is done
+        donebtn = QPushButton('Sweep', self)
+        donebtn.clicked.connect(self.accept)
+        donelyt = QHBoxLayout()
+        donelyt.addStretch(1)
+        donelyt.addWidget(donebtn)
+        sweeplyt.addLayout(donelyt)
+
+        self.setLayout(sweeplyt)
+
+    def paramPicked(self, k):
+        # default range: half to twice the current value
+        param, lo, hi, steps = self.rows[k]
+        name = param.currentText()
+        if name in self.names:
+            value = self.start[self.names.index(name)]
+            lo.setValue(0.5 * value)
+            hi.setValue(2.0 * value)
+
+    def getSweeps(self):
+        sweeps = []
+        for param, lo, hi, steps in self.rows:
+            name = param.currentText()
+            if name in self.names and name not in [n for n, v in sweeps]:
+                sweeps.append((name, np.linspace(lo.value(), hi.value(), int(steps.value()))))
+        return sweeps
+
+# Popup window for setting up a Monte Carlo reliability run
+class reliabilitySetup(QDialog):
+
+    def __init__(self, parent=None):
+        QDialog.__init__(self, parent)
+
+        # coefficients of variation, samples, seed and optional moment limit
+        self.cov = {'E': 0.04, 'W': 0.25, 'section': 0.03}
+        self.samples = 1000000
+        self.seed = 0
+        self.momentLimit = 0.0
+
+        self.setWindowTitle("Monte Carlo Reliability")
+        mclyt = QVBoxLayout(self)
+
+        rows = (('COV of E (%):', 100 * self.cov['E'], 1, self.getCovE),
+                ('COV of load (%):', 100 * self.cov['W'], 1, self.getCovW),
+                ('COV of section (%):', 100 * self.cov['section'], 1, self.getCovSection),
+                ('Moment limit (kip-in, 0 = none):', self.momentLimit, 1, self.getMomentLimit),
+                ('Samples:', self.samples, 0, self.getSamples),
+                ('Seed:', self.seed, 0, self.getSeed))
+        for title, value, decimals, slot in rows:
+            spin = QDoubleSpinBox(self)
+            spin.setRange(0., 100000000000.)
+            spin.setDecimals(decimals)
+            spin.setValue(value)
+            spin.valueChanged.connect(slot)
+            rowlyt = QHBoxLayout()
+            rowlyt.addWidget(QLabel(title, self))
+            rowlyt.addWidget(spin)
+            mclyt.addLayout(rowlyt)
+
+        # make a push button for when user is done
+        runbtn = QPushButton('Run', self)
+        runbtn.clicked.connect(self.accept)
+        runlyt = QHBoxLayout()
+        runlyt.addStretch(1)
+        runlyt.addWidget(runbtn)
+        mclyt.addLayout(runlyt)
+
+        self.setLayout(mclyt)
+
+    def getCovE(self, value):
+        self.cov['E'] = value / 100.
+
+    def getCovW(self, value):
+        self.cov['W'] = value / 100.
+
+    def getCovSection(self, value):
+        self.cov['section'] = value / 100.
+
+    def getMomentLimit(self, value):
+        self.momentLimit = value
+
+    def getSamples(self, value):
+        self.samples = max(int(value), 1)
+
+    def getSeed(self, value):
+        self.seed = int(value)
+
+# Popup window for unstable error message
+class errorMessage(QDialog):
+
+    def __init__(self, parent = None):
+        QDialog.__init__(self, parent)
+        warninglbl = QLabel('Warning!!!! Unstable Configuration Picked', self)
+        lyt = QVBoxLayout(self)
+
+        closebtn = QPushButton('Ok, I will review my statics')
+        closebtn.clicked.connect(self.close)
+
+        lyt.addWidget(warninglbl)
+        lyt.addWidget(closebtn)
@@ -0,0 +1,190 @@
+# Arbitrary load sets on a single span, solved with singularity (Macaulay) functions
+# Point loads, partial and linearly varying distributed loads and applied moments
+
+import numpy as np
+
+from BeamSolver import BeamResponses, supportCodes, FREE, PIN, FIX, STABLE_CASES, \
+    DEFLECTION, ROTATION, SHEAR, MOMENT
+
+# singularity order of each load type at the load intensity (q) level
+MOMENT_ORDER = -2
+POINT_ORDER = -1
+STEP_ORDER = 0
+RAMP_ORDER = 1
+
+# 1/m! for the orders that show up in V, M, EI*theta and EI*v
+_INVFACT = 1.0 / np.array([1., 1., 2., 6., 24., 120.])
+
+
+class LoadSet(object):
+    '''
+    variables:
+    self.coef           coefficient of every singularity term
+    self.a              start position of every term
+    self.order          singularity order of every term (-2 moment, -1 point, 0 step, 1 ramp)
+    methods:
+    def addPointLoad (self, P, a)               downward force P at a
+    def addMoment (self, M, a)                  clockwise couple M at a
+    def addDistributedLoad (self, w1, a, b, w2) downward load from a to b, w1 at a and w2 at b
+                                                (a == b adds nothing, b < a raises ValueError)
+    def addUniformLoad (self, W, L)             full length uniform load
+    Every add method also takes arrays, to add many loads of the same kind at once.
+    '''
+
+    def __init__(self):
+        self._coef = []
+        self._a = []
+        self._order = []
+
+    def _add(self, coef, a, order):
+        coef, a = np.broadcast_arrays(np.asarray(coef, dtype=float).ravel(),
+                                      np.asarray(a, dtype=float).ravel())
+        self._coef.append(coef)
+        self._a.append(a)
+        self._order.append(np.full(len(a), order))
+
+    def addPointLoad(self, P, a):
+        self._add(-np.asarray(P), a, POINT_ORDER)
+
+    def addMoment(self, M, a):
+        self._add(M, a, MOMENT_ORDER)
+
+    def addDistributedLoad(self, w1, a, b, w2=None):
+        # a trapezoid is a step and a ramp switched on at a, cancelled again at b
+        if w2 is None:
+            w2 = w1
+        w1, w2, a, b = np.broadcast_arrays(np.asarray(w1, dtype=float), np.asarray(w2, dtype=float),
+                                           np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        if (b < a).any():
+            raise ValueError('distributed loads need a <= b')
+        # a zero length load carries nothing, and its slope would be 0 / 0
+        keep = b > a
+        w1, w2, a, b = w1[keep], w2[keep], a[keep], b[keep]
+        slope = (w2 - w1) / (b - a)
+        self._add(-w1, a, STEP_ORDER)
+        self._add(-slope, a, RAMP_ORDER)
+        self._add(w2, b, STEP_ORDER)
+        self._add(slope, b, RAMP_ORDER)
+
+    def addUniformLoad(self, W, L):
+        self.addDistributedLoad(W, 0.0, L)
+
+    @property
+    def coef(self):
+        return np.concatenate(self._coef) if self._coef else np.zeros(0)
+
+    @property
+    def a(self):
+        return np.concatenate(self._a) if self._a else np.zeros(0)
+
+    @property
+    def order(self):
+        return np.concatenate(self._order) if self._order else np.zeros(0, dtype=int)
+
+    def particular(self, x):
+        '''
+        Load contribution to (V, M, EI*theta, EI*v) at stations x, shape (4, len(x)).
+        All terms of all loads are evaluated in one array expression.
+        '''
+        x = np.asarray(x, dtype=float)
+        c = self.coef[:, None]
+        k = self.order[:, None]
+        d = x[None, :] - self.a[:, None]
+        on = d >= 0.0
+        d = np.where(on, d, 0.0)
+
+        # integrating q once per level raises the singularity order by one
+        m = k + np.arange(1, 5)[:, None, None]
+        terms = np.where(on & (m >= 0), c * d ** np.maximum(m, 0) * _INVFACT[np.maximum(m, 0)], 0.0)
+        return terms.sum(axis=1)
+
+
+def solveLoads(L, E, I, leftBC, rightBC, loads, n=50, x=None):
+    '''
+    Solve a single span under a LoadSet.
+    The four unknown end values at x = 0 (V0, M0, EI*theta0, EI*v0) are found from
+    the two boundary conditions at each end, unstable supports give a zero response
+    and codes outside FREE..FIX raise ValueError.
+    x optionally gives the stations instead of n even ones.
+    '''
+    leftBC, rightBC = [int(c) for c in supportCodes(leftBC, rightBC)]
+    L = float(L)
+    EI = float(E) * float(I)
+
+    # stations: an even grid plus every load position so jumps land on a station
+    if x is None:
+        x = np.linspace(0.0, L, n)
+    a = loads.a
+    x = np.unique(np.concatenate((x, a[(a > 0.0) & (a < L)])))
+
+    p = loads.particular(np.concatenate((x, [L])))
+    pL = p[:, -1]
+    p = p[:, :-1]
+
+    if (leftBC, rightBC) not in STABLE_CASES:
+        zero = np.zeros(len(x))
+        return BeamResponses(x, zero, zero, zero, zero)
+
+    A, right = _endConditions(L, leftBC, rightBC)
+    rhs = np.zeros(4)
+    rhs[2:] = -pL[list(right)]
+    V0, M0, T0, Y0 = np.linalg.solve(A, rhs)
+    shear = V0 + p[0]
+    moment = M0 + V0 * x + p[1]
+    rotation = (T0 + M0 * x + V0 * x**2 / 2 + p[2]) / EI
+    deflection = (Y0 + T0 * x + M0 * x**2 / 2 + V0 * x**3 / 6 + p[3]) / EI
+    return BeamResponses(x, deflection, rotation, shear, moment)
+
+
+def unitLoadBasis(L, E, I, leftBC, rightBC, x, a):
+    '''
+    Response of a single span to a unit downward point load at each position a,
+    shape (4, len(x), len(a)) for (deflection, rotation, shear, moment) at the
+    stations x. The responses to any set of point loads are then one matrix
+    product with the load vector, nothing is solved again.
+    Unstable supports give zeros, codes outside FREE..FIX raise ValueError.
+    '''
+    leftBC, rightBC = [int(c) for c in supportCodes(leftBC, rightBC)]
+    L = float(L)
+    EI = float(E) * float(I)
+    x = np.asarray(x, dtype=float)
+    a = np.asarray(a, dtype=float)
+    G = np.zeros((4, len(x), len(a)))
+    if (leftBC, rightBC) not in STABLE_CASES:
+        return G
+
+    # particular part of a unit point load (V, M, EI*theta, EI*v) = -<x - a>^m / m!
+    # all positions are solved together, the BC matrix does not depend on the load
+    def point(d):
+        m = np.arange(4).reshape((4,) + (1,) * d.ndim)
+        return np.where(d >= 0.0, -np.maximum(d, 0.0) ** m * _INVFACT[m], 0.0)
+
+    A, right = _endConditions(L, leftBC, rightBC)
+    rhs = np.zeros((4, len(a)))
+    rhs[2:] = -point(L - a)[list(right)]
+    V0, M0, T0, Y0 = np.linalg.solve(A, rhs)[..., None, :]
+
+    p = point(x[:, None] - a[None, :])
+    xx = x[:, None]
+    G[SHEAR] = V0 + p[0]
+    G[MOMENT] = M0 + V0 * xx + p[1]
+    G[ROTATION] = (T0 + M0 * xx + V0 * xx**2 / 2 + p[2]) / EI
+    G[DEFLECTION] = (Y0 + T0 * xx + M0 * xx**2 / 2 + V0 * xx**3 / 6 + p[3]) / EI
+    return G
+
+
+def _endConditions(L, leftBC, rightBC):
+    # BC matrix for the unknowns (V0, M0, EI*theta0, EI*v0) at x = 0, and the
+    # levels (0 V, 1 M, 2 EI*theta, 3 EI*v) whose load part at x = L goes on the
+    # right hand side of the last two rows
+    A = np.zeros((4, 4))
+    atL = np.array([[1., 0., 0., 0.],
+                    [L, 1., 0., 0.],
+                    [L**2 / 2, L, 1., 0.],
+                    [L**3 / 6, L**2 / 2, L, 1.]])
+    rows = {FIX: (3, 2), PIN: (3, 1), FREE: (0, 1)}
+    for i, level in enumerate(rows[leftBC]):
+        A[i, level] = 1.0
+    for i, level in enumerate(rows[rightBC]):
+        A[2 + i] = atL[level]
+    return A, rows[rightBC]
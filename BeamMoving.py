@@ -0,0 +1,98 @@
+# Moving load analysis on a single span: influence lines and envelopes of axle trains
+# The response to a unit load at every grid position is solved once (unitLoadBasis),
+# after that every train position is a column of one matrix product
+
+import functools
+
+import numpy as np
+
+from BeamLoads import unitLoadBasis
+from BeamSolver import supportCodes
+
+
+@functools.lru_cache(maxsize=32)
+def cachedBasis(L, E, I, leftBC, rightBC, n=201):
+    '''
+    Unit load basis on n even stations, which are also the load positions.
+    Returns (x, G) with G of shape (4, n, n): G[output, station, load position].
+    Memoized like BeamSolver.cachedSolve, the arrays are read-only.
+    '''
+    x = np.linspace(0.0, L, n)
+    G = unitLoadBasis(L, E, I, leftBC, rightBC, x, x)
+    x.setflags(write=False)
+    G.setflags(write=False)
+    return x, G
+
+
+def influenceLine(L, E, I, leftBC, rightBC, xs, n=201):
+    '''
+    Influence lines of all four responses at station xs: the response at xs to a
+    unit downward load at each of n positions. Returns (a, lines (4, n)).
+    '''
+    a = np.linspace(0.0, L, n)
+    return a, unitLoadBasis(L, E, I, leftBC, rightBC, [xs], a)[:, 0, :]
+
+
+def trainMatrix(a, loads, offsets, lead):
+    '''
+    Load vector of every train position as the columns of a (len(a), len(lead))
+    matrix on the load grid a. loads are the axle loads, offsets the distances of
+    the axles behind the lead axle, lead the lead axle positions. Axles between two
+    grid points are split linearly between them, axles off the span are dropped.
+    '''
+    a = np.asarray(a, dtype=float)
+    loads = np.asarray(loads, dtype=float)
+    pos = np.asarray(lead, dtype=float)[None, :] - np.asarray(offsets, dtype=float)[:, None]
+    h = a[1] - a[0]
+    t = (pos - a[0]) / h
+    j = np.clip(np.floor(t).astype(int), 0, len(a) - 2)
+    w = t - j
+    on = (pos >= a[0]) & (pos <= a[-1])
+    P = np.where(on, loads[:, None], 0.0)
+    col = np.broadcast_to(np.arange(pos.shape[1]), pos.shape)
+
+    T = np.zeros((len(a), pos.shape[1]))
+    np.add.at(T, (j, col), P * (1.0 - w))
+    np.add.at(T, (j + 1, col), P * w)
+    return T
+
+
+class MovingLoadEnvelope(object):
+    '''
+    variables:
+    self.x              stations
+    self.lo, self.hi    min and max of (deflection, rotation, shear, moment), each (4, len(x))
+    self.leadlo         lead axle position that gives lo at each station, (4, len(x))
+    self.leadhi         lead axle position that gives hi at each station, (4, len(x))
+    '''
+
+    def __init__(self, x, lo, hi, leadlo, leadhi):
+        self.x = x
+        self.lo = lo
+        self.hi = hi
+        self.leadlo = leadlo
+        self.leadhi = leadhi
+
+
+def movingLoadEnvelope(L, E, I, leftBC, rightBC, loads, offsets=(0.0,), n=201, step=None):
+    '''
+    Max/min envelopes of an axle train (loads, offsets behind the lead axle)
+    rolling across the span from left to right. The lead axle moves from 0 to
+    L + the train length in steps of step (default: the grid spacing L / (n - 1)).
+    All positions come from one product of the unit load basis with the train matrix.
+    '''
+    # checked before int(), which would turn 1.5 into a pin
+    leftBC, rightBC = supportCodes(leftBC, rightBC)
+    x, G = cachedBasis(float(L), float(E), float(I), int(leftBC), int(rightBC), n)
+    length = float(np.max(offsets))
+    if step is None:
+        step = x[1] - x[0]
+    lead = np.arange(0.0, L + length + 0.5 * step, step)
+
+    T = trainMatrix(x, loads, offsets, lead)
+    R = G @ T                       # (4, stations, positions)
+    klo = R.argmin(axis=-1)
+    khi = R.argmax(axis=-1)
+    lo = np.take_along_axis(R, klo[..., None], axis=-1)[..., 0]
+    hi = np.take_along_axis(R, khi[..., None], axis=-1)[..., 0]
+    return MovingLoadEnvelope(x, lo, hi, lead[klo], lead[khi])
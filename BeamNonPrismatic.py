@@ -0,0 +1,162 @@
+# Non-prismatic single spans: I(x) and optionally E(x) vary along the beam
+# (tapered girders, haunches, cover plates). The moment is known up to the
+# moment and shear at the left end, so the curvature M / EI of each part is
+# integrated cumulatively to rotation and deflection with a two point Gauss
+# rule per interval (exact for a prismatic beam), and the four end unknowns
+# come from one small linear solve of the boundary conditions per beam.
+# Stations and beams are both array axes, nothing loops over either.
+
+import numpy as np
+
+from BeamSolver import BeamResponses, supportCodes, _STABLE, FREE, PIN, FIX
+
+# Gauss points of one interval as fractions of its length
+_GAUSS = 0.5 + np.array([-0.5, 0.5]) / np.sqrt(3.0)
+
+# end condition rows for the unknowns (v0, theta0, M0, V0) at x = 0, indexed by
+# support code: the two left end rows, and which two of the right end rows
+# (0 v(L), 1 theta(L), 2 M(L), 3 V(L)) apply
+_LEFT = np.zeros((3, 2, 4))
+_LEFT[FREE] = ((0, 0, 1, 0), (0, 0, 0, 1))
+_LEFT[PIN] = ((1, 0, 0, 0), (0, 0, 1, 0))
+_LEFT[FIX] = ((1, 0, 0, 0), (0, 1, 0, 0))
+_RIGHT = np.zeros((3, 2), dtype=int)
+_RIGHT[FREE] = (2, 3)
+_RIGHT[PIN] = (0, 2)
+_RIGHT[FIX] = (0, 1)
+
+
+class Profile(object):
+    '''
+    I(x) or E(x) from a table
+    variables:
+    self.x              table positions along the span
+    self.values         table values
+    self.kind           'step': values[k] from x[k] up to x[k + 1] (cover plates)
+                        'linear': straight lines between the points (haunches)
+    methods:
+    def __init__ (self, x, values, kind)
+    def __call__ (self, x)      values at the positions x (any shape)
+    The table positions become stations, so steps and kinks are integrated exactly.
+    '''
+
+    def __init__(self, x, values, kind='step'):
+        self.x = np.asarray(x, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        if kind not in ('step', 'linear'):
+            raise ValueError('kind is step or linear')
+        if len(self.x) != len(self.values):
+            raise ValueError('need one value per table position')
+        self.kind = kind
+
+    def __call__(self, x):
+        if self.kind == 'linear':
+            return np.interp(x, self.x, self.values)
+        k = np.clip(np.searchsorted(self.x, x, side='right') - 1, 0, len(self.values) - 1)
+        return self.values[k]
+
+
+def taper(I0, I1, L, power=3):
+    '''
+    I(x) of a member whose depth varies linearly from the left to the right end,
+    with I0 and I1 at the ends: I grows with depth^power (3 for a plate girder web
+    or a rectangle, about 2 for a wide flange dominated by its flanges).
+    I0, I1 and L may be (beams, 1) arrays for a batch of different tapers.
+    '''
+    r = (np.asarray(I1, dtype=float) / I0) ** (1.0 / power)
+    return lambda x: I0 * (1.0 + (r - 1.0) * np.asarray(x) / L) ** power
+
+
+def _values(p, x):
+    # a profile (anything callable) at x, or a number per beam broadcast over x
+    # callables always see (beams, points), so per beam parameters can be (beams, 1)
+    if callable(p):
+        return np.broadcast_to(p(x.reshape(len(x), -1)), (len(x), x[0].size)).reshape(x.shape)
+    return np.asarray(p, dtype=float).reshape((-1,) + (1,) * (x.ndim - 1))
+
+
+def _stations(L, n, profiles):
+    # n even stations per beam plus every table position inside the span
+    xi = np.linspace(0.0, 1.0, n)
+    x = L[:, None] * xi
+    breaks = [p.x for p in profiles if isinstance(p, Profile)]
+    if breaks:
+        b = np.concatenate(breaks)
+        x = np.sort(np.concatenate((x, np.clip(b[None, :], 0.0, L[:, None])), axis=1), axis=1)
+    return x
+
+
+def curvatureIntegrals(x, E, I):
+    '''
+    Rotation and deflection of the three curvature parts 1/EI, x/EI and x^2/EI,
+    integrated from 0 along the stations x (beams, stations).
+    Returns (theta, v), each of shape (3, beams, stations).
+    '''
+    h = np.diff(x, axis=-1)
+    xg = x[..., :-1, None] + h[..., None] * _GAUSS
+    flex = np.broadcast_to(1.0 / (_values(E, xg) * _values(I, xg)), xg.shape)
+    k = np.stack((flex, xg * flex, xg * xg * flex))
+
+    dtheta = (k[..., 0] + k[..., 1]) * (h / 2)
+    theta = np.concatenate((np.zeros(k.shape[:2] + (1,)), np.cumsum(dtheta, axis=-1)), axis=-1)
+    # v over one interval: h * theta at its start plus the integral of (h - s) * kappa
+    dv = h * theta[..., :-1] + (k[..., 0] * (1 - _GAUSS[0]) + k[..., 1] * (1 - _GAUSS[1])) * (h * h / 2)
+    v = np.concatenate((np.zeros(k.shape[:2] + (1,)), np.cumsum(dv, axis=-1)), axis=-1)
+    return theta, v
+
+
+def solveNonPrismatic(L, W, E, I, leftBC, rightBC, n=201):
+    '''
+    Uniformly loaded single spans whose E and I may vary along the span.
+    E and I are numbers (one per beam), Profile tables, or callables of the
+    position x, which get (beams, points) arrays.
+    L, W, leftBC and rightBC are scalars or 1-d arrays, one entry per beam.
+    Responses have shape (beams, stations), or (stations,) when every input is
+    a scalar. Signs follow the package convention in BeamSolver (deflection up,
+    sagging moment positive, shear = dM/dx), so a prismatic E and I give the
+    solveBeams curves. Support codes outside FREE..FIX raise ValueError,
+    unstable support combinations give a zero response.
+    '''
+    single = all(np.ndim(v) == 0 for v in (L, W, leftBC, rightBC))
+    leftBC, rightBC = supportCodes(leftBC, rightBC)
+    L, W, left, right = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v)) for v in (L, W, leftBC, rightBC)])
+    L = L.astype(float)
+    W = W.astype(float)
+    nb = len(L)
+
+    x = _stations(L, n, (E, I))
+    theta, v = curvatureIntegrals(x, E, I)
+    tL = theta[..., -1]
+    vL = v[..., -1]
+
+    # every possible right end row, then pick two per beam by its support code
+    ends = np.zeros((nb, 4, 4))
+    rhs = np.zeros((nb, 4))
+    ends[:, 0] = np.stack((np.ones(nb), L, vL[0], vL[1]), axis=-1)
+    rhs[:, 0] = W / 2 * vL[2]
+    ends[:, 1] = np.stack((np.zeros(nb), np.ones(nb), tL[0], tL[1]), axis=-1)
+    rhs[:, 1] = W / 2 * tL[2]
+    ends[:, 2, 2] = 1.0
+    ends[:, 2, 3] = L
+    rhs[:, 2] = W * L * L / 2
+    ends[:, 3, 3] = 1.0
+    rhs[:, 3] = W * L
+
+    stable = _STABLE[left, right]
+    pick = _RIGHT[right]
+    A = np.concatenate((_LEFT[left], np.take_along_axis(ends, pick[:, :, None], axis=1)), axis=1)
+    b = np.concatenate((np.zeros((nb, 2)), np.take_along_axis(rhs, pick, axis=1)), axis=1)
+    A[~stable] = np.eye(4)
+    b[~stable] = 0.0
+    v0, t0, M0, V0 = np.linalg.solve(A, b[..., None])[..., 0].T[..., None]
+
+    zero = np.where(stable, 1.0, 0.0)[:, None]
+    Wc = W[:, None]
+    res = BeamResponses(x,
+                        zero * (v0 + t0 * x + M0 * v[0] + V0 * v[1] - Wc / 2 * v[2]),
+                        zero * (t0 + M0 * theta[0] + V0 * theta[1] - Wc / 2 * theta[2]),
+                        zero * (V0 - Wc * x),
+                        zero * (M0 + V0 * x - Wc * x * x / 2))
+    if single:
+        res = BeamResponses(*[r[0] for r in (res.x, res.deflection, res.rotation, res.shear, res.moment)])
+    return res
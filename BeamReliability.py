@@ -0,0 +1,215 @@
+# Monte Carlo reliability of a single span with random E, section and load
+# Samples are drawn in fixed size chunks so memory stays bounded, every chunk is
+# evaluated with the closed-form peaks in one vectorized call, optionally on a
+# process pool, and running estimates are streamed after every chunk.
+# Every chunk has its own seed spawned from one SeedSequence, so a run gives the
+# same numbers for the same seed no matter how many processes are used.
+#
+# usage: python BeamReliability.py --L 240 --E 29000 0.04 --W 0.1 0.25 --I 500 0.05 --samples 1e7
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from BeamSolver import peaks, DEFLECTION, MOMENT
+from SectionProperties import SECTIONS
+from BatchRunner import imapBounded
+
+# two sided 95% normal quantile for the confidence intervals
+Z95 = 1.959963984540054
+
+# failure modes counted in every chunk
+MODES = ('deflection', 'moment', 'any')
+
+
+class Normal(object):
+    '''
+    Normal random variable given by its mean and coefficient of variation.
+    '''
+
+    def __init__(self, mean, cov):
+        self.mean = float(mean)
+        self.cov = float(cov)
+
+    def sample(self, rng, n):
+        return rng.normal(self.mean, self.cov * abs(self.mean), n)
+
+
+class Lognormal(object):
+    '''
+    Lognormal random variable given by its mean and coefficient of variation,
+    always positive, the usual choice for E, section dimensions and capacities.
+    '''
+
+    def __init__(self, mean, cov):
+        self.mean = float(mean)
+        self.cov = float(cov)
+
+    def sample(self, rng, n):
+        s2 = np.log1p(self.cov * self.cov)
+        return rng.lognormal(np.log(self.mean) - s2 / 2, np.sqrt(s2), n)
+
+
+class Uniform(object):
+    '''
+    Uniform random variable between lo and hi.
+    '''
+
+    def __init__(self, lo, hi):
+        self.lo = float(lo)
+        self.hi = float(hi)
+
+    def sample(self, rng, n):
+        return rng.uniform(self.lo, self.hi, n)
+
+
+def _draw(value, rng, n):
+    # a plain number is a constant
+    if hasattr(value, 'sample'):
+        return value.sample(rng, n)
+    return np.full(n, float(value))
+
+
+class ReliabilityModel(object):
+    '''
+    variables:
+    self.L, self.leftBC, self.rightBC   span and supports (deterministic)
+    self.E, self.W, self.I              numbers or random variables (Normal, Lognormal, Uniform)
+    self.section                        (type, {dimension: value or random variable}), replaces I
+    self.deflectionLimit                allowed deflection, number or random variable
+    self.momentLimit                    allowed moment (e.g. a capacity), None for no moment check
+    methods:
+    def __init__ (self, L, leftBC, rightBC, E, W, I, section, deflectionLimit, momentLimit)
+    def failures (self, rng, n)         failure counts (deflection, moment, any) of n samples
+    '''
+
+    def __init__(self, L, leftBC, rightBC, E, W, I=None, section=None, deflectionLimit=None,
+                 momentLimit=None):
+        if I is None and section is None:
+            raise ValueError('need I or a section')
+        self.L = float(L)
+        self.leftBC = int(leftBC)
+        self.rightBC = int(rightBC)
+        self.E = E
+        self.W = W
+        self.I = I
+        self.section = section
+        self.deflectionLimit = self.L / 360.0 if deflectionLimit is None else deflectionLimit
+        self.momentLimit = momentLimit
+
+    def failures(self, rng, n):
+        E = _draw(self.E, rng, n)
+        W = _draw(self.W, rng, n)
+        if self.section is not None:
+            props, names = SECTIONS[self.section[0]]
+            I = props(*[_draw(self.section[1][name], rng, n) for name in names]).I
+        else:
+            I = _draw(self.I, rng, n)
+
+        peak = peaks(self.L, W, E, I, self.leftBC, self.rightBC)
+        defl = peak[:, DEFLECTION] > _draw(self.deflectionLimit, rng, n)
+        if self.momentLimit is None:
+            mom = np.zeros(n, dtype=bool)
+        else:
+            mom = peak[:, MOMENT] > _draw(self.momentLimit, rng, n)
+        return np.array([defl.sum(), mom.sum(), (defl | mom).sum()])
+
+
+def sampleChunk(args):
+    '''
+    Draw and evaluate one chunk, returns (n, failure counts).
+    '''
+    model, n, seed = args
+    return n, model.failures(np.random.default_rng(seed), n)
+
+
+class ReliabilityEstimate(object):
+    '''
+    variables:
+    self.n              samples so far
+    self.failures       failure counts for (deflection, moment, any)
+    self.p              failure probabilities
+    self.lo, self.hi    95% Wilson confidence interval of p
+    methods:
+    def asDict (self)
+    '''
+
+    def __init__(self, n, failures):
+        self.n = n
+        self.failures = failures
+        self.p = failures / float(n)
+        z2n = Z95 * Z95 / n
+        center = (self.p + z2n / 2) / (1 + z2n)
+        half = Z95 * np.sqrt(self.p * (1 - self.p) / n + z2n / (4 * n)) / (1 + z2n)
+        self.lo = np.maximum(center - half, 0.0)
+        self.hi = np.minimum(center + half, 1.0)
+
+    def asDict(self):
+        out = {'n': int(self.n)}
+        for k, mode in enumerate(MODES):
+            out[mode] = {'failures': int(self.failures[k]), 'p': float(self.p[k]),
+                         'lo': float(self.lo[k]), 'hi': float(self.hi[k])}
+        return out
+
+
+def runReliability(model, samples=10**6, chunk=2**16, seed=0, processes=1):
+    '''
+    Run samples Monte Carlo samples of model in chunks of chunk samples and yield
+    a ReliabilityEstimate of all samples so far after every chunk.
+    '''
+    nchunks = -(-int(samples) // chunk)
+    seeds = np.random.SeedSequence(seed).spawn(nchunks)
+    sizes = [min(chunk, int(samples) - k * chunk) for k in range(nchunks)]
+    tasks = ((model, n, s) for n, s in zip(sizes, seeds))
+
+    total = 0
+    failures = np.zeros(len(MODES), dtype=np.int64)
+    for n, fail in imapBounded(sampleChunk, tasks, processes):
+        total += n
+        failures += fail
+        yield ReliabilityEstimate(total, failures.copy())
+
+
+def _variable(values, kind):
+    # command line: one value is a constant, two are mean and cov
+    if values is None:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return kind(values[0], values[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Monte Carlo reliability of a single span.')
+    parser.add_argument('--L', type=float, required=True, help='span')
+    parser.add_argument('--left', type=int, default=1, help='left support code')
+    parser.add_argument('--right', type=int, default=1, help='right support code')
+    parser.add_argument('--E', type=float, nargs='+', default=[29000.0, 0.04], help='mean [cov], lognormal')
+    parser.add_argument('--W', type=float, nargs='+', required=True, help='mean [cov], normal')
+    parser.add_argument('--I', type=float, nargs='+', help='mean [cov], lognormal')
+    parser.add_argument('--rect', type=float, nargs='+', help='w h [cov], lognormal dimensions')
+    parser.add_argument('--limit', type=float, default=360.0, help='deflection limit L/limit')
+    parser.add_argument('--moment-limit', type=float, nargs='+', help='mean [cov], lognormal')
+    parser.add_argument('--samples', type=float, default=1e6)
+    parser.add_argument('--chunk', type=int, default=2**16)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    section = None
+    if args.rect:
+        cov = args.rect[2] if len(args.rect) > 2 else 0.0
+        section = ('rectangle', {'w': Lognormal(args.rect[0], cov), 'h': Lognormal(args.rect[1], cov)})
+    model = ReliabilityModel(args.L, args.left, args.right, _variable(args.E, Lognormal),
+                             _variable(args.W, Normal), _variable(args.I, Lognormal), section,
+                             args.L / args.limit, _variable(args.moment_limit, Lognormal))
+
+    for estimate in runReliability(model, args.samples, args.chunk, args.seed, args.processes):
+        print(json.dumps(estimate.asDict()))
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+# Headless solver for the uniformly loaded single-span beams drawn by MyBeamMplCanvas
+# No Qt or matplotlib in here, so it can be used from scripts and batch jobs
+#
+# Sign conventions, shared by every solver in the package (BeamSolver, BeamLoads,
+# BeamFEM, BeamNonPrismatic): x runs from the left end, deflection is positive
+# up (so a downward load gives a negative deflection), rotation = d(deflection)/dx,
+# moment is positive when it sags the beam and shear = d(moment)/dx.
+
+import functools
+
+import numpy as np
+
+# boundary condition codes (same numbering as the Free/Pin/Fix buttons)
+FREE = 0
+PIN = 1
+FIX = 2
+
+# output codes (same numbering as MyBeamMplCanvas.setOutput)
+DEFLECTION = 0
+ROTATION = 1
+SHEAR = 2
+MOMENT = 3
+
+OUTPUTS = ('deflection', 'rotation', 'shear', 'moment')
+
+# extra canvas output: natural modes from BeamFEM, not a static response
+MODES = 4
+
+
+class BeamResponses(object):
+    '''
+    variables:
+    self.x              stations along the beam, shape (..., n)
+    self.deflection     deflection at each station
+    self.rotation       rotation at each station
+    self.shear          shear at each station
+    self.moment         moment at each station
+    methods:
+    def __init__ (self, x, deflection, rotation, shear, moment)
+    def __getitem__ (self, output)      response for an output code (0-3)
+    '''
+
+    def __init__(self, x, deflection, rotation, shear, moment):
+        self.x = x
+        self.deflection = deflection
+        self.rotation = rotation
+        self.shear = shear
+        self.moment = moment
+
+    def __getitem__(self, output):
+        return getattr(self, OUTPUTS[output])
+
+
+def supportCodes(leftBC, rightBC):
+    '''
+    Support codes as integer arrays, checked once here for every lookup table:
+    anything but FREE, PIN or FIX raises ValueError (a negative code would
+    otherwise index another support case without complaint).
+    '''
+    codes = []
+    for code in (leftBC, rightBC):
+        c = np.asarray(code)
+        if c.dtype.kind not in 'iuf':
+            raise ValueError('support codes must be numbers, got %r' % (code,))
+        ci = c.astype(int)
+        if (ci != c).any() or (ci < FREE).any() or (ci > FIX).any():
+            raise ValueError('support codes must be 0 (free), 1 (pin) or 2 (fix), got %r' % (code,))
+        codes.append(ci)
+    return codes
+
+
+def solveBeams(L, W, E, I, leftBC, rightBC, n=50, xi=None):
+    '''
+    Solve any number of beams in one call.
+    L, W, E, I, leftBC and rightBC can be scalars or arrays, they are broadcast
+    against each other and every response comes back with shape (..., n).
+    Unstable support combinations give a zero response, like the canvas does.
+    xi optionally gives the stations as fractions of L instead of n even ones.
+    '''
+    L = np.asarray(L, dtype=float)
+    if xi is None:
+        xi = np.linspace(0.0, 1.0, n)
+    y = evaluate(L, W, E, I, leftBC, rightBC, xi)
+    x = L[..., None] * xi
+    shape = np.broadcast_shapes(x.shape, y[..., 0, :].shape)
+    x = np.broadcast_to(x, shape)
+    y = np.broadcast_to(y, shape[:-1] + y.shape[-2:])
+    return BeamResponses(x, y[..., 0, :], y[..., 1, :], y[..., 2, :], y[..., 3, :])
+
+
+def solveBeam(L, W, E, I, leftBC, rightBC, n=50, xi=None):
+    '''
+    Solve a single beam, responses come back as 1-d arrays of length n.
+    '''
+    return solveBeams(float(L), float(W), float(E), float(I), int(leftBC), int(rightBC), n, xi)
+
+
+@functools.lru_cache(maxsize=256)
+def cachedSolve(L, W, E, I, leftBC, rightBC, tol=1e-3):
+    '''
+    solveBeam on adaptive stations, memoized on (L, W, E, I, leftBC, rightBC, tol).
+    All four responses come from the one solve, so switching the plotted output
+    or going back to an earlier beam is a cache hit.
+    Hit/miss counters: cachedSolve.cache_info(), reset with cachedSolve.cache_clear().
+    The arrays are shared between callers and read-only.
+    '''
+    res = solveBeam(L, W, E, I, leftBC, rightBC, xi=adaptiveStations(leftBC, rightBC, tol))
+    for o in OUTPUTS + ('x',):
+        getattr(res, o).setflags(write=False)
+    return res
+
+
+def evaluate(L, W, E, I, leftBC, rightBC, xi, outputs=slice(None)):
+    '''
+    Kernel shared by the canvas and the batch solver.
+    Looks up the polynomial coefficients of every (leftBC, rightBC, output) case
+    in _COEFFS and evaluates them at xi = x / L with Horner's scheme, then
+    applies the dimensional scale factor of each output.
+    Returns an array of shape (..., number of outputs, len(xi)).
+    '''
+    xi = np.asarray(xi, dtype=float)
+    leftBC, rightBC = supportCodes(leftBC, rightBC)
+
+    # O(1) dispatch: one fancy index instead of an if/elif per case
+    c = _COEFFS[leftBC, rightBC][..., outputs, :]
+    return _horner(c, xi) * _scales(L, W, E, I)[..., outputs, None]
+
+
+def extrema(L, W, E, I, leftBC, rightBC):
+    '''
+    Exact minimum and maximum of every response and where they occur.
+    Each response is scale * P(x / L), and the extreme points of P on [0, 1]
+    are constants of the support case (precomputed from the roots of P'), so
+    nothing is sampled.
+    Returns (minval, xmin, maxval, xmax), each of shape (..., 4).
+    '''
+    L = np.asarray(L, dtype=float)
+    ex = _EXTREMA[tuple(supportCodes(leftBC, rightBC))]
+    s = _scales(L, W, E, I)
+    up = s >= 0.0
+    lo = s * ex[..., 1]
+    hi = s * ex[..., 3]
+    minval = np.where(up, lo, hi)
+    maxval = np.where(up, hi, lo)
+    xmin = np.where(up, ex[..., 0], ex[..., 2]) * L[..., None]
+    xmax = np.where(up, ex[..., 2], ex[..., 0]) * L[..., None]
+    return minval, xmin, maxval, xmax
+
+
+def peaks(L, W, E, I, leftBC, rightBC):
+    '''
+    Largest absolute deflection, rotation, shear and moment of every beam,
+    shape (..., 4). Cheap enough for millions of beams since no curves are built.
+    '''
+    ex = _EXTREMA[tuple(supportCodes(leftBC, rightBC))]
+    factor = np.maximum(np.abs(ex[..., 1]), np.abs(ex[..., 3]))
+    return factor * np.abs(_scales(L, W, E, I))
+
+
+def zeroShear(L, leftBC, rightBC):
+    '''
+    Location of the zero shear point (where the moment peaks) of every beam,
+    nan for unstable supports.
+    '''
+    return _ZEROSHEAR[tuple(supportCodes(leftBC, rightBC))] * np.asarray(L, dtype=float)
+
+
+@functools.lru_cache(maxsize=64)
+def adaptiveStations(leftBC, rightBC, tol=1e-3, maxLevel=12):
+    '''
+    Stations xi = x / L on which straight lines between the points follow every
+    response to within tol times its peak value. Points are added by bisection
+    only where the curvature needs them, and the exact extrema are always in.
+    Every response is scale * P(xi), so the stations only depend on the supports.
+    '''
+    leftBC, rightBC = supportCodes(leftBC, rightBC)
+    c = _COEFFS[leftBC, rightBC]
+    ex = _EXTREMA[leftBC, rightBC]
+    peak = np.maximum(np.abs(ex[:, 1]), np.abs(ex[:, 3]))
+    peak[peak == 0.0] = 1.0
+
+    xi = np.unique(np.concatenate((np.linspace(0.0, 1.0, 5), ex[:, 0], ex[:, 2])))
+    for level in range(maxLevel):
+        y = _horner(c, xi)
+        mid = 0.5 * (xi[1:] + xi[:-1])
+        err = np.abs(_horner(c, mid) - 0.5 * (y[:, 1:] + y[:, :-1])) / peak[:, None]
+        bad = (err > tol).any(axis=0)
+        if not bad.any():
+            break
+        xi = np.sort(np.concatenate((xi, mid[bad])))
+    xi.setflags(write=False)
+    return xi
+
+
+def _horner(c, xi):
+    # evaluate polynomials with coefficients c[..., k] (highest power first) at xi
+    c = c[..., None]
+    y = c[..., 0, :]
+    for k in range(1, c.shape[-2]):
+        y = y * xi + c[..., k, :]
+    return y
+
+
+def reactions(L, W, leftBC, rightBC):
+    '''
+    Support reactions of every beam, shape (..., 4):
+    left force, right force, left moment, right moment (forces up positive).
+    '''
+    L = np.asarray(L, dtype=float)
+    W = np.asarray(W, dtype=float)
+    leftBC, rightBC = supportCodes(leftBC, rightBC)
+    end = evaluate(L, W, 1.0, 1.0, leftBC, rightBC, [0.0, 1.0], slice(SHEAR, None))
+    total = np.where(_STABLE[leftBC, rightBC], W * L, 0.0)
+    Rleft = end[..., 0, 0]
+    return np.stack(np.broadcast_arrays(Rleft, total - Rleft, end[..., 1, 0], end[..., 1, 1]), axis=-1)
+
+
+def _scales(L, W, E, I):
+    # scale factors W L^4/EI, W L^3/EI, W L and W L^2, each power computed once
+    L = np.asarray(L, dtype=float)
+    W = np.asarray(W, dtype=float)
+    EI = np.asarray(E, dtype=float) * np.asarray(I, dtype=float)
+    WL = W * L
+    WL2 = WL * L
+    WL3 = WL2 * L
+    return np.stack(np.broadcast_arrays(WL3 * L / EI, WL3 / EI, WL, WL2), axis=-1)
+
+
+# polynomial coefficients in xi = x / L, highest power first, for each stable
+# support combination: (deflection, rotation, shear, moment)
+# multiply by the scale factors in evaluate to get the dimensional response
+_TABLE = {
+    (FIX, FREE): ([-1/24, 4/24, -6/24, 0, 0],
+                  [-1/6, 3/6, -3/6, 0],
+                  [-1, 1],
+                  [-1/2, 1, -1/2]),
+    (FREE, FIX): ([-1/24, 0, 0, 4/24, -3/24],
+                  [-1/6, 0, 0, 1/6],
+                  [-1, 0],
+                  [-1/2, 0, 0]),
+    (FIX, FIX): ([-1/24, 2/24, -1/24, 0, 0],
+                 [-2/12, 3/12, -1/12, 0],
+                 [-1, 1/2],
+                 [-1/2, 1/2, -1/12]),
+    (PIN, PIN): ([-1/24, 2/24, 0, -1/24, 0],
+                 [-4/24, 6/24, 0, -1/24],
+                 [-1, 1/2],
+                 [-1/2, 1/2, 0]),
+    (PIN, FIX): ([-2/48, 3/48, 0, -1/48, 0],
+                 [-8/48, 9/48, 0, -1/48],
+                 [-1, 3/8],
+                 [-1/2, 3/8, 0]),
+    (FIX, PIN): ([-2/48, 5/48, -3/48, 0, 0],
+                 [-8/48, 15/48, -6/48, 0],
+                 [-1, 5/8],
+                 [-1/2, 5/8, -1/8]),
+}
+
+
+def _buildCoeffs():
+    # pad every polynomial to degree 4, unstable combinations stay all zero
+    coeffs = np.zeros((3, 3, len(OUTPUTS), 5))
+    for (l, r), polys in _TABLE.items():
+        for o, p in enumerate(polys):
+            coeffs[l, r, o, 5 - len(p):] = p
+    return coeffs
+
+
+_COEFFS = _buildCoeffs()
+
+# support combinations that have a closed-form solution, everything else is unstable
+STABLE_CASES = frozenset(_TABLE)
+_STABLE = np.zeros((3, 3), dtype=bool)
+for _case in STABLE_CASES:
+    _STABLE[_case] = True
+
+
+def _buildExtrema():
+    # (ximin, Pmin, ximax, Pmax) of every polynomial on [0, 1], shape (3, 3, 4, 4)
+    # candidates are the span ends and the real roots of P' inside the span
+    ex = np.zeros((3, 3, len(OUTPUTS), 4))
+    zero = np.full((3, 3), np.nan)
+    for (l, r), polys in _TABLE.items():
+        for o in range(len(OUTPUTS)):
+            c = _COEFFS[l, r, o]
+            roots = np.roots(np.polyder(np.trim_zeros(c, 'f')))
+            roots = roots.real[(abs(roots.imag) < 1e-12) & (roots.real > 0.0) & (roots.real < 1.0)]
+            xi = np.concatenate(([0.0, 1.0], roots))
+            p = _horner(c, xi)
+            ex[l, r, o] = xi[p.argmin()], p.min(), xi[p.argmax()], p.max()
+
+        shear = np.roots(np.trim_zeros(_COEFFS[l, r, SHEAR], 'f'))
+        zero[l, r] = shear.real[(shear.real >= 0.0) & (shear.real <= 1.0)][0]
+    return ex, zero
+
+
+_EXTREMA, _ZEROSHEAR = _buildExtrema()
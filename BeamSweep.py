@@ -0,0 +1,106 @@
+# Parametric sweeps: vary one or two beam parameters over a range and evaluate
+# the whole grid in one broadcast pass, no GUI needed
+#
+# the swept values are laid out as an open grid (first parameter along axis 0,
+# second along axis 1) so nothing is tiled before the final multiply
+
+import numpy as np
+
+from BeamSolver import peaks, supportCodes, _scales, _horner, _COEFFS, OUTPUTS
+from SectionProperties import namedSection
+
+BEAM_PARAMS = ('L', 'W', 'E', 'I')
+
+
+class SweepResult(object):
+    '''
+    variables:
+    self.names          swept parameter names, one or two
+    self.values         1-d array of values for each swept parameter
+    self.peaks          largest absolute deflection, rotation, shear and moment,
+                        shape (len(values[0]), [len(values[1]),] 4)
+    methods:
+    def __init__ (self, names, values, peaks)
+    def governing (self, output)        swept values where the output peaks
+    '''
+
+    def __init__(self, names, values, peaks):
+        self.names = names
+        self.values = values
+        self.peaks = peaks
+
+    def governing(self, output):
+        k = np.unravel_index(np.argmax(self.peaks[..., output]), self.peaks.shape[:-1])
+        return tuple(v[i] for v, i in zip(self.values, k))
+
+
+def sweepParameters(base, sweeps, section=None):
+    '''
+    L, W, E and I of every point of the sweep grid as broadcastable arrays.
+    base holds L, W, E and I, sweeps is a list of one or two (name, values).
+    Names are L, W, E, I or a dimension of section = (type, {dimension: value}),
+    in which case I is recomputed from the section dimensions.
+    '''
+    if not 1 <= len(sweeps) <= 2:
+        raise ValueError('sweep one or two parameters')
+    params = dict((k, base[k]) for k in BEAM_PARAMS)
+    dims = dict(section[1]) if section else {}
+    for axis, (name, values) in enumerate(sweeps):
+        shape = [1] * len(sweeps)
+        shape[axis] = -1
+        values = np.asarray(values, dtype=float).reshape(shape)
+        if name in BEAM_PARAMS:
+            params[name] = values
+        elif name in dims:
+            dims[name] = values
+        else:
+            raise ValueError('cannot sweep %r' % name)
+    if section and any(name in dims for name, values in sweeps):
+        params['I'] = namedSection(section[0], dims).I
+    return params
+
+
+def sweepPeaks(base, sweeps, section=None):
+    '''
+    Peak responses over a one or two parameter grid, e.g. 1000 x 1000 spans and
+    loads. base also needs leftBC and rightBC. Returns a SweepResult.
+    '''
+    p = sweepParameters(base, sweeps, section)
+    result = peaks(p['L'], p['W'], p['E'], p['I'], base['leftBC'], base['rightBC'])
+    shape = tuple(len(v) for n, v in sweeps) + (len(OUTPUTS),)
+    return SweepResult([n for n, v in sweeps], [np.asarray(v, dtype=float) for n, v in sweeps],
+                       np.broadcast_to(result, shape))
+
+
+def sweepEnvelope(base, sweeps, section=None, n=200):
+    '''
+    Envelope of all four responses over every beam of the sweep grid.
+    Returns x (n,) and the lower and upper envelope, each (4, n).
+    Stations are n points on the longest span, a beam contributes where it exists.
+    '''
+    p = sweepParameters(base, sweeps, section)
+    c = _COEFFS[tuple(supportCodes(base['leftBC'], base['rightBC']))]
+    s = _scales(p['L'], p['W'], p['E'], p['I'])
+
+    # a response is scale * P(x / L), so for one span the envelope over everything
+    # else only needs the smallest and largest scale factor: reduce the grid to
+    # one row per swept span (or a single row) before building any curve
+    names = [name for name, values in sweeps]
+    if 'L' in names:
+        axis = names.index('L')
+        L = np.asarray(sweeps[axis][1], dtype=float)
+        other = tuple(a for a in range(len(sweeps)) if a != axis)
+    else:
+        L = np.atleast_1d(np.asarray(p['L'], dtype=float))
+        other = tuple(range(len(sweeps)))
+    smin = s.min(axis=other).reshape(-1, 1, len(OUTPUTS), 1)
+    smax = s.max(axis=other).reshape(-1, 1, len(OUTPUTS), 1)
+
+    x = np.linspace(0.0, L.max(), n)
+    xi = x / L[:, None]
+    P = _horner(c, xi[:, None, :])[:, None]
+    y = np.concatenate((smin * P, smax * P), axis=1)
+    outside = (xi > 1.0)[:, None, None, :]
+    lo = np.where(outside, np.inf, y).min(axis=(0, 1))
+    hi = np.where(outside, -np.inf, y).max(axis=(0, 1))
+    return x, lo, hi
@@ -0,0 +1,297 @@
+# Performance benchmarks, results are written as json so runs can be compared
+#
+# usage: python Benchmarks.py -o bench.json              run everything
+#        python Benchmarks.py --quick                    smaller sizes, for a fast check
+#        python Benchmarks.py --compare old.json -o new.json
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _timeit(fn, repeat=5, number=1):
+    # best and median wall time of one call, in seconds
+    times = []
+    for r in range(repeat):
+        t = time.perf_counter()
+        for k in range(number):
+            fn()
+        times.append((time.perf_counter() - t) / number)
+    return {'best': min(times), 'median': float(np.median(times))}
+
+
+def benchRefresh(repeat=20):
+    '''
+    MyBeamMplCanvas.refresh latency for every support case and output, offscreen.
+    "cold" changes the load before every refresh so the solve cache misses,
+    "warm" refreshes an unchanged beam (cache hit, blitted redraw).
+    '''
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    import BeamGUI
+    from BeamSolver import STABLE_CASES
+
+    app = QApplication.instance() or QApplication([])
+    canvas = BeamGUI.MyBeamMplCanvas()
+    canvas.resize(800, 600)
+    canvas.show()
+    canvas.configure(L=120.0, W=1.0, E=29000.0, I=100.0)
+    canvas.flushRefresh()
+    app.processEvents()
+
+    results = []
+    for l, r in sorted(STABLE_CASES):
+        for o in range(4):
+            canvas.configure(leftBC=l, rightBC=r, output=o)
+            canvas.flushRefresh()
+            app.processEvents()
+            loads = iter(1.0 + 1e-6 * np.arange(10 * repeat))
+
+            def cold():
+                canvas.W = next(loads)
+                canvas.refresh()
+                app.processEvents()
+
+            def warm():
+                canvas.refresh()
+                app.processEvents()
+
+            results.append({'leftBC': l, 'rightBC': r, 'output': o,
+                            'cold': _timeit(cold, repeat), 'warm': _timeit(warm, repeat)})
+    canvas.close()
+    return results
+
+
+def benchSolver(sizes, maxCurves):
+    '''
+    Beams per second for the design values (peaks + reactions) and for the
+    full 50 point response curves (solveBeams) at each batch size.
+    '''
+    from BeamSolver import solveBeams, peaks, reactions
+
+    rng = np.random.default_rng(0)
+    results = []
+    for n in sizes:
+        L = rng.uniform(60.0, 480.0, n)
+        W = rng.uniform(0.01, 0.2, n)
+        I = rng.uniform(50.0, 2000.0, n)
+        left = rng.integers(0, 3, n)
+        right = rng.integers(0, 3, n)
+        repeat = 5 if n <= 10**5 else 2
+
+        t = _timeit(lambda: (peaks(L, W, 29000.0, I, left, right), reactions(L, W, left, right)), repeat)
+        row = {'n': n, 'design': t, 'design_beams_per_s': n / t['best']}
+        if n <= maxCurves:
+            t = _timeit(lambda: solveBeams(L, W, 29000.0, I, left, right), repeat)
+            row['curves'] = t
+            row['curves_beams_per_s'] = n / t['best']
+        results.append(row)
+    return results
+
+
+def benchSections(sizes):
+    '''
+    Sections per second for RectangleI and WideflangeI on arrays of dimensions,
+    plus the one-object-per-section loop for comparison at the smallest size
+    and the polygon engine, uncached and memoized.
+    '''
+    from RectangleMoI import RectangleI
+    from WideflangeMoI import WideflangeI
+
+    rng = np.random.default_rng(1)
+    results = []
+    for n in sizes:
+        w = rng.uniform(1.0, 12.0, n)
+        h = rng.uniform(4.0, 36.0, n)
+        ft = rng.uniform(0.2, 1.0, n)
+        wt = rng.uniform(0.1, 0.6, n)
+        rect = _timeit(lambda: RectangleI(w, h).getProperties())
+        wide = _timeit(lambda: WideflangeI(ft, wt, w, h).getProperties())
+        results.append({'n': n, 'rectangle': rect, 'rectangle_per_s': n / rect['best'],
+                        'wideflange': wide, 'wideflange_per_s': n / wide['best']})
+
+    n = min(sizes[-1], 10**4)
+    w = rng.uniform(1.0, 12.0, n).tolist()
+    h = rng.uniform(4.0, 36.0, n).tolist()
+    loop = _timeit(lambda: [RectangleI(a, b).getIrect() for a, b in zip(w, h)], 3)
+    results.append({'n': n, 'rectangle_loop': loop, 'rectangle_loop_per_s': n / loop['best']})
+
+    # polygon engine on a filleted wide flange: first evaluation and memoized reuse
+    from SectionGeometry import sectionProperties, wideflange
+    shape = wideflange(0.6, 0.35, 8.0, 14.0, fillet=0.5)
+    cold = _timeit(lambda: sectionProperties.__wrapped__(shape))
+    cached = _timeit(lambda: [sectionProperties(shape) for k in range(1000)])
+    results.append({'polygon_cold': cold, 'polygon_cached_per_s': 1000 / cached['best']})
+    return results
+
+
+def benchSweep(sizes):
+    '''
+    Two parameter sweeps (span x load) of n x n beams: peak grid for the heat
+    map and the envelope of all responses.
+    '''
+    from BeamSweep import sweepPeaks, sweepEnvelope
+
+    base = {'L': 120.0, 'W': 0.1, 'E': 29000.0, 'I': 100.0, 'leftBC': 2, 'rightBC': 1}
+    results = []
+    for n in sizes:
+        sweeps = [('L', np.linspace(60.0, 480.0, n)), ('W', np.linspace(0.01, 0.5, n))]
+        grid = _timeit(lambda: sweepPeaks(base, sweeps), 3)
+        envelope = _timeit(lambda: sweepEnvelope(base, sweeps), 3)
+        results.append({'n': n, 'peaks': grid, 'envelope': envelope,
+                        'peaks_beams_per_s': n * n / grid['best']})
+    return results
+
+
+def benchNonPrismatic(sizes):
+    '''
+    Tapered fixed-pin beams on 201 stations, batches of n beams through the
+    cumulative M/EI integration.
+    '''
+    from BeamNonPrismatic import solveNonPrismatic, taper
+
+    results = []
+    for n in sizes:
+        L = np.linspace(120.0, 480.0, n)
+        I = taper(500.0, 2000.0, L[:, None])
+        t = _timeit(lambda: solveNonPrismatic(L, 0.1, 29000.0, I, 2, 1), 3)
+        results.append({'n': n, 'solve': t, 'beams_per_s': n / t['best']})
+    return results
+
+
+_STARTUP = '''
+import os, sys, time, json
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+t0 = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+import BeamGUI
+t1 = time.perf_counter()
+app = QApplication([])
+w = BeamGUI.ApplicationWindow()
+w.show()
+app.processEvents()
+w.systemplot.flushRefresh()
+app.processEvents()
+t2 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'window': t2 - t1, 'total': t2 - t0}))
+'''
+
+
+def benchStartup(repeat=3):
+    '''
+    Cold import of the GUI and time until the ApplicationWindow is up, each run in
+    a fresh interpreter, plus the import time of the headless modules.
+    '''
+    from ImportBudget import measureImport, HEADLESS_MODULES
+
+    runs = []
+    for r in range(repeat):
+        proc = subprocess.run([sys.executable, '-c', _STARTUP], cwd=HERE,
+                              capture_output=True, text=True, check=True)
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    gui = dict((k, min(run[k] for run in runs)) for k in runs[0])
+    headless = dict((m, measureImport(m)['ms'] / 1000.0) for m in HEADLESS_MODULES)
+    return {'gui': gui, 'headless_import': headless}
+
+
+def _metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=HERE, capture_output=True,
+                                text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {'commit': commit, 'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'system': platform.system()}
+
+
+def _flatten(d, prefix=''):
+    # {'a': {'b': 1}} -> {'a.b': 1}, lists are keyed by position
+    out = {}
+    items = d.items() if isinstance(d, dict) else enumerate(d)
+    for k, v in items:
+        key = '%s%s' % (prefix, k)
+        if isinstance(v, (dict, list)):
+            out.update(_flatten(v, key + '.'))
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            out[key] = v
+    return out
+
+
+def compare(old, new, threshold=1.2):
+    '''
+    Print every timing that changed by more than threshold between two runs.
+    Keys ending in _per_s are rates (higher is better), everything else is time.
+    '''
+    a = _flatten(old['results'])
+    b = _flatten(new['results'])
+    worse = 0
+    for key in sorted(set(a) & set(b)):
+        if a[key] <= 0 or b[key] <= 0 or key.endswith('.n') or key.split('.')[-1] in ('leftBC', 'rightBC', 'output'):
+            continue
+        ratio = b[key] / a[key]
+        if key.endswith('_per_s'):
+            ratio = 1.0 / ratio
+        if ratio > threshold or ratio < 1.0 / threshold:
+            worse += ratio > threshold
+            print('%-60s %6.2fx %s' % (key, ratio, 'slower' if ratio > 1 else 'faster'))
+    return worse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the beam solver benchmarks.')
+    parser.add_argument('-o', '--output', default='-', help='json output file, - for stdout')
+    parser.add_argument('--quick', action='store_true', help='smaller sizes and fewer repeats')
+    parser.add_argument('--only', nargs='*', choices=('refresh', 'solver', 'sections', 'sweep', 'nonprismatic',
+                                                      'startup'))
+    parser.add_argument('--compare', help='earlier json output to compare against')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        sizes = [1, 10, 100, 10**3, 10**4, 10**5]
+        maxCurves = 10**4
+        repeat = 5
+    else:
+        sizes = [1, 10, 100, 10**3, 10**4, 10**5, 10**6]
+        maxCurves = 10**5
+        repeat = 20
+
+    only = args.only or ('refresh', 'solver', 'sections', 'sweep', 'nonprismatic', 'startup')
+    results = {}
+    if 'refresh' in only:
+        results['refresh'] = benchRefresh(repeat)
+    if 'solver' in only:
+        results['solver'] = benchSolver(sizes, maxCurves)
+    if 'sections' in only:
+        results['sections'] = benchSections(sizes)
+    if 'sweep' in only:
+        results['sweep'] = benchSweep([10, 100, 1000] if args.quick else [10, 100, 1000, 2000])
+    if 'nonprismatic' in only:
+        results['nonprismatic'] = benchNonPrismatic([1, 100, 10**4] if args.quick else [1, 100, 10**4, 10**5])
+    if 'startup' in only:
+        results['startup'] = benchStartup(2 if args.quick else 5)
+
+    report = {'metadata': _metadata(), 'results': results}
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+
+    if args.compare:
+        with open(args.compare) as f:
+            return 1 if compare(json.load(f), report) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# Batch export of beam plots for reports, no GUI needed
+# Cases are read like BatchRunner reads them, rendered with the Agg backend on a
+# process pool and written as one file per case (and per response) in png, svg or pdf.
+# Every worker builds its figure once and only updates the artist data per case.
+#
+# usage: python FigureExport.py cases.csv -d plots --format pdf --plots deflection moment
+
+import argparse
+import os
+import re
+import sys
+
+import numpy as np
+
+from BeamSolver import solveBeams, adaptiveStations, OUTPUTS, STABLE_CASES, PIN, FIX
+from BatchRunner import readCases, parseCases, chunked, imapBounded, _format
+
+FORMATS = ('png', 'svg', 'pdf')
+
+# the figure of the current worker process, built by _initWorker
+_plot = None
+
+
+def supportGlyphs(supports, d):
+    '''
+    Support symbols as one nan separated polyline: a triangle for a pin and a
+    vertical bar for a fixed end. supports is a list of (x, code), d the glyph size.
+    '''
+    xs, ys = [], []
+    for xp, bc in supports:
+        if bc == PIN:
+            xs += [xp, xp + d, xp - d, xp, np.nan]
+            ys += [0, -d, -d, 0, np.nan]
+        elif bc == FIX:
+            xs += [xp, xp, np.nan]
+            ys += [+d, -d, np.nan]
+    return xs, ys
+
+
+class ReportFigure(object):
+    '''
+    variables:
+    self.fig            Agg figure with the beam on top and the response below, like the canvas
+    self.beamline, self.supportline, self.responseline
+    methods:
+    def __init__ (self, size, dpi)
+    def render (self, x, y, L, leftBC, rightBC, title, fname)   update the artists and save
+    '''
+
+    def __init__(self, size=(8.0, 6.0), dpi=100):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.fig = Figure(figsize=size, dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.axes = self.fig.add_subplot(211)
+        self.axes2 = self.fig.add_subplot(212, sharex=self.axes)
+        self.beamline, = self.axes.plot([], [], '-k')
+        self.supportline, = self.axes.plot([], [], '-b')
+        self.responseline, = self.axes2.plot([], [], '-r')
+        self.axes.axis('equal')
+        self.title = self.fig.suptitle('')
+
+    def render(self, x, y, L, leftBC, rightBC, title, fname):
+        supports = []
+        if (leftBC, rightBC) in STABLE_CASES:
+            supports = [(0.0, leftBC), (L, rightBC)]
+        self.beamline.set_data([0.0, L], [0.0, 0.0])
+        self.supportline.set_data(*supportGlyphs(supports, L / 20.))
+        self.axes.relim()
+        self.axes.autoscale_view()
+
+        self.responseline.set_data(x, y)
+        lo, hi = y.min(), y.max()
+        pad = 0.05 * (hi - lo) or 0.05 * abs(hi) or 0.055
+        self.axes2.set_ylim(lo - pad, hi + pad)
+        self.axes2.set_ylabel(title[1])
+        self.title.set_text(title[0])
+        self.fig.savefig(fname)
+
+
+def _initWorker(size, dpi):
+    global _plot
+    _plot = ReportFigure(size, dpi)
+
+
+def _fileName(case, k):
+    # case id made safe for a file name, the running case number if there is none
+    # (or if the line could not even be read as a case)
+    caseid = case.get('id') if isinstance(case, dict) else ''
+    name = re.sub(r'[^\w.-]+', '_', str(caseid or '').strip())
+    return name or 'case%06d' % k
+
+
+def uniqueNames(cases):
+    '''
+    Yield (case, file name base) for an iterable of cases. A repeated id, or two
+    ids that only differ in characters a file name cannot hold, gets -2, -3, ...
+    appended, so no case overwrites the figures of another.
+    '''
+    seen = set()
+    for k, case in enumerate(cases):
+        base = name = _fileName(case, k)
+        n = 1
+        while name.lower() in seen:
+            n += 1
+            name = '%s-%d' % (base, n)
+        seen.add(name.lower())
+        yield case, name
+
+
+def exportChunk(args):
+    '''
+    Render one chunk of raw case dicts in the current worker, start is the
+    number of the first case in the input. Returns (files written, errors) with
+    errors a list of (case number, message) for the cases that were skipped.
+    '''
+    rows, start, names, outdir, fmt, plots, tol = args
+    L, W, E, I, left, right, errors = parseCases(rows)
+    outputs = [OUTPUTS.index(p) for p in plots]
+    good = errors == ''
+
+    files = []
+    # all cases with the same supports share their stations, solve them together
+    for l, r in set(zip(left[good].tolist(), right[good].tolist())):
+        group = np.flatnonzero(good & (left == l) & (right == r))
+        res = solveBeams(L[group], W[group], E[group], I[group], l, r, xi=adaptiveStations(l, r, tol))
+        for j, k in enumerate(group):
+            base = names[k]
+            title = '%s   L = %g, W = %g, E = %g, I = %g' % (base, L[k], W[k], E[k], I[k])
+            for o in outputs:
+                fname = os.path.join(outdir, '%s_%s.%s' % (base, OUTPUTS[o], fmt))
+                _plot.render(res.x[j], res[o][j], L[k], l, r, (title, OUTPUTS[o]), fname)
+                files.append(fname)
+    return files, [(start + k, errors[k]) for k in np.flatnonzero(~good)]
+
+
+def exportFigures(cases, outdir, fmt='png', plots=('deflection',), size=(8.0, 6.0), dpi=100,
+                  tol=1e-3, chunksize=50, processes=None, errors=None):
+    '''
+    Render an iterable of case dicts to outdir and yield the file names as each
+    chunk finishes. One file per case and response, named <id>_<response>.<fmt>,
+    see uniqueNames for repeated ids.
+    Cases that cannot be solved are skipped like BatchRunner does, (case number,
+    message) of each is appended to the list errors if one is given.
+    '''
+    if fmt not in FORMATS:
+        raise ValueError('format must be one of %s' % ', '.join(FORMATS))
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+    plots = tuple(plots)
+
+    def tasks():
+        # names are made unique here, across all chunks, before the workers see them
+        start = 0
+        for chunk in chunked(uniqueNames(cases), chunksize):
+            rows, names = zip(*chunk)
+            yield (list(rows), start, names, outdir, fmt, plots, tol)
+            start += len(rows)
+
+    for files, bad in imapBounded(exportChunk, tasks(), processes, _initWorker, (size, dpi)):
+        if errors is not None:
+            errors.extend(bad)
+        for fname in files:
+            yield fname
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export beam plots for many cases.')
+    parser.add_argument('input', nargs='?', default='-', help='csv or jsonl file, - for stdin')
+    parser.add_argument('-d', '--outdir', default='plots', help='directory for the figures')
+    parser.add_argument('--input-format', choices=('csv', 'jsonl'))
+    parser.add_argument('--format', choices=FORMATS, default='png')
+    parser.add_argument('--plots', nargs='+', choices=OUTPUTS, default=['deflection'])
+    parser.add_argument('--size', type=float, nargs=2, default=(8.0, 6.0), help='inches')
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--chunksize', type=int, default=50)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not list the files written')
+    args = parser.parse_args(argv)
+
+    fin = sys.stdin if args.input == '-' else open(args.input, newline='')
+    try:
+        cases = readCases(fin, _format(args.input, args.input_format))
+        count = 0
+        errors = []
+        for fname in exportFigures(cases, args.outdir, args.format, args.plots, tuple(args.size),
+                                   args.dpi, chunksize=args.chunksize, processes=args.processes,
+                                   errors=errors):
+            count += 1
+            if not args.quiet:
+                print(fname)
+        for k, error in errors:
+            print('case %d skipped: %s' % (k, error), file=sys.stderr)
+        print('%d figures written to %s, %d cases skipped' % (count, args.outdir, len(errors)),
+              file=sys.stderr)
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+
+
+if __name__ == '__main__':
+    main()
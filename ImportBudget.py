@@ -0,0 +1,83 @@
+# Import time budget for the headless modules
+# Every module is imported in a fresh interpreter, timed, and checked for GUI imports
+#
+# usage: python ImportBudget.py [--budget-ms 300] [--json]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HEADLESS_MODULES = ('BeamSolver', 'BeamLoads', 'BeamFEM', 'BeamNonPrismatic', 'BeamMoving', 'BeamCombos',
+                    'SectionProperties', 'SectionGeometry', 'ShapeCatalog', 'BatchRunner', 'FigureExport',
+                    'BeamSweep', 'BeamReliability', 'ResultStore', 'SolveServer', 'FinalProject')
+
+# none of these may be loaded by a headless import
+GUI_MODULES = ('PyQt5', 'matplotlib')
+
+_PROBE = '''
+import sys, time, json
+t = time.perf_counter()
+import %s
+dt = time.perf_counter() - t
+gui = sorted(set(m.split('.')[0] for m in sys.modules) & set(%r))
+print(json.dumps({'seconds': dt, 'gui': gui}))
+'''
+
+
+def measureImport(module, python=sys.executable):
+    '''
+    Import module in a fresh interpreter.
+    Returns a dict with the import time in ms, any GUI packages it loaded and
+    the five slowest imports it triggered (from python -X importtime).
+    '''
+    here = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run([python, '-X', 'importtime', '-c', _PROBE % (module, GUI_MODULES)],
+                          cwd=here, capture_output=True, text=True, check=True)
+    probe = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    slowest = []
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if not line.startswith('import time:') or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        if name.startswith(module) or name == module:
+            continue
+        slowest.append((int(parts[1]) / 1000.0, name))
+    slowest.sort(reverse=True)
+
+    return {'module': module,
+            'ms': probe['seconds'] * 1000.0,
+            'gui': probe['gui'],
+            'slowest': [{'ms': ms, 'module': name} for ms, name in slowest[:5]]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the import time of the headless modules.')
+    parser.add_argument('--budget-ms', type=float, default=300.0)
+    parser.add_argument('--json', action='store_true', help='print the measurements as json')
+    parser.add_argument('modules', nargs='*', default=HEADLESS_MODULES)
+    args = parser.parse_args(argv)
+
+    results = [measureImport(m) for m in args.modules]
+    failed = [r for r in results if r['ms'] > args.budget_ms or r['gui']]
+
+    if args.json:
+        print(json.dumps({'budget_ms': args.budget_ms, 'results': results}, indent=2))
+    else:
+        for r in results:
+            status = 'ok' if r not in failed else 'OVER BUDGET' if not r['gui'] else 'LOADS ' + ','.join(r['gui'])
+            print('%-20s %8.1f ms   %s' % (r['module'], r['ms'], status))
+            if r in failed:
+                for s in r['slowest']:
+                    print('    %8.1f ms  %s' % (s['ms'], s['module']))
+        print('budget %.0f ms per module' % args.budget_ms)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
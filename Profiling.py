@@ -0,0 +1,68 @@
+# Opt-in phase timing for the canvas (and anything else that wants it)
+# Timings go into a fixed size ring buffer; when switched off, phase() hands back
+# a shared do-nothing context manager so the cost is one attribute check
+
+import collections
+import contextlib
+import json
+import time
+
+_OFF = contextlib.nullcontext()
+
+
+class PhaseTimer(object):
+    '''
+    variables:
+    self.enabled        record timings or not
+    self.records        ring buffer of (timestamp, phase, seconds)
+    methods:
+    def __init__ (self, size, enabled)
+    def phase (self, name)          context manager timing one phase
+    def add (self, name, seconds)   record a phase timed elsewhere
+    def summary (self)              count, mean, max and last time of every phase
+    def clear (self)
+    def exportJSON (self, fname)    write the summary and all records to a json file
+    '''
+
+    def __init__(self, size=1000, enabled=False):
+        self.enabled = enabled
+        self.records = collections.deque(maxlen=size)
+
+    def phase(self, name):
+        if not self.enabled:
+            return _OFF
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append((time.time(), name, time.perf_counter() - t))
+
+    def add(self, name, seconds):
+        if self.enabled:
+            self.records.append((time.time(), name, seconds))
+
+    def clear(self):
+        self.records.clear()
+
+    def summary(self):
+        out = collections.OrderedDict()
+        for stamp, name, seconds in self.records:
+            s = out.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0, 'last': 0.0})
+            s['count'] += 1
+            s['total'] += seconds
+            s['max'] = max(s['max'], seconds)
+            s['last'] = seconds
+        for s in out.values():
+            s['mean'] = s['total'] / s['count']
+        return out
+
+    def exportJSON(self, fname):
+        data = {'summary': self.summary(),
+                'records': [{'time': stamp, 'phase': name, 'seconds': seconds}
+                            for stamp, name, seconds in self.records]}
+        with open(fname, 'w') as f:
+            json.dump(data, f, indent=2)
@@ -1,6 +1,8 @@
 # Class used for calculating moment of inertia for rectangular section
 # By Yashar Zafari
 
+from SectionProperties import rectangleProperties
+
 class RectangleI(object):
     '''
     variables:
@@ -9,12 +11,17 @@ class RectangleI(object):
     methods:
     def __init__ (self, w, h)
     def getIrect (self, w, h)
+    def getProperties (self)        A, I, S, r and Z, w and h may be arrays
     '''
 
+    __slots__ = ('w', 'h')
+
     def __init__(self, w = 0.0, h = 0.0):
         self.w = w
         self.h = h
 
     def getIrect(self):
-        i = self.w * self.h * self.h * self.h / 12
-        return i
\ No newline at end of file
+        return self.getProperties().I
+
+    def getProperties(self):
+        return rectangleProperties(self.w, self.h)
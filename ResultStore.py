@@ -0,0 +1,129 @@
+# On-disk store for the full response curves of many beams
+# One raw binary file per column, rows are appended and read back through np.memmap,
+# so a store can be far larger than memory and any case is a zero-copy view.
+# meta.json holds the layout and the number of committed rows; it is rewritten
+# after the columns, so a crash mid-append never exposes a half written row.
+
+import json
+import os
+
+import numpy as np
+
+from BeamSolver import BeamResponses, solveBeams, OUTPUTS, STABLE_CASES
+
+# per case parameters (the metadata index) and their dtypes
+PARAMS = (('L', np.float64), ('W', np.float64), ('E', np.float64), ('I', np.float64),
+          ('leftBC', np.int8), ('rightBC', np.int8))
+
+
+class ResultStore(object):
+    '''
+    variables:
+    self.path           directory holding the columns
+    self.dtype          dtype of the response columns (float32 or float64)
+    self.xi             stations as fractions of L, shared by every case
+    self.count          number of stored cases
+    methods:
+    def __init__ (self, path, n, dtype)     open a store, or create one with n even stations
+    def __len__ (self)
+    def __getitem__ (self, column)          memory-mapped column: a parameter (count,)
+                                            or a response (count, len(xi))
+    def append (self, params, res)          add a batch of solved cases
+    def appendBeams (self, L, W, E, I, leftBC, rightBC, chunk)   solve and add
+    def responses (self, i)                 BeamResponses of case i, views into the file
+    def supports (self, i)                  (x, code) list of case i, for the canvas
+    '''
+
+    def __init__(self, path, n=50, dtype=np.float32):
+        self.path = path
+        meta = os.path.join(path, 'meta.json')
+        if os.path.exists(meta):
+            with open(meta) as f:
+                info = json.load(f)
+            self.dtype = np.dtype(info['dtype'])
+            self.xi = np.array(info['xi'])
+            self.count = info['count']
+        else:
+            if not os.path.isdir(path):
+                os.makedirs(path)
+            self.dtype = np.dtype(dtype)
+            self.xi = np.linspace(0.0, 1.0, n)
+            self.count = 0
+            for name in self._columns():
+                open(self._file(name), 'wb').close()
+            self._writeMeta()
+        self._maps = {}
+
+    def _columns(self):
+        return [name for name, dt in PARAMS] + list(OUTPUTS)
+
+    def _file(self, name):
+        return os.path.join(self.path, name + '.bin')
+
+    def _rowShape(self, name):
+        # dtype and shape of one row of a column
+        params = dict(PARAMS)
+        if name in params:
+            return np.dtype(params[name]), ()
+        return self.dtype, (len(self.xi),)
+
+    def _writeMeta(self):
+        tmp = os.path.join(self.path, 'meta.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'dtype': self.dtype.name, 'xi': self.xi.tolist(), 'count': self.count}, f)
+        os.replace(tmp, os.path.join(self.path, 'meta.json'))
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, column):
+        if column not in self._maps:
+            dt, shape = self._rowShape(column)
+            if self.count == 0:
+                self._maps[column] = np.zeros((0,) + shape, dtype=dt)
+            else:
+                self._maps[column] = np.memmap(self._file(column), dt, 'r', shape=(self.count,) + shape)
+        return self._maps[column]
+
+    def append(self, params, res):
+        '''
+        Append a batch of cases. params maps every name in PARAMS to an array of
+        one value per case, res holds their responses on the store's stations,
+        shape (cases, len(xi)) (e.g. from solveBeams(..., xi=store.xi)).
+        '''
+        n = len(np.atleast_1d(params['L']))
+        self._maps = {}
+        for name in self._columns():
+            dt, shape = self._rowShape(name)
+            value = params[name] if name in params else getattr(res, name)
+            rows = np.ascontiguousarray(np.broadcast_to(np.asarray(value, dtype=dt), (n,) + shape))
+            with open(self._file(name), 'r+b') as f:
+                # drop anything an interrupted append left behind the committed rows
+                f.truncate(self.count * dt.itemsize * int(np.prod(shape)))
+                f.seek(0, os.SEEK_END)
+                rows.tofile(f)
+        self.count += n
+        self._writeMeta()
+
+    def appendBeams(self, L, W, E, I, leftBC, rightBC, chunk=10000):
+        '''
+        Solve and append any number of beams (arrays or scalars, broadcast like
+        solveBeams), chunk cases at a time so memory stays bounded.
+        '''
+        cols = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v)) for v in (L, W, E, I, leftBC, rightBC)])
+        for k in range(0, len(cols[0]), chunk):
+            c = [v[k:k + chunk] for v in cols]
+            res = solveBeams(c[0], c[1], c[2], c[3], c[4], c[5], xi=self.xi)
+            self.append(dict(zip([name for name, dt in PARAMS], c)), res)
+
+    def responses(self, i):
+        x = float(self['L'][i]) * self.xi
+        return BeamResponses(x, *[self[name][i] for name in OUTPUTS])
+
+    def supports(self, i):
+        L = float(self['L'][i])
+        l = int(self['leftBC'][i])
+        r = int(self['rightBC'][i])
+        if (l, r) not in STABLE_CASES:
+            return []
+        return [(0.0, l), (L, r)]
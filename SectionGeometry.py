@@ -0,0 +1,264 @@
+# Section properties of arbitrary polygons and composite sections
+# A section is a set of closed polygons (rings), each with a weight: 1 for material,
+# -1 for a hole, or a modular ratio for a transformed composite section. Every
+# property is a sum of Green's theorem edge integrals, evaluated for all edges of
+# all rings at once. Results are memoized by a hash of the geometry, so a shape
+# used again (re-picked in the GUI, or shared by thousands of beams) is free.
+
+import functools
+import hashlib
+
+import numpy as np
+
+from SectionProperties import SectionProperties
+
+
+class Section(object):
+    '''
+    variables:
+    self.rings          tuple of read-only (n, 2) vertex arrays, either orientation
+    self.weights        tuple of ring weights (1 material, -1 hole, n transformed)
+    self.key            digest of the geometry, used for hashing and equality
+    methods:
+    def __init__ (self, rings, weights)
+    def __add__ (self, other)           composite of both sections
+    def shifted (self, dx, dy)          same section moved by dx, dy
+    def withHole (self, points)         same section with a polygonal hole
+    def properties (self)               memoized PolygonProperties
+    '''
+
+    __slots__ = ('rings', 'weights', 'key')
+
+    def __init__(self, rings, weights=None):
+        rings = [np.array(r, dtype=float).reshape(-1, 2) for r in rings]
+        for r in rings:
+            r.setflags(write=False)
+        self.rings = tuple(rings)
+        self.weights = tuple(float(w) for w in (weights if weights is not None else [1.0] * len(rings)))
+        if len(self.weights) != len(self.rings):
+            raise ValueError('need one weight per ring')
+        digest = hashlib.sha1()
+        for r, w in zip(self.rings, self.weights):
+            digest.update(np.float64(w).tobytes())
+            digest.update(np.int64(len(r)).tobytes())
+            digest.update(np.ascontiguousarray(r).tobytes())
+        self.key = digest.hexdigest()
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, Section) and self.key == other.key
+
+    def __add__(self, other):
+        return Section(self.rings + other.rings, self.weights + other.weights)
+
+    def shifted(self, dx, dy):
+        return Section([r + (dx, dy) for r in self.rings], self.weights)
+
+    def withHole(self, points):
+        return self + Section([points], [-1.0])
+
+    def properties(self):
+        return sectionProperties(self)
+
+
+class PolygonProperties(object):
+    '''
+    Properties of one section, axes through the centroid
+    variables:
+    self.A              area (weighted)
+    self.xc, self.yc    centroid
+    self.Ix, self.Iy    moments of inertia about the horizontal and vertical axes
+    self.Ixy            product of inertia
+    self.Sx, self.Sy    smallest elastic section moduli (to the farthest fiber)
+    self.Zx, self.Zy    plastic section moduli (about the equal area axes)
+    self.rx, self.ry    radii of gyration
+    methods:
+    def strongAxis (self)       SectionProperties about x, like rectangleProperties
+    '''
+
+    __slots__ = ('A', 'xc', 'yc', 'Ix', 'Iy', 'Ixy', 'Sx', 'Sy', 'Zx', 'Zy', 'rx', 'ry')
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values[name])
+
+    def strongAxis(self):
+        return SectionProperties(self.A, self.Ix, self.Sx, self.rx, self.Zx)
+
+
+def _edges(section):
+    # flat edge arrays of all rings; the weight of every edge carries the
+    # orientation of its ring, so clockwise and counterclockwise rings both work
+    x0, y0, x1, y1, w = [], [], [], [], []
+    for ring, weight in zip(section.rings, section.weights):
+        x, y = ring[:, 0], ring[:, 1]
+        xn, yn = np.roll(x, -1), np.roll(y, -1)
+        sign = np.sign(np.sum(x * yn - xn * y))
+        x0.append(x)
+        y0.append(y)
+        x1.append(xn)
+        y1.append(yn)
+        w.append(np.full(len(x), weight * sign))
+    return [np.concatenate(v) for v in (x0, y0, x1, y1, w)]
+
+
+def _below(x0, y0, x1, y1, w, t):
+    '''
+    Area below each horizontal line y = t and its first moment about that line,
+    integrating (t - y) dx and (t - y)^2 / 2 dx along the part of every edge
+    under the line. Arrays of shape (len(t),).
+    '''
+    t = np.asarray(t, dtype=float)[:, None]
+    dy = y1 - y0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xi = np.where(dy != 0, x0 + (t - y0) * (x1 - x0) / np.where(dy != 0, dy, 1.0), x0)
+    xa = np.where(y0 <= t, x0, xi)
+    xb = np.where(y1 <= t, x1, xi)
+    a = t - np.minimum(y0, t)
+    b = t - np.minimum(y1, t)
+    dx = xb - xa
+    A = (w * dx * (a + b)).sum(axis=1) / 2
+    Q = (w * dx * (a * a + a * b + b * b)).sum(axis=1) / 6
+    return A, Q
+
+
+def _plastic(x0, y0, x1, y1, w, A, Qy):
+    # plastic modulus about the horizontal axis that splits the area in half;
+    # the area below a line is quadratic in its height between two vertex
+    # levels, so the axis comes from one quadratic in the right interval
+    levels = np.unique(np.concatenate((y0, y1)))
+    Ab, Qb = _below(x0, y0, x1, y1, w, levels)
+    k = int(np.clip(np.searchsorted(Ab, A / 2), 1, len(levels) - 1))
+    lo, hi = levels[k - 1], levels[k]
+    f0, fm, f1 = _below(x0, y0, x1, y1, w, [lo, (lo + hi) / 2, hi])[0] - A / 2
+    c2 = 2 * f0 - 4 * fm + 2 * f1
+    c1 = -3 * f0 + 4 * fm - f1
+    if abs(c2) < 1e-12 * max(abs(c1), 1e-300):
+        u = -f0 / c1 if c1 != 0 else 0.5
+    else:
+        disc = np.sqrt(max(c1 * c1 - 4 * c2 * f0, 0.0))
+        roots = np.array([(-c1 + disc) / (2 * c2), (-c1 - disc) / (2 * c2)])
+        u = roots[np.argmin(np.abs(roots - np.clip(roots, 0.0, 1.0)))]
+    yp = lo + float(np.clip(u, 0.0, 1.0)) * (hi - lo)
+    # Z = first moment of the area below plus the area above, both about yp
+    return 2 * _below(x0, y0, x1, y1, w, [yp])[1][0] + Qy - yp * A
+
+
+@functools.lru_cache(maxsize=1024)
+def sectionProperties(section):
+    '''
+    PolygonProperties of a Section, memoized by its geometry hash.
+    '''
+    x0, y0, x1, y1, w = _edges(section)
+    c = w * (x0 * y1 - x1 * y0)
+    A = c.sum() / 2
+    if A <= 0:
+        raise ValueError('section has no area')
+    Qx = (c * (x0 + x1)).sum() / 6
+    Qy = (c * (y0 + y1)).sum() / 6
+    Ixx = (c * (y0 * y0 + y0 * y1 + y1 * y1)).sum() / 12
+    Iyy = (c * (x0 * x0 + x0 * x1 + x1 * x1)).sum() / 12
+    Ixy = (c * (x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0)).sum() / 24
+    xc = Qx / A
+    yc = Qy / A
+    Ix = Ixx - A * yc * yc
+    Iy = Iyy - A * xc * xc
+
+    # extreme fibers of the material rings
+    solid = np.concatenate([r for r, wt in zip(section.rings, section.weights) if wt > 0])
+    cy = max(solid[:, 1].max() - yc, yc - solid[:, 1].min())
+    cx = max(solid[:, 0].max() - xc, xc - solid[:, 0].min())
+
+    return PolygonProperties(
+        A=A, xc=xc, yc=yc, Ix=Ix, Iy=Iy, Ixy=Ixy - A * xc * yc,
+        Sx=Ix / cy, Sy=Iy / cx,
+        # swapping x and y mirrors the rings, which flips their orientation
+        Zx=_plastic(x0, y0, x1, y1, w, A, Qy), Zy=_plastic(y0, x0, y1, x1, -w, A, Qx),
+        rx=np.sqrt(Ix / A), ry=np.sqrt(Iy / A))
+
+
+def _box(x0, y0, x1, y1):
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+
+def polygon(points):
+    return Section([points])
+
+
+def rectangle(w, h):
+    '''
+    Solid w x h rectangle centered on the origin.
+    '''
+    return Section([_box(-w / 2., -h / 2., w / 2., h / 2.)])
+
+
+def wideflange(flanget, webt, w, h, fillet=0.0, n=8):
+    '''
+    Doubly symmetric I-shape centered on the origin, same arguments as
+    WideflangeI, plus the web to flange fillet radius (n segments per fillet).
+    '''
+    fy = h / 2. - flanget
+    rings = [_box(-w / 2., fy, w / 2., h / 2.), _box(-w / 2., -h / 2., w / 2., -fy),
+             _box(-webt / 2., -fy, webt / 2., fy)]
+    if fillet > 0:
+        a = np.linspace(0.0, np.pi / 2, n + 1)
+        for sx in (1, -1):
+            for sy in (1, -1):
+                # the corner between web face and flange, then the arc from the
+                # flange back to the web
+                xw, yf = sx * webt / 2., sy * fy
+                arc = np.column_stack((xw + sx * fillet * (1 - np.sin(a)), yf - sy * fillet * (1 - np.cos(a))))
+                rings.append(np.vstack(([xw, yf], arc)))
+    return Section(rings)
+
+
+def channel(flanget, webt, w, h):
+    '''
+    Channel with the web on the left (back at x = 0), flanges pointing right,
+    centered on y = 0. w = total flange width, h = total height.
+    '''
+    fy = h / 2. - flanget
+    return Section([[(0, -h / 2.), (w, -h / 2.), (w, -fy), (webt, -fy),
+                     (webt, fy), (w, fy), (w, h / 2.), (0, h / 2.)]])
+
+
+def tube(w, h, t):
+    '''
+    Rectangular hollow section w x h with wall thickness t, square corners.
+    '''
+    return rectangle(w, h).withHole(_box(-w / 2. + t, -h / 2. + t, w / 2. - t, h / 2. - t))
+
+
+def pipe(d, t=None, n=128):
+    '''
+    Round bar (t None) or pipe of outside diameter d as regular n-gons,
+    I is about 0.1% low for n = 128 and converges as 1 / n^2.
+    '''
+    a = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+    ring = np.column_stack((np.cos(a), np.sin(a)))
+    s = Section([ring * d / 2.])
+    if t is not None:
+        s = s.withHole(ring * (d / 2. - t))
+    return s
+
+
+def parseSection(text):
+    '''
+    Section from text: one "x y" (or "x, y") vertex per line, rings separated by
+    blank lines. A ring whose first line is "hole" is cut out, one whose first
+    line is a single number is a transformed ring with that weight.
+    '''
+    rings, weights = [], []
+    for block in text.strip().split('\n\n'):
+        lines = [line.replace(',', ' ').split() for line in block.strip().splitlines() if line.strip()]
+        weight = 1.0
+        if lines and len(lines[0]) == 1:
+            weight = -1.0 if lines[0][0].lower() == 'hole' else float(lines[0][0])
+            lines = lines[1:]
+        if len(lines) < 3:
+            raise ValueError('a ring needs at least 3 vertices')
+        rings.append([(float(x), float(y)) for x, y in lines])
+        weights.append(weight)
+    return Section(rings, weights)
@@ -0,0 +1,86 @@
+# Section properties for whole catalogs of rectangles and wide flanges in one call
+# All functions take scalars or NumPy arrays of dimensions. This is the one source
+# of I for the parametric shapes: the GUI dialogs, sweeps and Monte Carlo all go
+# through SECTIONS. SectionGeometry covers arbitrary polygons and hands its strong
+# axis results back as a SectionProperties.
+
+import numpy as np
+
+
+class SectionProperties(object):
+    '''
+    Struct of arrays, one entry per section
+    variables:
+    self.A              area
+    self.I              strong axis moment of inertia
+    self.S              elastic section modulus
+    self.r              radius of gyration
+    self.Z              plastic section modulus
+    methods:
+    def __init__ (self, A, I, S, r, Z)
+    def __len__ (self)
+    def __getitem__ (self, idx)         properties of a subset of the sections
+    '''
+
+    __slots__ = ('A', 'I', 'S', 'r', 'Z')
+
+    def __init__(self, A, I, S, r, Z):
+        self.A = A
+        self.I = I
+        self.S = S
+        self.r = r
+        self.Z = Z
+
+    def __len__(self):
+        return np.size(self.A)
+
+    def __getitem__(self, idx):
+        return SectionProperties(self.A[idx], self.I[idx], self.S[idx], self.r[idx], self.Z[idx])
+
+
+def rectangleProperties(w, h):
+    '''
+    Solid rectangle of width w and height h, bending about the width axis.
+    '''
+    w = np.asarray(w, dtype=float)
+    h = np.asarray(h, dtype=float)
+    A = w * h
+    wh2 = A * h
+    I = wh2 * h / 12
+    S = wh2 / 6
+    r = h / np.sqrt(12.0)
+    Z = wh2 / 4
+    return SectionProperties(A, I, S, r, Z)
+
+
+def wideflangeProperties(flanget, webt, w, h):
+    '''
+    Doubly symmetric I-shape without fillets, same arguments as WideflangeI.
+    flanget = flange thickness, webt = web thickness, w = total width, h = total height
+    '''
+    ft = np.asarray(flanget, dtype=float)
+    wt = np.asarray(webt, dtype=float)
+    w = np.asarray(w, dtype=float)
+    h = np.asarray(h, dtype=float)
+    lh = h - 2 * ft
+    lh2 = lh * lh
+    A = 2 * w * ft + wt * lh
+    I = wt * lh2 * lh / 12.0 + (w / 12.0) * (h * h * h - lh2 * lh)
+    S = I / (h / 2)
+    r = np.sqrt(I / A)
+    Z = w * ft * (h - ft) + wt * lh2 / 4
+    return SectionProperties(A, I, S, r, Z)
+
+
+# section types with closed forms, with the dimension names in argument order
+SECTIONS = {'rectangle': (rectangleProperties, ('w', 'h')),
+            'wideflange': (wideflangeProperties, ('flanget', 'webt', 'w', 'h'))}
+
+
+def namedSection(kind, dims):
+    '''
+    SectionProperties of a section type in SECTIONS, dims maps every dimension
+    name to a number or an array.
+    '''
+    props, names = SECTIONS[kind]
+    return props(*[dims[n] for n in names])
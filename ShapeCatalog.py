@@ -0,0 +1,164 @@
+# Catalog of standard steel and timber beam shapes
+# The bundled shapes.csv is compiled once into one .npy file per column, which are
+# then memory-mapped, so opening the catalog costs next to nothing. The compiled
+# columns live in the user cache directory, in a subdirectory named after the
+# digest of the csv, and only ever appear there complete (see compileCatalog).
+
+import csv
+import hashlib
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from BeamSolver import peaks, DEFLECTION
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SHAPES_CSV = os.path.join(_HERE, 'shapes.csv')
+
+def _userCacheDir():
+    # XDG_CACHE_HOME or ~/.cache, LOCALAPPDATA on Windows
+    root = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+    if not root:
+        root = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'beam-solver', 'shapes')
+
+
+CACHE_DIR = _userCacheDir()
+
+TEXT_COLUMNS = ('name', 'material')
+NUMBER_COLUMNS = ('weight', 'A', 'd', 'bf', 'tf', 'tw', 'Ix', 'Sx', 'Zx')
+
+# E (ksi) of the catalog materials, same values as the material combo box
+MATERIAL_E = {'steel': 29000.0, 'wood': 1900.0}
+
+
+def catalogDir(csvpath=SHAPES_CSV, cachedir=CACHE_DIR):
+    '''
+    Directory the columns of csvpath are compiled into: named after the digest
+    of the csv, so an edited csv gets a fresh compile next to the old one.
+    '''
+    with open(csvpath, 'rb') as f:
+        return os.path.join(cachedir, hashlib.sha1(f.read()).hexdigest()[:16])
+
+
+def compileCatalog(csvpath=SHAPES_CSV, outdir=None):
+    '''
+    Convert a shape csv into columnar .npy files plus the search indexes.
+    For every material the shapes are sorted by Ix and "best" holds the lightest
+    shape among all shapes at or after each position, so the lightest shape with
+    Ix >= I_required is best[searchsorted(Ix_sorted, I_required)].
+    Everything is written to a temporary directory next to outdir, which is then
+    renamed to outdir in one step, so a reader never sees a half written file.
+    If outdir already exists (another process compiled the same csv first), it
+    is kept and the new copy discarded. outdir defaults to catalogDir(csvpath).
+    '''
+    if outdir is None:
+        outdir = catalogDir(csvpath)
+    with open(csvpath) as f:
+        rows = list(csv.DictReader(line for line in f if not line.startswith('#')))
+
+    parent = os.path.dirname(os.path.abspath(outdir))
+    if not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
+    tmpdir = tempfile.mkdtemp(prefix='.compiling-', dir=parent)
+    try:
+        _writeColumns(rows, tmpdir)
+        os.replace(tmpdir, outdir)
+    except OSError:
+        if not os.path.isdir(outdir):
+            raise
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _writeColumns(rows, outdir):
+    cols = {}
+    for name in TEXT_COLUMNS:
+        cols[name] = np.array([row[name] for row in rows])
+    for name in NUMBER_COLUMNS:
+        cols[name] = np.array([float(row[name]) if row[name] else np.nan for row in rows])
+    for name, col in cols.items():
+        np.save(os.path.join(outdir, name + '.npy'), col)
+
+    for material in np.unique(cols['material']):
+        rowid = np.flatnonzero(cols['material'] == material)
+        rowid = rowid[np.argsort(cols['Ix'][rowid], kind='stable')]
+        weight = cols['weight'][rowid]
+
+        # running minimum of the weight from the heaviest-Ix end backwards
+        best = np.empty(len(rowid), dtype=int)
+        lightest = len(rowid) - 1
+        for k in range(len(rowid) - 1, -1, -1):
+            if weight[k] <= weight[lightest]:
+                lightest = k
+            best[k] = rowid[lightest]
+
+        np.save(os.path.join(outdir, 'index_%s_Ix.npy' % material), cols['Ix'][rowid])
+        np.save(os.path.join(outdir, 'index_%s_best.npy' % material), best)
+
+
+class ShapeCatalog(object):
+    '''
+    variables:
+    self.path           directory holding the compiled columns
+    self.columns        dict of column name -> memory-mapped array
+    methods:
+    def __init__ (self, path)
+    def __len__ (self)
+    def __getitem__ (self, column)      one column, e.g. catalog['Ix']
+    def row (self, i)                   all values of one shape as a dict
+    def lightest (self, Ireq, material) row index of the lightest shape with Ix >= Ireq, -1 if none
+    path is the cache directory, csvpath is compiled into catalogDir(csvpath, path)
+    on first use. With csvpath None, path is an already compiled directory.
+    '''
+
+    def __init__(self, path=CACHE_DIR, csvpath=SHAPES_CSV):
+        if csvpath is not None:
+            path = catalogDir(csvpath, path)
+            if not os.path.isdir(path):
+                compileCatalog(csvpath, path)
+        self.path = path
+
+        self.columns = {}
+        for name in TEXT_COLUMNS + NUMBER_COLUMNS:
+            self.columns[name] = np.load(os.path.join(path, name + '.npy'), mmap_mode='r')
+        self._index = {}
+
+    def __len__(self):
+        return len(self.columns['name'])
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def row(self, i):
+        return dict((name, col[i]) for name, col in self.columns.items())
+
+    def _materialIndex(self, material):
+        if material not in self._index:
+            Ix = np.load(os.path.join(self.path, 'index_%s_Ix.npy' % material), mmap_mode='r')
+            best = np.load(os.path.join(self.path, 'index_%s_best.npy' % material), mmap_mode='r')
+            self._index[material] = (Ix, best)
+        return self._index[material]
+
+    def lightest(self, Ireq, material='steel'):
+        Ix, best = self._materialIndex(material)
+        pos = np.searchsorted(Ix, Ireq, side='left')
+        # append -1 so a requirement above the heaviest shape maps to "none"
+        return np.append(best, -1)[pos]
+
+
+def lightestForDeflection(L, W, leftBC, rightBC, limit=360.0, material='steel', catalog=None):
+    '''
+    Lightest catalog shape whose deflection stays within L/limit, for any number
+    of beams at once. Deflection scales with 1/I, so the required I comes straight
+    from the peak deflection of the same beam with I = 1.
+    Returns the catalog row indices (-1 where no shape is stiff enough).
+    '''
+    if catalog is None:
+        catalog = ShapeCatalog()
+    E = MATERIAL_E[material]
+    L = np.asarray(L, dtype=float)
+    Ireq = peaks(L, W, E, 1.0, leftBC, rightBC)[..., DEFLECTION] / (L / limit)
+    return catalog.lightest(Ireq, material)
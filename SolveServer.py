@@ -0,0 +1,373 @@
+# Local solve service: HTTP/JSON over TCP or a Unix socket, asyncio only
+# Concurrent requests are gathered into micro-batches and every batch is solved
+# with one vectorized peaks/reactions call. A bounded queue gives backpressure
+# (503 when full) and /metrics reports throughput, batch sizes and latencies.
+#
+# usage: python SolveServer.py serve --port 8765
+#        python SolveServer.py test --requests 20000 --concurrency 200
+#
+# POST /solve   {"L": 240, "W": 0.1, "E": 29000, "I": 500, "leftBC": 1, "rightBC": 1}
+#               (fields as in BatchRunner, add "curves": true for 50 point curves)
+# GET  /metrics
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import numpy as np
+
+from BeamSolver import peaks, reactions, solveBeams, _STABLE, DEFLECTION, MOMENT
+from BatchRunner import caseArrays
+from Profiling import PhaseTimer
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class SolveServer(object):
+    '''
+    variables:
+    self.maxBatch       largest number of requests solved together
+    self.maxDelay       seconds a batch waits for more requests after the first one
+    self.maxQueue       requests waiting for a batch before new ones get a 503
+    self.maxBody        largest accepted request body in bytes
+    self.timer          latency (queue + solve) and batch solve times
+    methods:
+    def __init__ (self, maxBatch, maxDelay, maxQueue, maxBody)
+    async def start (self, host, port, unix)    listen on TCP, or on a Unix socket path
+    async def close (self)
+    def solveBatch (self, params, curves)       one vectorized solve for a whole batch
+    def metrics (self)                          counters and latency percentiles as a dict
+    '''
+
+    def __init__(self, maxBatch=1024, maxDelay=0.002, maxQueue=10000, maxBody=1 << 20):
+        self.maxBatch = maxBatch
+        self.maxDelay = maxDelay
+        self.maxQueue = maxQueue
+        self.maxBody = maxBody
+        self.timer = PhaseTimer(size=100000, enabled=True)
+        self.counts = {'requests': 0, 'solved': 0, 'rejected': 0, 'errors': 0, 'batches': 0}
+        self.started = time.perf_counter()
+        self._queue = None
+        self._server = None
+        self._batcher = None
+        self._connections = {}
+
+    async def start(self, host='127.0.0.1', port=8765, unix=None):
+        self._queue = asyncio.Queue(self.maxQueue)
+        self._batcher = asyncio.ensure_future(self._batchLoop())
+        if unix:
+            self._server = await asyncio.start_unix_server(self._handle, unix)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        self.started = time.perf_counter()
+        return self._server
+
+    async def close(self):
+        self._server.close()
+        # idle keep-alive connections would otherwise hold wait_closed forever
+        for writer in list(self._connections):
+            writer.close()
+        await asyncio.gather(*self._connections.values(), return_exceptions=True)
+        await self._server.wait_closed()
+        self._batcher.cancel()
+
+    # ---- HTTP ----
+
+    async def _handle(self, reader, writer):
+        # one connection, any number of keep-alive requests
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                parts = line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b'\r\n', b'\n', b''):
+                        break
+                    k, _, v = h.decode('latin-1').partition(':')
+                    headers[k.strip().lower()] = v.strip()
+                try:
+                    length = int(headers.get('content-length', 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # without a length the body cannot be skipped, drop the connection
+                    self._respond(writer, 400, {'error': 'bad Content-Length'}, close=True)
+                    break
+                if len(parts) < 2:
+                    status, body = 400, {'error': 'bad request line'}
+                elif length > self.maxBody:
+                    status, body = 413, {'error': 'body larger than %d bytes' % self.maxBody}
+                    self._respond(writer, status, body, close=True)
+                    break
+                else:
+                    data = await reader.readexactly(length) if length else b''
+                    status, body = await self._route(parts[0], parts[1], data)
+                close = headers.get('connection', '').lower() == 'close'
+                self._respond(writer, status, body, close)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    def _respond(self, writer, status, body, close=False):
+        data = json.dumps(body).encode()
+        head = ['HTTP/1.1 %d %s' % (status, _REASONS[status]),
+                'Content-Type: application/json',
+                'Content-Length: %d' % len(data),
+                'Connection: %s' % ('close' if close else 'keep-alive')]
+        if status == 503:
+            head.append('Retry-After: 1')
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode() + data)
+
+    async def _route(self, method, path, data):
+        if path == '/metrics':
+            return 200, self.metrics()
+        if path != '/solve':
+            return 404, {'error': 'unknown path %s' % path}
+        if method != 'POST':
+            return 405, {'error': 'use POST'}
+        self.counts['requests'] += 1
+        try:
+            case = json.loads(data.decode() or 'null')
+            # parse here, so a bad case (support codes outside 0..2 included)
+            # fails its own request and not the batch
+            params = np.array([v[0] for v in caseArrays([case])], dtype=float)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.counts['errors'] += 1
+            return 400, {'error': '%s: %s' % (type(e).__name__, e)}
+
+        done = asyncio.get_event_loop().create_future()
+        try:
+            self._queue.put_nowait((params, bool(case.get('curves')), done, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.counts['rejected'] += 1
+            return 503, {'error': 'queue full, retry later'}
+        try:
+            return 200, await done
+        except Exception as e:
+            # the batch this case was in failed, see _batchLoop
+            return 500, {'error': '%s: %s' % (type(e).__name__, e)}
+
+    # ---- batching ----
+
+    async def _batchLoop(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.maxDelay
+            while len(batch) < self.maxBatch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                wait = deadline - loop.time()
+                if wait <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), wait))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                with self.timer.phase('batch'):
+                    results = self.solveBatch(np.array([b[0] for b in batch]),
+                                              np.array([b[1] for b in batch]))
+            except Exception as e:
+                # fail the requests of this batch only, the loop keeps serving
+                for params, curves, done, t0 in batch:
+                    if not done.cancelled():
+                        done.set_exception(e)
+                self.counts['errors'] += len(batch)
+                continue
+            now = time.perf_counter()
+            for (params, curves, done, t0), result in zip(batch, results):
+                if not done.cancelled():
+                    done.set_result(result)
+                self.timer.add('latency', now - t0)
+            self.counts['batches'] += 1
+            self.counts['solved'] += len(batch)
+            # let the handlers write their responses before the next batch
+            await asyncio.sleep(0)
+
+    def solveBatch(self, params, curves):
+        '''
+        params is (cases, 6): L, W, E, I, leftBC, rightBC. Returns one result
+        dict per case, with the 50 point curves where curves is set.
+        '''
+        L, W, E, I = params[:, :4].T
+        left = params[:, 4].astype(int)
+        right = params[:, 5].astype(int)
+        peak = peaks(L, W, E, I, left, right)
+        react = reactions(L, W, left, right)
+        stable = _STABLE[left, right]
+
+        out = [{'stable': bool(stable[k]),
+                'maxDeflection': float(peak[k, DEFLECTION]),
+                'maxMoment': float(peak[k, MOMENT]),
+                'reactions': react[k].tolist()} for k in range(len(L))]
+        if curves.any():
+            k = np.flatnonzero(curves)
+            res = solveBeams(L[k], W[k], E[k], I[k], left[k], right[k])
+            for j, kk in enumerate(k):
+                out[kk]['curves'] = dict((name, getattr(res, name)[j].tolist())
+                                         for name in ('x', 'deflection', 'rotation', 'shear', 'moment'))
+        return out
+
+    def metrics(self):
+        lat = np.array([s for t, name, s in self.timer.records if name == 'latency'])
+        bat = self.timer.summary().get('batch', {})
+        up = time.perf_counter() - self.started
+        m = dict(self.counts)
+        m.update({'uptime_s': up,
+                  'throughput_per_s': self.counts['solved'] / up if up > 0 else 0.0,
+                  'queue_depth': self._queue.qsize() if self._queue else 0,
+                  'mean_batch': self.counts['solved'] / max(self.counts['batches'], 1),
+                  'batch_solve_ms': 1000 * bat.get('mean', 0.0)})
+        if len(lat):
+            p50, p95, p99 = np.percentile(lat, (50, 95, 99)) * 1000
+            m.update({'latency_ms': {'p50': p50, 'p95': p95, 'p99': p99, 'max': 1000 * lat.max()}})
+        return m
+
+
+class SolveClient(object):
+    '''
+    Minimal keep-alive HTTP/JSON client for the server, for tests and benchmarks.
+    methods:
+    async def connect (self)
+    async def request (self, method, path, body)    returns (status, json)
+    async def solve (self, case)
+    async def close (self)
+    '''
+
+    def __init__(self, host='127.0.0.1', port=8765, unix=None):
+        self.host = host
+        self.port = port
+        self.unix = unix
+
+    async def connect(self):
+        if self.unix:
+            self.reader, self.writer = await asyncio.open_unix_connection(self.unix)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else b''
+        self.writer.write(('%s %s HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n'
+                           'Content-Length: %d\r\n\r\n' % (method, path, len(data))).encode() + data)
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            h = await self.reader.readline()
+            if h in (b'\r\n', b''):
+                break
+            k, _, v = h.decode().partition(':')
+            if k.lower() == 'content-length':
+                length = int(v)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def solve(self, case):
+        return await self.request('POST', '/solve', case)
+
+    async def close(self):
+        self.writer.close()
+
+
+async def runClients(host, port, unix, requests, concurrency, seed=0):
+    '''
+    Fire requests random cases from concurrency connections at once and check
+    every answer against a direct peaks call. Returns the client side stats.
+    '''
+    rng = np.random.default_rng(seed)
+    cases = [{'L': float(rng.uniform(60, 480)), 'W': float(rng.uniform(0.01, 0.2)), 'E': 29000.0,
+              'I': float(rng.uniform(50, 2000)), 'leftBC': int(rng.integers(0, 3)),
+              'rightBC': int(rng.integers(0, 3)), 'curves': k % 100 == 0}
+             for k in range(requests)]
+    expect = peaks([c['L'] for c in cases], [c['W'] for c in cases], 29000.0,
+                   [c['I'] for c in cases], [c['leftBC'] for c in cases],
+                   [c['rightBC'] for c in cases])
+    latency = []
+    status = {}
+    bad = [0]
+
+    async def worker(ids):
+        client = SolveClient(host, port, unix)
+        await client.connect()
+        for k in ids:
+            t = time.perf_counter()
+            code, body = await client.solve(cases[k])
+            latency.append(time.perf_counter() - t)
+            status[code] = status.get(code, 0) + 1
+            if code == 200 and not np.isclose(body['maxMoment'], expect[k, MOMENT]):
+                bad[0] += 1
+        await client.close()
+
+    t = time.perf_counter()
+    await asyncio.gather(*[worker(range(c, requests, concurrency)) for c in range(concurrency)])
+    elapsed = time.perf_counter() - t
+    p50, p99 = np.percentile(latency, (50, 99)) * 1000
+    return {'requests': requests, 'concurrency': concurrency, 'seconds': elapsed,
+            'requests_per_s': requests / elapsed, 'status': status, 'mismatches': bad[0],
+            'client_latency_ms': {'p50': p50, 'p99': p99}}
+
+
+async def _test(args):
+    # server and clients in one process, nothing outside this machine is touched
+    server = SolveServer(args.max_batch, args.max_delay_ms / 1000.0, args.max_queue)
+    await server.start(args.host, args.port, args.unix)
+    try:
+        stats = await runClients(args.host, args.port, args.unix, args.requests, args.concurrency)
+        client = SolveClient(args.host, args.port, args.unix)
+        await client.connect()
+        stats['server'] = (await client.request('GET', '/metrics'))[1]
+        stats['bad_request'] = (await client.solve({'L': 'x'}))[0]
+        await client.close()
+    finally:
+        await server.close()
+    print(json.dumps(stats, indent=2))
+    return 0 if stats['mismatches'] == 0 else 1
+
+
+async def _serve(args):
+    server = SolveServer(args.max_batch, args.max_delay_ms / 1000.0, args.max_queue)
+    srv = await server.start(args.host, args.port, args.unix)
+    print('solving on %s' % (args.unix or '%s:%d' % (args.host, args.port)), file=sys.stderr)
+    async with srv:
+        await srv.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local beam solve service with micro-batching.')
+    parser.add_argument('command', choices=('serve', 'test'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='listen on this Unix socket path instead of TCP')
+    parser.add_argument('--max-batch', type=int, default=1024)
+    parser.add_argument('--max-delay-ms', type=float, default=2.0)
+    parser.add_argument('--max-queue', type=int, default=10000)
+    parser.add_argument('--requests', type=int, default=20000, help='test: number of requests')
+    parser.add_argument('--concurrency', type=int, default=200, help='test: open connections')
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        try:
+            asyncio.run(_serve(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    return asyncio.run(_test(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,8 @@
 # Class used for calculating moment of inertia for rectangular section
 # By Yashar Zafari
 
+from SectionProperties import wideflangeProperties
+
 class WideflangeI(object):
     '''
     variables:
@@ -10,17 +12,20 @@ class WideflangeI(object):
     self.h              total height
     methods:
     def __init__ (self, flanget, webt, w, h)
-    def getIrect (self)
+    def getIwide (self)
+    def getProperties (self)        A, I, S, r and Z, dimensions may be arrays
     '''
 
+    __slots__ = ('ft', 'wt', 'w', 'h')
+
     def __init__(self, flanget = 0.0, webt = 0.0, w = 0.0, h = 0.0):
         self.ft = flanget
         self.wt = webt
         self.w = w
         self.h = h
-        self.lh = self.h - (2 * self.ft)
 
     def getIwide(self):
-        i = self.wt * (self.lh ** 3.0) / 12.0
-        i += (self.w / 12.0) * ((self.h ** 3) - (self.lh ** 3))
-        return i
\ No newline at end of file
+        return self.getProperties().I
+
+    def getProperties(self):
+        return wideflangeProperties(self.ft, self.wt, self.w, self.h)
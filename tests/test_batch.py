@@ -0,0 +1,50 @@
+# Batch runner: parsing, bad cases and the process pool
+
+import numpy as np
+import pytest
+
+from BatchRunner import caseArrays, parseCases, runBatch, RESULT_FIELDS
+from BeamSolver import peaks, PIN, FIX, DEFLECTION
+
+GOOD = {'id': 'good', 'L': '240', 'W': '0.1', 'leftBC': 'pin', 'rightBC': 'fix', 'E': '29000', 'I': '500'}
+
+
+def case(**fields):
+    row = dict(GOOD)
+    row.update(fields)
+    return row
+
+
+def test_section_names_ignore_case():
+    L, W, E, I, left, right = caseArrays([case(I='', section='W12X26'), case(I='', section=' w12x26 ')])
+    assert I[0] == I[1] > 0
+
+
+@pytest.mark.parametrize('row, message', [
+    (case(leftBC='3'), 'support codes'),
+    (case(rightBC='-1'), 'support codes'),
+    (case(leftBC='1.5'), 'invalid literal'),
+    (case(I='', section='W99X1'), 'unknown section'),
+    (case(E='', material='gold'), 'need E or a material'),
+    (case(W=''), 'could not convert'),
+    ({'L': 240, 'E': 29000, 'I': 500}, 'missing field'),
+    ('not json', 'not a case object'),
+])
+def test_bad_cases_are_reported(row, message):
+    errors = parseCases([GOOD, row, GOOD])[-1]
+    assert errors[0] == errors[2] == ''
+    assert message in errors[1]
+    with pytest.raises(ValueError):
+        caseArrays([GOOD, row])
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_bad_rows_do_not_stop_the_run(processes):
+    rows = [GOOD, case(id='bad', leftBC='7'), case(id='named', I='', section='w12x26')] * 3
+    out = list(runBatch(rows, chunksize=2, processes=processes))
+    assert [r['id'] for r in out] == [r['id'] for r in rows]
+    for row in out:
+        assert set(row) == set(RESULT_FIELDS)
+        assert (row['error'] != '') == (row['id'] == 'bad')
+    assert out[1]['maxDeflection'] is None and out[1]['pass'] is False
+    assert np.isclose(out[0]['maxDeflection'], peaks(240.0, 0.1, 29000.0, 500.0, PIN, FIX)[DEFLECTION])
@@ -0,0 +1,31 @@
+# Shape catalog: compiled cache shared by concurrent processes
+
+import multiprocessing
+
+import numpy as np
+
+from ShapeCatalog import ShapeCatalog, lightestForDeflection
+
+
+def _open(path):
+    catalog = ShapeCatalog(path)
+    return len(catalog), float(catalog['Ix'][lightestForDeflection(240.0, 0.1, 1, 1, catalog=catalog)])
+
+
+def test_concurrent_first_use(tmp_path):
+    # every worker finds the cache missing and compiles it at the same time
+    ctx = multiprocessing.get_context('fork')
+    for run in range(5):
+        path = str(tmp_path / str(run))
+        with ctx.Pool(8) as pool:
+            results = pool.map(_open, [path] * 32)
+        assert len(set(results)) == 1
+
+
+def test_lightest_shape(tmp_path):
+    catalog = ShapeCatalog(str(tmp_path))
+    k = lightestForDeflection(240.0, 0.1, 1, 1, catalog=catalog)
+    need = 5 * 0.1 * 240.0**4 / (384 * 29000.0 * 240.0 / 360.0)
+    assert catalog['Ix'][k] >= need
+    stiff = catalog['Ix'][catalog['material'] == 'steel'] >= need
+    assert catalog['weight'][k] == np.min(catalog['weight'][catalog['material'] == 'steel'][stiff])
@@ -0,0 +1,44 @@
+# Every solver in the package follows the sign conventions in BeamSolver:
+# deflection up, rotation = d(deflection)/dx, sagging moment, shear = d(moment)/dx
+
+import numpy as np
+import pytest
+
+from BeamSolver import solveBeams, STABLE_CASES, OUTPUTS
+from BeamLoads import LoadSet, solveLoads
+from BeamFEM import ContinuousBeam
+from BeamNonPrismatic import solveNonPrismatic
+
+L, W, E, I = 240.0, 0.1, 29000.0, 500.0
+
+
+def _close(a, b):
+    for o in range(len(OUTPUTS)):
+        scale = np.abs(b[o]).max()
+        assert np.allclose(a[o], b[o], rtol=0, atol=1e-9 * scale), OUTPUTS[o]
+
+
+@pytest.mark.parametrize('case', sorted(STABLE_CASES))
+def test_solvers_agree(case):
+    left, right = case
+    fem = ContinuousBeam([L], [left, right], W, E, I, nel=8).solve()
+    x = fem.x
+    ref = solveBeams(L, W, E, I, left, right, xi=x / L)
+
+    _close(fem, ref)
+
+    loads = LoadSet()
+    loads.addUniformLoad(W, L)
+    xs = np.unique(x)
+    _close(solveLoads(L, E, I, left, right, loads, x=xs), solveBeams(L, W, E, I, left, right, xi=xs / L))
+
+    tapered = solveNonPrismatic(L, W, E, I, left, right, n=9)
+    _close(tapered, solveBeams(L, W, E, I, left, right, xi=tapered.x / L))
+
+
+@pytest.mark.parametrize('case', sorted(STABLE_CASES))
+def test_rotation_and_shear_are_derivatives(case):
+    res = solveBeams(L, W, E, I, case[0], case[1], n=2001)
+    h = res.x[1] - res.x[0]
+    assert np.allclose(np.gradient(res.deflection, h, edge_order=2), res.rotation, atol=1e-4 * np.abs(res.rotation).max())
+    assert np.allclose(np.gradient(res.moment, h, edge_order=2), res.shear, atol=1e-4 * np.abs(res.shear).max())
@@ -0,0 +1,33 @@
+# Figure export: file names of repeated case ids, bad cases in the input
+
+import io
+import json
+import os
+
+from BatchRunner import readCases
+from FigureExport import exportFigures, uniqueNames
+
+CASE = {'L': '240', 'W': '0.1', 'leftBC': 'pin', 'rightBC': 'pin', 'E': '29000', 'I': '500'}
+
+
+def test_unique_names():
+    ids = ['a', 'a', 'a b', 'a_b', '', 'A', 'a-2']
+    names = [name for case, name in uniqueNames([dict(CASE, id=i) for i in ids])]
+    assert names == ['a', 'a-2', 'a_b', 'a_b-2', 'case000004', 'A-3', 'a-2-2']
+
+
+def test_repeated_ids_do_not_overwrite(tmp_path):
+    cases = [dict(CASE, id='beam', L=str(L)) for L in (120, 180, 240)]
+    files = list(exportFigures(cases, str(tmp_path), 'svg', chunksize=2, processes=1))
+    assert len(set(files)) == 3
+    assert sorted(os.listdir(str(tmp_path))) == sorted(os.path.basename(f) for f in files)
+
+
+def test_bad_cases_are_skipped(tmp_path):
+    lines = [json.dumps(dict(CASE, id='a')), '{not json', json.dumps(dict(CASE, id='b', rightBC=7)),
+             json.dumps(dict(CASE, id='c'))]
+    cases = readCases(io.StringIO('\n'.join(lines) + '\n'), 'jsonl')
+    errors = []
+    files = list(exportFigures(cases, str(tmp_path), 'svg', chunksize=3, processes=1, errors=errors))
+    assert sorted(os.path.basename(f) for f in files) == ['a_deflection.svg', 'c_deflection.svg']
+    assert [k for k, error in errors] == [1, 2]
@@ -0,0 +1,62 @@
+# Finite element engine: mechanisms, mesh limits and agreement with closed forms
+
+import numpy as np
+import pytest
+
+from BeamFEM import ContinuousBeam, MAX_NEL
+from BeamSolver import FREE, PIN, FIX
+
+
+@pytest.mark.parametrize('spans, supports', [
+    ([240.0], [PIN, FREE]),
+    ([240.0, 240.0], [PIN, FREE, FREE]),
+    ([240.0, 240.0], [FREE, PIN, FREE]),
+    ([240.0], [FREE, FREE]),
+])
+def test_mechanisms_raise(spans, supports):
+    beam = ContinuousBeam(spans, supports, 0.1, 29000.0, 500.0)
+    with pytest.raises(ValueError):
+        beam.solve()
+    with pytest.raises(ValueError):
+        beam.modes()
+
+
+@pytest.mark.parametrize('nel', [0, MAX_NEL + 1])
+def test_mesh_limits(nel):
+    with pytest.raises(ValueError):
+        ContinuousBeam([240.0], [PIN, PIN], nel=nel)
+
+
+def test_two_span_continuous_beam():
+    # equal spans, interior reaction 5/4 wL and negative moment wL^2/8 over it
+    L, W = 240.0, 0.1
+    beam = ContinuousBeam([L, L], [PIN, PIN, PIN], W, 29000.0, 500.0, nel=MAX_NEL)
+    res = beam.solve()
+    assert np.allclose(beam.reactions[:, 0], [3 * W * L / 8, 5 * W * L / 4, 3 * W * L / 8])
+    assert np.isclose(res.moment[np.argmin(np.abs(res.x - L))], -W * L * L / 8)
+
+
+def test_cantilever_modes():
+    # first bending frequency 1.8751^2 / (2 pi L^2) sqrt(EI / m)
+    L, W, E, I = 240.0, 0.1, 29000.0, 500.0
+    freqs = ContinuousBeam([L], [FIX, FREE], W, E, I, nel=40).modes(2)[0]
+    assert np.isclose(freqs[0], 1.875104**2 / (2 * np.pi * L * L) * np.sqrt(E * I * 386.09 / W), rtol=1e-6)
+
+
+@pytest.mark.parametrize('nel', [40, 100, MAX_NEL])
+def test_modes_fine_mesh(nel):
+    # pin-pin frequencies n^2 pi / (2 L^2) sqrt(EI / m) stay exact up to MAX_NEL
+    L, W, E, I = 240.0, 0.1, 29000.0, 500.0
+    freqs = ContinuousBeam([L], [PIN, PIN], W, E, I, nel).modes(3)[0]
+    exact = np.arange(1, 4)**2 * np.pi / (2 * L * L) * np.sqrt(E * I * 386.09 / W)
+    assert np.allclose(freqs, exact, rtol=1e-5)
+
+
+def test_sparse_modes_match_dense(monkeypatch):
+    import BeamFEM
+    beam = ContinuousBeam([240.0, 300.0, 180.0], [FIX, PIN, PIN, FREE], 0.1, 29000.0, 500.0, 60)
+    sparse = beam.modes(4)
+    monkeypatch.setattr(BeamFEM, 'DENSE_MODES', 10**6)
+    dense = beam.modes(4)
+    assert np.allclose(sparse[0], dense[0], rtol=1e-8)
+    assert np.allclose(sparse[2], dense[2], atol=1e-6)
@@ -0,0 +1,63 @@
+# Singularity function load sets
+
+import numpy as np
+import pytest
+
+from BeamCombos import LoadCombinations
+from BeamLoads import LoadSet, solveLoads, unitLoadBasis
+from BeamMoving import movingLoadEnvelope
+from BeamSolver import solveBeams, FREE, PIN, FIX
+
+
+def test_uniform_load_matches_closed_form():
+    loads = LoadSet()
+    loads.addUniformLoad(0.1, 240.0)
+    res = solveLoads(240.0, 29000.0, 500.0, PIN, FIX, loads)
+    ref = solveBeams(240.0, 0.1, 29000.0, 500.0, PIN, FIX, xi=res.x / 240.0)
+    assert np.allclose(res.deflection, ref.deflection)
+    assert np.allclose(res.moment, ref.moment)
+
+
+def test_zero_length_load_is_skipped():
+    loads = LoadSet()
+    loads.addPointLoad(10.0, 120.0)
+    loads.addDistributedLoad(0.5, [60.0, 100.0], [60.0, 180.0], 1.0)
+    ref = LoadSet()
+    ref.addPointLoad(10.0, 120.0)
+    ref.addDistributedLoad(0.5, 100.0, 180.0, 1.0)
+    res = solveLoads(240.0, 29000.0, 500.0, PIN, PIN, loads)
+    assert np.isfinite(res.deflection).all()
+    assert np.allclose(res.moment, solveLoads(240.0, 29000.0, 500.0, PIN, PIN, ref).moment)
+
+
+def test_reversed_load_raises():
+    with pytest.raises(ValueError):
+        LoadSet().addDistributedLoad(0.5, 180.0, 100.0)
+
+
+@pytest.mark.parametrize('bad', [-1, 3, 5, 1.5])
+def test_bad_support_codes_raise(bad):
+    loads = LoadSet()
+    loads.addUniformLoad(0.1, 240.0)
+    with pytest.raises(ValueError):
+        solveLoads(240.0, 29000.0, 500.0, bad, PIN, loads)
+    with pytest.raises(ValueError):
+        unitLoadBasis(240.0, 29000.0, 500.0, PIN, bad, [0.0, 120.0], [60.0])
+    with pytest.raises(ValueError):
+        movingLoadEnvelope(240.0, 29000.0, 500.0, bad, PIN, (10.0,))
+
+
+def test_unstable_supports_give_zero():
+    loads = LoadSet()
+    loads.addPointLoad(10.0, 120.0)
+    assert not np.any(solveLoads(240.0, 29000.0, 500.0, FREE, PIN, loads).moment)
+    assert not np.any(unitLoadBasis(240.0, 29000.0, 500.0, PIN, FREE, [0.0, 120.0], [60.0]))
+
+
+def test_combinations_need_cases():
+    combos = LoadCombinations()
+    with pytest.raises(ValueError):
+        combos.solve(240.0, 29000.0, 500.0, PIN, PIN)
+    combos.addCase('D', 0.1)
+    res = combos.solve(240.0, 29000.0, 500.0, PIN, PIN, n=51)
+    assert np.isclose(res.hi[3].max(), 1.4 * 0.1 * 240.0**2 / 8)
@@ -0,0 +1,35 @@
+# Non-prismatic spans: support code checks and a stiffened beam
+
+import numpy as np
+import pytest
+
+from BeamNonPrismatic import solveNonPrismatic, Profile, taper
+from BeamSolver import solveBeams, PIN, FIX, FREE
+
+
+@pytest.mark.parametrize('bad', [-1, 3, 1.5, 'fix'])
+def test_bad_support_codes_raise(bad):
+    with pytest.raises(ValueError):
+        solveNonPrismatic(240.0, 0.1, 29000.0, 500.0, bad, PIN)
+    with pytest.raises(ValueError):
+        solveNonPrismatic([240.0, 240.0], 0.1, 29000.0, 500.0, PIN, [FIX, bad])
+
+
+def test_unstable_is_zero():
+    res = solveNonPrismatic(240.0, 0.1, 29000.0, 500.0, FREE, PIN)
+    assert not np.any(res.deflection) and not np.any(res.moment)
+
+
+def test_stiffer_middle_deflects_less():
+    # a symmetric cover plate keeps the pinned beam symmetric and stiffer
+    plated = Profile([0.0, 60.0, 180.0], [500.0, 900.0, 500.0])
+    res = solveNonPrismatic(240.0, 0.1, 29000.0, plated, PIN, PIN, n=241)
+    ref = solveBeams(240.0, 0.1, 29000.0, 500.0, PIN, PIN, xi=res.x / 240.0)
+    assert np.allclose(res.moment, ref.moment)
+    assert np.allclose(np.interp(240.0 - res.x, res.x, res.deflection), res.deflection, atol=1e-12)
+    assert ref.deflection.min() < res.deflection.min() < 0
+
+
+def test_taper_ends():
+    f = taper(500.0, 2000.0, 240.0)
+    assert np.allclose(f(np.array([0.0, 240.0])), [500.0, 2000.0])
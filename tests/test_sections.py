@@ -0,0 +1,24 @@
+# Section engines: the closed forms and the polygon engine agree on shared shapes
+
+import numpy as np
+
+from SectionProperties import namedSection
+from SectionGeometry import sectionProperties, rectangle, wideflange
+from BeamSweep import sweepParameters
+
+
+def test_engines_agree():
+    pairs = [(namedSection('rectangle', {'w': 4.0, 'h': 10.0}), rectangle(4.0, 10.0)),
+             (namedSection('wideflange', {'flanget': 0.44, 'webt': 0.23, 'w': 6.49, 'h': 12.2}),
+              wideflange(0.44, 0.23, 6.49, 12.2))]
+    for closed, polygon in pairs:
+        p = sectionProperties(polygon).strongAxis()
+        for name in ('A', 'I', 'S', 'r', 'Z'):
+            assert np.isclose(getattr(closed, name), getattr(p, name), rtol=1e-12)
+
+
+def test_sweep_uses_the_same_section_values():
+    dims = {'flanget': 0.44, 'webt': 0.23, 'w': 6.49, 'h': 12.2}
+    base = {'L': 240.0, 'W': 0.1, 'E': 29000.0, 'I': 1.0}
+    I = sweepParameters(base, [('h', [12.2])], ('wideflange', dims))['I']
+    assert I[0] == namedSection('wideflange', dims).I
@@ -0,0 +1,71 @@
+# Solve service: bad requests fail alone and never stop the batcher
+
+import asyncio
+
+import numpy as np
+
+from BeamSolver import peaks, MOMENT
+from SolveServer import SolveServer, SolveClient
+
+GOOD = {'L': 240.0, 'W': 0.1, 'E': 29000.0, 'I': 500.0, 'leftBC': 1, 'rightBC': 2}
+
+
+def serve(check, **kwargs):
+    # run check(server, port) against a server on a free local port; a dead
+    # batcher would leave requests waiting forever, so time out instead
+    async def run():
+        server = SolveServer(**kwargs)
+        srv = await server.start('127.0.0.1', 0)
+        try:
+            await asyncio.wait_for(check(server, srv.sockets[0].getsockname()[1]), 10)
+        finally:
+            await server.close()
+    asyncio.run(run())
+
+
+async def solveGood(port):
+    client = SolveClient('127.0.0.1', port)
+    await client.connect()
+    status, body = await client.solve(GOOD)
+    await client.close()
+    assert status == 200
+    assert np.isclose(body['maxMoment'], peaks(240.0, 0.1, 29000.0, 500.0, 1, 2)[MOMENT])
+
+
+def test_bad_case_then_good():
+    async def check(server, port):
+        client = SolveClient('127.0.0.1', port)
+        await client.connect()
+        for bad in (dict(GOOD, leftBC=3), dict(GOOD, rightBC=-1), dict(GOOD, leftBC=1.5), {'L': 'x'}, [1, 2]):
+            assert (await client.solve(bad))[0] == 400
+        await client.close()
+        await solveGood(port)
+    serve(check)
+
+
+def test_failed_batch_then_good():
+    async def check(server, port):
+        solveBatch = server.solveBatch
+
+        def fail(params, curves):
+            server.solveBatch = solveBatch
+            raise RuntimeError('boom')
+        server.solveBatch = fail
+        client = SolveClient('127.0.0.1', port)
+        await client.connect()
+        status, body = await client.solve(GOOD)
+        await client.close()
+        assert status == 500 and 'boom' in body['error']
+        await solveGood(port)
+    serve(check)
+
+
+def test_bad_content_length():
+    async def check(server, port):
+        for length in (b'-5', b'abc'):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'POST /solve HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n{}')
+            assert (await reader.readline()).split()[1] == b'400'
+            writer.close()
+        await solveGood(port)
+    serve(check)
@@ -0,0 +1,31 @@
+# Closed-form solver: support code checks and the textbook values it is built on
+
+import numpy as np
+import pytest
+
+from BeamSolver import solveBeam, peaks, reactions, evaluate, FREE, PIN, FIX
+from BeamSweep import sweepEnvelope
+
+
+def test_pinned_textbook_values():
+    L, W, E, I = 240.0, 0.1, 29000.0, 500.0
+    p = peaks(L, W, E, I, PIN, PIN)
+    assert np.isclose(p[0], 5 * W * L**4 / (384 * E * I))
+    assert np.isclose(p[3], W * L**2 / 8)
+    assert np.allclose(reactions(L, W, PIN, PIN), [W * L / 2, W * L / 2, 0.0, 0.0])
+
+
+@pytest.mark.parametrize('bad', [-1, 3, 1.5, 'pin'])
+def test_bad_support_codes_raise(bad):
+    with pytest.raises(ValueError):
+        peaks(240.0, 0.1, 29000.0, 500.0, bad, PIN)
+    with pytest.raises(ValueError):
+        evaluate(240.0, 0.1, 29000.0, 500.0, PIN, np.array([PIN, bad]), [0.5])
+    with pytest.raises(ValueError):
+        sweepEnvelope({'L': 240.0, 'W': 0.1, 'E': 29000.0, 'I': 500.0, 'leftBC': bad, 'rightBC': PIN},
+                      [('L', [120.0, 240.0])])
+
+
+def test_integral_float_codes_are_accepted():
+    assert np.allclose(peaks(240.0, 0.1, 29000.0, 500.0, 2.0, 0.0), peaks(240.0, 0.1, 29000.0, 500.0, FIX, FREE))
+    assert solveBeam(240.0, 0.1, 29000.0, 500.0, PIN, FIX).deflection.shape == (50,)